@@ -0,0 +1,36 @@
+"""
+Compare the JSON backends on realistic client list payloads.
+
+Usage:
+    python -m benchmarks.json_backend [count]
+"""
+
+import sys
+import timeit
+
+from zyxel_nebula_client.json_backend import ORJSON, STDLIB_JSON
+
+from .payloads import make_ap_clients, make_generic_clients
+
+
+def best_of(func, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main(count: int = 10_000):
+    backends = [backend for backend in (STDLIB_JSON, ORJSON) if backend is not None]
+
+    for name, payload in (("APClients", make_ap_clients(count)), ("GenericClients", make_generic_clients(count))):
+        body = STDLIB_JSON.dumps(payload)
+        print(f"{name} with {count} clients ({len(body) / 2**20:.1f} MiB)")
+        for backend in backends:
+            loads = best_of(lambda: backend.loads(body))
+            dumps = best_of(lambda: backend.dumps(payload))
+            print(f"  {backend.name:8} loads {loads * 1000:8.2f} ms   dumps {dumps * 1000:8.2f} ms")
+
+    if ORJSON is None:
+        print("orjson is not installed, install it to compare")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,40 @@
+"""
+Compare the memory held by decoded client lists using the regular and the compact models.
+
+Usage:
+    python -m benchmarks.memory [count]
+"""
+
+import sys
+import tracemalloc
+
+from zyxel_nebula_client import models
+from zyxel_nebula_client.compact import COMPACT_MODELS
+from zyxel_nebula_client.decoders import decode
+
+from .payloads import make_ap_clients
+
+
+def measure(data_class: type, data: dict) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = decode(data_class, data)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main(count: int = 100_000):
+    data = make_ap_clients(count)
+    regular = measure(models.APClients, data)
+    compact = measure(COMPACT_MODELS[models.APClients], data)
+
+    print(f"APClients with {count} clients")
+    print(f"  models:  {regular / 2**20:8.1f} MiB ({regular / count:6.0f} B/client)")
+    print(f"  compact: {compact / 2**20:8.1f} MiB ({compact / count:6.0f} B/client)")
+    print(f"  saving:  {1 - compact / regular:8.1%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
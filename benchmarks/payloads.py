@@ -0,0 +1,162 @@
+"""Synthetic API payloads for the benchmarks."""
+
+import json
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from zyxel_nebula_client.consts import ENDPOINTS
+
+
+def mac(i: int) -> str:
+    return f"00:11:22:{i >> 16 & 0xff:02x}:{i >> 8 & 0xff:02x}:{i & 0xff:02x}"
+
+
+def ipv4(i: int) -> str:
+    return f"10.{i >> 16 & 0xff}.{i >> 8 & 0xff}.{i & 0xff}"
+
+
+def make_ap_clients(count: int) -> dict:
+    """An `APClients` response with `count` fully populated clients."""
+    return {
+        "KeyFields": ["macAddress"],
+        "data": [
+            {
+                "macAddress": mac(i),
+                "ipv4Address": ipv4(i),
+                "lastSeen": 1730000000 + i,
+                "connectedTo": f"dev-{i % 50}",
+                "firstSeen": 1720000000 + i,
+                "description": None,
+                "osHostname": {"os": "Android", "hostname": f"host-{i}"},
+                "manufacturer": "Zyxel",
+                "ssid": {"name": "corp", "security": "WPA2_PSK"},
+                "wifiStation": {"status": "ONLINE", "vlan": 1, "signal": -60, "band": "band50", "channel": 36},
+                "user": None,
+                "upload": float(i),
+                "download": float(i * 2),
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def make_generic_clients(count: int) -> dict:
+    """A `GenericClients` response with `count` fully populated clients."""
+    return {
+        "KeyFields": ["macAddress"],
+        "data": [
+            {
+                "macAddress": mac(i),
+                "status": "ONLINE" if i % 3 else "OFFLINE",
+                "ipv4Address": ipv4(i),
+                "vlan": i % 4094 + 1,
+                "lastSeen": 1730000000 + i,
+                "connectedTo": f"dev-{i % 50}",
+                "firstSeen": 1720000000 + i,
+                "description": f"client {i}",
+                "osHostname": {"os": "Windows", "hostname": f"pc-{i}"},
+                "manufacturer": "Intel",
+            }
+            for i in range(count)
+        ],
+    }
+
+
+OPENAPI_PATH = Path(__file__).resolve().parent.parent / "openapi.json"
+
+# How the path parameters of `ENDPOINTS` are named in openapi.json
+_PATH_PARAMETERS = {"{site_id}": "{siteId}", "{device_id}": "{devId}",
+                    "{org_id}": "{orgId}", "{group_id}": "{groupId}"}
+
+
+class PayloadFactory:
+    """
+    Generates response bodies matching the schemas of openapi.json.
+
+    Values are derived from an index so payloads are deterministic and distinct per item: MAC and IPv4
+    addresses are unique, timestamps increase and enums cycle through their members. Every `null_every`
+    th value of a nullable field is `null`.
+
+    Args:
+        spec_path (Path): The OpenAPI document. Defaults to the repository's openapi.json.
+        nested_size (int): The length of arrays below the top-level one. Defaults to 2.
+        null_every (int): Emit `null` for every n-th nullable value, 0 to never. Defaults to 10.
+
+    Example:
+        factory = PayloadFactory()
+        body = factory.response("GET_AP_CLIENTS_V2", items=1000)
+    """
+
+    def __init__(self, spec_path: Path = OPENAPI_PATH, nested_size: int = 2, null_every: int = 10):
+        with open(spec_path, encoding="utf-8") as spec:
+            self.spec = json.load(spec)
+        self.schemas = self.spec["components"]["schemas"]
+        self.nested_size = nested_size
+        self.null_every = null_every
+
+    def operation(self, endpoint: str) -> Tuple[str, dict]:
+        """Return the HTTP method and OpenAPI operation of an `ENDPOINTS` key."""
+        path = ENDPOINTS[endpoint]
+        for name, replacement in _PATH_PARAMETERS.items():
+            path = path.replace(name, replacement)
+        operations = self.spec["paths"][path]
+        method = "get" if "get" in operations else next(iter(operations))
+        return method.upper(), operations[method]
+
+    def response_schema(self, endpoint: str) -> dict:
+        _, operation = self.operation(endpoint)
+        return operation["responses"]["200"]["content"]["application/json"]["schema"]
+
+    def response(self, endpoint: str, items: int = 10, index: int = 0) -> Any:
+        """
+        Generate the successful response body of an `ENDPOINTS` key.
+
+        The first array found in the response (the body itself or its `data` member) has `items` entries.
+        """
+        return self.generate(self.response_schema(endpoint), index, items)
+
+    def _is_null(self, index: int, name: str) -> bool:
+        # offset by the field name so different fields of one item are null for different items
+        return bool(self.null_every) and (index + len(name)) % self.null_every == 0
+
+    def generate(self, schema: dict, index: int = 0, items: Optional[int] = None, name: str = "", nullable: bool = True) -> Any:
+        """
+        Generate a value for `schema`. `items` sizes the first array encountered.
+
+        Array items are never `null`, as the client models do not accept them in most lists.
+        """
+        if "$ref" in schema:
+            schema = self.schemas[schema["$ref"].rsplit("/", 1)[-1]]
+
+        variants = schema.get("anyOf") or schema.get("oneOf")
+        if variants:
+            concrete = [variant for variant in variants if variant.get("type") != "null"]
+            if len(concrete) < len(variants) and nullable and items is None and self._is_null(index, name):
+                return None
+            return self.generate(concrete[index % len(concrete)], index, items, name)
+
+        if "enum" in schema:
+            return schema["enum"][index % len(schema["enum"])]
+
+        kind = schema.get("type")
+        if kind == "object" or "properties" in schema:
+            return {key: self.generate(value, index, items if key == "data" else None, key)
+                    for key, value in schema.get("properties", {}).items()}
+        if kind == "array":
+            count = self.nested_size if items is None else items
+            return [self.generate(schema.get("items", {}), index * count + i, None, name, False) for i in range(count)]
+        if kind == "integer":
+            if "time" in name.lower() or name in ("lastSeen", "firstSeen", "lastHeartbeat"):
+                return 1730000000 + index
+            return index % 4096
+        if kind == "number":
+            return index * 1.5
+        if kind == "boolean":
+            return index % 2 == 0
+        if kind == "string":
+            if schema.get("format") == "ipv4" or "ipv4" in name.lower():
+                return ipv4(index)
+            if name.lower() in ("mac", "macaddress"):
+                return mac(index)
+            return f"{name or 'value'}-{index}"
+        return None
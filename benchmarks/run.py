@@ -0,0 +1,191 @@
+"""
+Benchmark suite for response decoding and the request path of `ZyxelNebulaClient`.
+
+Payloads are generated from the schemas in openapi.json. The suite measures, per client list endpoint
+and scale, the JSON parse time, the decode time (regular and compact models and columns) and the peak memory of
+parsing plus decoding. It then measures end-to-end requests per second of an organization crawl
+through the client against the in-process `NebulaSimulator` without latency, so results only reflect
+client overhead.
+
+Results can be saved with `--output` and compared with a previous run with `--baseline`; the exit code
+is 1 when any timing regressed by more than `--tolerance`.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --clients 100,1000,10000,100000 --sites 1,10,100,1000 --output before.json
+    python -m benchmarks.run --baseline before.json --tolerance 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import timeit
+import tracemalloc
+from typing import Dict, List
+
+import httpx
+
+from zyxel_nebula_client import ZyxelNebulaClient, APClients, GenericClients, SWClients, GWClients, \
+    APClientV2, GenericClient, SWClient, GWClient
+from zyxel_nebula_client.columnar import decode_columns
+from zyxel_nebula_client.compact import COMPACT_MODELS
+from zyxel_nebula_client.decoders import decode
+from zyxel_nebula_client.json_backend import STDLIB_JSON, default_json_backend
+
+from .payloads import PayloadFactory
+from .simulator import NebulaSimulator, SIMULATOR_URL
+
+CLIENT_LISTS = {
+    "GET_AP_CLIENTS_V2": APClients,
+    "GET_SITE_CLIENTS_V2": GenericClients,
+    "GET_SW_CLIENTS_V2": SWClients,
+    "GET_GW_CLIENTS_V2": GWClients,
+}
+
+CLIENT_ITEMS = {
+    "GET_AP_CLIENTS_V2": APClientV2,
+    "GET_SITE_CLIENTS_V2": GenericClient,
+    "GET_SW_CLIENTS_V2": SWClient,
+    "GET_GW_CLIENTS_V2": GWClient,
+}
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        # the peak includes the result, which need not be kept alive until it is read
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_decode(factory: PayloadFactory, counts: List[int], repeat: int) -> List[Dict]:
+    backend = default_json_backend()
+    rows = []
+    for count in counts:
+        for endpoint, model in CLIENT_LISTS.items():
+            body = STDLIB_JSON.dumps(factory.response(endpoint, items=count))
+            data = backend.loads(body)
+            compact = COMPACT_MODELS[model]
+            item = CLIENT_ITEMS[endpoint]
+
+            rows.append({
+                "name": f"decode/{endpoint}/{count}",
+                "bytes": len(body),
+                "parse_s": best_of(lambda: backend.loads(body), repeat),
+                "decode_s": best_of(lambda: decode(model, data), repeat),
+                "decode_compact_s": best_of(lambda: decode(compact, data), repeat),
+                "decode_columns_s": best_of(lambda: decode_columns(item, data["data"]), repeat),
+                "peak_bytes": peak_memory(lambda: decode(model, backend.loads(body))),
+                "peak_compact_bytes": peak_memory(lambda: decode(compact, backend.loads(body))),
+                "peak_columns_bytes": peak_memory(lambda: decode_columns(item, backend.loads(body)["data"])),
+            })
+    return rows
+
+
+async def crawl(client: ZyxelNebulaClient, concurrency: int) -> int:
+    count = 0
+    async for _ in client.crawl_organization("org", concurrency=concurrency):
+        count += 1
+    return count
+
+
+def bench_requests(factory: PayloadFactory, site_counts: List[int], clients: int, concurrency: int, repeat: int) -> List[Dict]:
+    rows = []
+    for sites in site_counts:
+        timings = []
+        for _ in range(repeat):
+            simulator = NebulaSimulator(
+                sizes={"GET_SITES": sites, "GET_SITE_CLIENTS_V2": clients}, factory=factory)
+            client = ZyxelNebulaClient(api_key="benchmark", base_url=SIMULATOR_URL,
+                                       client=httpx.AsyncClient(transport=simulator))
+            start = time.perf_counter()
+            asyncio.run(crawl(client, concurrency))
+            timings.append(time.perf_counter() - start)
+
+        elapsed = min(timings)
+        rows.append({
+            "name": f"crawl/{sites}-sites/{clients}-clients",
+            "requests": sites + 1,
+            "elapsed_s": elapsed,
+            "requests_per_second": (sites + 1) / elapsed,
+        })
+    return rows
+
+
+def compare(rows: List[Dict], baseline: List[Dict], tolerance: float) -> List[str]:
+    """Return a message for every timing that is slower than the baseline by more than `tolerance`."""
+    previous = {row["name"]: row for row in baseline}
+    regressions = []
+    for row in rows:
+        before = previous.get(row["name"], {})
+        for metric, value in row.items():
+            if metric.endswith("_s") and before.get(metric) and value > before[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{row['name']} {metric}: {before[metric] * 1000:.2f} ms -> {value * 1000:.2f} ms")
+    return regressions
+
+
+def print_rows(rows: List[Dict]):
+    for row in rows:
+        values = []
+        for metric, value in row.items():
+            if metric == "name":
+                continue
+            if metric.endswith("_s"):
+                values.append(f"{metric[:-2]}={value * 1000:.2f}ms")
+            elif metric.endswith("bytes"):
+                values.append(f"{metric}={value / 2**20:.2f}MiB")
+            elif isinstance(value, float):
+                values.append(f"{metric}={value:.0f}")
+            else:
+                values.append(f"{metric}={value}")
+        print(f"{row['name']:45} {' '.join(values)}")
+
+
+def integers(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=integers, default=[100, 1000, 10000],
+                        help="comma separated numbers of clients per response")
+    parser.add_argument("--sites", type=integers, default=[1, 10, 100],
+                        help="comma separated numbers of sites to crawl")
+    parser.add_argument("--clients-per-site", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with results written by --output")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown against the baseline, 0.2 = 20%%")
+    args = parser.parse_args(argv)
+
+    factory = PayloadFactory()
+    rows = bench_decode(factory, args.clients, args.repeat)
+    rows += bench_requests(factory, args.sites, args.clients_per_site, args.concurrency, args.repeat)
+    print_rows(rows)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(rows, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline:
+            regressions = compare(rows, json.load(baseline), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
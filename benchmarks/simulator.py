@@ -0,0 +1,199 @@
+"""
+An in-process simulator of the Zyxel Nebula API for load testing the client offline.
+
+`NebulaSimulator` is an `httpx` transport answering every path in `ENDPOINTS` with payloads generated
+from openapi.json. It can add latency, throttle requests above a rate with `429 Too Many Requests`,
+inject `5xx` errors and keeps per-endpoint statistics.
+
+Usage:
+    python -m benchmarks.simulator --sites 400 --latency 0.05 --rate 100 --error-rate 0.02 --concurrency 20
+
+Example:
+    simulator = NebulaSimulator(latency=0.05, error_rate=0.01)
+    client = ZyxelNebulaClient(api_key="key", base_url=SIMULATOR_URL,
+                               client=httpx.AsyncClient(transport=simulator))
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import re
+import time
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, RetryPolicy, ResponseCache, AdaptiveLimiter
+from zyxel_nebula_client.consts import ENDPOINTS
+from zyxel_nebula_client.json_backend import STDLIB_JSON
+
+from .payloads import PayloadFactory
+
+SIMULATOR_URL = "http://nebula.simulator"
+
+# Number of items in the generated responses unless configured otherwise
+DEFAULT_SIZES = {
+    "GET_SITES": 10,
+    "GET_DEVICES_FROM_ORGANIZATION": 10,
+    "GET_SITE_CLIENTS": 100,
+    "GET_AP_CLIENTS": 100,
+    "GET_SITE_CLIENTS_V2": 100,
+    "GET_AP_CLIENTS_V2": 100,
+    "GET_SW_CLIENTS_V2": 100,
+    "GET_GW_CLIENTS_V2": 100,
+}
+
+
+def _compile_routes() -> List[Tuple[re.Pattern, str]]:
+    routes = []
+    for endpoint, template in ENDPOINTS.items():
+        pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template)
+        literal = len(re.sub(r"\{\w+\}", "", template))
+        routes.append((literal, re.compile(f"^{pattern}$"), endpoint))
+    # literal paths win over parameters, e.g. organizations/{org_id} over {site_id}/clients
+    return [(pattern, endpoint) for _, pattern, endpoint in sorted(routes, key=lambda route: -route[0])]
+
+
+class NebulaSimulator(httpx.AsyncBaseTransport):
+    """
+    Simulates the Zyxel Nebula API as an `httpx` transport.
+
+    Args:
+        sizes (Dict[str, int]): Number of items per `ENDPOINTS` key response. Defaults to `DEFAULT_SIZES`.
+        latency (float): Seconds every response is delayed. Defaults to 0.
+        jitter (float): Up to this many random seconds are added to the latency. Defaults to 0.
+        rate (Optional[float]): Requests per second served before answering `429` with `Retry-After`.
+        burst (Optional[int]): Requests that may exceed `rate` at once. Defaults to `rate`, rounded up.
+        error_rate (float): Share of requests failing with a random `5xx` status. Defaults to 0.
+        api_key (Optional[str]): When set, requests with another `X-ZyxelNebula-API-Key` get `401`.
+        seed (int): Seed of the random number generator driving jitter and errors.
+    """
+
+    def __init__(self, sizes: Optional[Dict[str, int]] = None, latency: float = 0.0, jitter: float = 0.0,
+                 rate: Optional[float] = None, burst: Optional[int] = None, error_rate: float = 0.0,
+                 api_key: Optional[str] = None, seed: int = 0, factory: Optional[PayloadFactory] = None):
+        self.sizes = {**DEFAULT_SIZES, **(sizes or {})}
+        self.latency = latency
+        self.jitter = jitter
+        self.rate = rate
+        self.burst = burst or (math.ceil(rate) if rate else 0)
+        self.error_rate = error_rate
+        self.api_key = api_key
+        self.factory = factory or PayloadFactory()
+        self.random = random.Random(seed)
+        self.routes = _compile_routes()
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self._bodies: Dict[str, bytes] = {}
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def route(self, path: str) -> Tuple[Optional[str], Dict[str, str]]:
+        """Return the `ENDPOINTS` key and path parameters of a request path."""
+        for pattern, endpoint in self.routes:
+            match = pattern.match(path)
+            if match:
+                return endpoint, match.groupdict()
+        return None, {}
+
+    def body(self, endpoint: str, path: str, parameters: Dict[str, str]) -> bytes:
+        """Return the generated body for a path, keeping it stable across requests."""
+        body = self._bodies.get(path)
+        if body is None:
+            items = self.sizes.get(endpoint, 10)
+            # distinct sites and devices get distinct clients, MAC addresses and so on
+            index = zlib.crc32("/".join(parameters.values()).encode()) % 4096 * items
+            body = self._bodies[path] = STDLIB_JSON.dumps(
+                self.factory.response(endpoint, items=items, index=index))
+        return body
+
+    def _throttled(self) -> Optional[float]:
+        if not self.rate:
+            return None
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        endpoint, parameters = self.route(request.url.path)
+        self.requests[endpoint] += 1
+
+        delay = self.latency + self.random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        response = self._respond(request, endpoint, parameters)
+        self.statuses[response.status_code] += 1
+        return response
+
+    def _respond(self, request: httpx.Request, endpoint: Optional[str], parameters: Dict[str, str]) -> httpx.Response:
+        if self.api_key is not None and request.headers.get("X-ZyxelNebula-API-Key") != self.api_key:
+            return httpx.Response(401, json={"detail": "Unauthorized"})
+        if endpoint is None:
+            return httpx.Response(404, json={"detail": "Not Found"})
+
+        retry_after = self._throttled()
+        if retry_after is not None:
+            return httpx.Response(429, headers={"Retry-After": f"{retry_after:.3f}"},
+                                  json={"detail": "Too Many Requests"})
+        if self.error_rate and self.random.random() < self.error_rate:
+            return httpx.Response(self.random.choice([500, 502, 503, 504]), json={"detail": "Server Error"})
+
+        return httpx.Response(200, content=self.body(endpoint, request.url.path, parameters),
+                              headers={"Content-Type": "application/json"})
+
+
+async def load_test(args: argparse.Namespace):
+    simulator = NebulaSimulator(
+        sizes={"GET_SITES": args.sites, "GET_SITE_CLIENTS_V2": args.clients},
+        latency=args.latency, jitter=args.jitter, rate=args.rate, error_rate=args.error_rate)
+    client = ZyxelNebulaClient(
+        api_key="simulator", base_url=SIMULATOR_URL,
+        client=httpx.AsyncClient(transport=simulator),
+        retry_policy=RetryPolicy(max_attempts=args.attempts, backoff=0.1),
+        cache=ResponseCache(),
+        adaptive_concurrency=AdaptiveLimiter(initial=args.concurrency) if args.adaptive else None)
+
+    for run in range(1, args.runs + 1):
+        start = time.perf_counter()
+        succeeded = failed = 0
+        concurrency = None if args.adaptive else args.concurrency
+        async for result in client.crawl_organization("org", concurrency=concurrency, return_exceptions=True):
+            if isinstance(result.error, ZyxelNebulaError):
+                failed += 1
+            else:
+                succeeded += 1
+        elapsed = time.perf_counter() - start
+        print(f"run {run}: {succeeded} sites ok, {failed} failed in {elapsed:.2f}s")
+
+    print(f"requests: {dict(simulator.requests)}")
+    print(f"statuses: {dict(simulator.statuses)}")
+    print(f"cache:    {client.cache.stats()}")
+    if client.adaptive_concurrency is not None:
+        print(f"adaptive concurrency: {client.adaptive_concurrency.limit}")
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Crawl a simulated organization with retries and caching.")
+    parser.add_argument("--sites", type=int, default=100)
+    parser.add_argument("--clients", type=int, default=100, help="clients per site")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--rate", type=float, default=None, help="server-side requests per second")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=20, help="fixed or, with --adaptive, initial concurrency")
+    parser.add_argument("--adaptive", action="store_true", help="adapt the concurrency with AIMD")
+    parser.add_argument("--attempts", type=int, default=3, help="retry attempts per request")
+    parser.add_argument("--runs", type=int, default=2, help="crawls to run, later runs hit the cache")
+    asyncio.run(load_test(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient
+
+
+ONLINE_URL = BASE_URL + ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(site_id="site") + "?type=SW"
+
+
+def cable_test_url(device_id):
+    return BASE_URL + ENDPOINTS["CABLE_TEST"].format(site_id="site", device_id=device_id)
+
+
+class Switches:
+    """Answers cable tests after a short delay and records how many run per switch."""
+
+    def __init__(self):
+        self.running = {}
+        self.peak = {}
+        self.total_peak = 0
+        self.requests = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        device_id = request.url.path.split("/")[-2]
+        ports = json.loads(request.content)["ports"]
+        self.requests.append((device_id, ports))
+        self.running[device_id] = self.running.get(device_id, 0) + 1
+        self.peak[device_id] = max(self.peak.get(device_id, 0), self.running[device_id])
+        self.total_peak = max(self.total_peak, sum(self.running.values()))
+        await asyncio.sleep(0.01)
+        self.running[device_id] -= 1
+        return httpx.Response(200, json={"ports": [{"port": port, "results": [
+            {"channel": "A", "pairStatus": "OK", "pairLength": "10", "pairDistanceToFault": "0"}]} for port in ports]})
+
+
+@pytest.mark.asyncio
+async def test_cable_test_site_tests_online_switches(httpx_mock: HTTPXMock):
+    """Online switches are tested concurrently, the tests of one switch one after another, the others are skipped."""
+    httpx_mock.add_response(url=ONLINE_URL, method="GET", json=[
+        {"devId": "sw1", "currentStatus": "ONLINE"},
+        {"devId": "sw2", "currentStatus": "ONLINE"},
+        {"devId": "sw3", "currentStatus": "OFFLINE"}])
+    switches = Switches()
+    httpx_mock.add_callback(switches, url=cable_test_url("sw1"), method="POST", is_reusable=True)
+    httpx_mock.add_callback(switches, url=cable_test_url("sw2"), method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    items = [item async for item in client.cable_test_site("site", ports=[1, 2, 3, 4], ports_per_test=2)]
+    skipped = [item for item in items if item.skipped]
+    items = [item for item in items if not item.skipped]
+
+    assert [(item.devId, item.ports, item.result, item.error) for item in skipped] == [("sw3", [1, 2, 3, 4], None, None)]
+    assert sorted((item.devId, item.result.port) for item in items) == \
+        [("sw1", 1), ("sw1", 2), ("sw1", 3), ("sw1", 4), ("sw2", 1), ("sw2", 2), ("sw2", 3), ("sw2", 4)]
+    assert sorted(switches.requests) == [("sw1", [1, 2]), ("sw1", [3, 4]), ("sw2", [1, 2]), ("sw2", [3, 4])]
+    assert switches.peak == {"sw1": 1, "sw2": 1}
+    assert switches.total_peak == 2
+    assert all(item.elapsed > 0 and item.started > 0 for item in items)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batches_serialize_per_switch(httpx_mock: HTTPXMock):
+    """Two batches on the same switch never test it at the same time."""
+    switches = Switches()
+    httpx_mock.add_callback(switches, url=cable_test_url("sw1"), method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    async def batch(ports):
+        return [item async for item in client.cable_test_site("site", ports, device_ids=["sw1"])]
+
+    first, second = await asyncio.gather(batch([1]), batch([2]))
+
+    assert len(first) == len(second) == 1
+    assert switches.peak == {"sw1": 1}
+    assert client._device_locks == {}
+
+
+@pytest.mark.asyncio
+async def test_cable_test_site_ports_per_device_and_errors(httpx_mock: HTTPXMock):
+    """Ports can be given per switch and failed tests can be yielded."""
+    switches = Switches()
+    httpx_mock.add_callback(switches, url=cable_test_url("sw1"), method="POST", is_reusable=True)
+    httpx_mock.add_response(url=cable_test_url("sw2"), method="POST", status_code=400)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    items = [item async for item in client.cable_test_site(
+        "site", {"sw1": [5], "sw2": [6]}, device_ids=["sw1", "sw2", "sw3"], return_exceptions=True)]
+
+    assert [(item.devId, item.result.port) for item in items if item.result] == [("sw1", 5)]
+    assert [(item.devId, item.ports) for item in items if item.error] == [("sw2", [6])]
+
+    with pytest.raises(ValueError):
+        async for _ in client.cable_test_site("site", [1], device_ids=["sw1"], ports_per_test=0):
+            pass
@@ -0,0 +1,89 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ResponseCache
+
+
+SITES = [{"name": "site", "siteId": "site_id", "timeZone": "UTC", "deviceCount": 1}]
+
+
+@pytest.mark.asyncio
+async def test_cached_endpoint_is_requested_once(httpx_mock: HTTPXMock):
+    """Repeated calls to a cached endpoint are served from the cache with fresh objects."""
+    cache = ResponseCache()
+    client = ZyxelNebulaClient(api_key="dummy_api_key", cache=cache)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org"), method="GET", json=SITES)
+
+    first = await client.get_sites("org")
+    second = await client.get_sites("org")
+
+    assert first == second
+    assert first[0] is not second[0]
+    assert len(httpx_mock.get_requests()) == 1
+    assert cache.stats() == {"GET_SITES": {"hits": 1, "misses": 1}}
+
+
+@pytest.mark.asyncio
+async def test_cache_keys_include_parameters(httpx_mock: HTTPXMock):
+    """Different URLs are cached separately."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", cache=ResponseCache())
+
+    for org_id in ["org_1", "org_2"]:
+        httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id=org_id), method="GET", json=SITES)
+
+    await client.get_sites("org_1")
+    await client.get_sites("org_2")
+    await client.get_sites("org_1")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncached_endpoint(httpx_mock: HTTPXMock):
+    """Endpoints without a TTL are always requested."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", cache=ResponseCache())
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="site"),
+                            method="GET", json={}, is_reusable=True)
+
+    await client.get_site_vpn_status("site")
+    await client.get_site_vpn_status("site")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidate(httpx_mock: HTTPXMock):
+    """Invalidated entries are requested again."""
+    cache = ResponseCache()
+    client = ZyxelNebulaClient(api_key="dummy_api_key", cache=cache)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org"),
+                            method="GET", json=SITES, is_reusable=True)
+
+    await client.get_sites("org")
+    cache.invalidate("GET_SITES")
+    await client.get_sites("org")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_cache_expiry_and_lru(monkeypatch):
+    """Entries expire after their TTL and the least recently used entry is evicted."""
+    now = [0.0]
+    monkeypatch.setattr("zyxel_nebula_client.cache.time.monotonic", lambda: now[0])
+    cache = ResponseCache(ttls={"GET_SITES": 10}, maxsize=2)
+
+    keys = [cache.key("GET_SITES", f"url_{i}") for i in range(3)]
+    cache.set(keys[0], 0)
+    cache.set(keys[1], 1)
+    assert cache.get(keys[0]) == (True, 0)
+
+    cache.set(keys[2], 2)
+    assert cache.get(keys[1]) == (False, None)
+    assert cache.get(keys[0]) == (True, 0)
+
+    now[0] = 11
+    assert cache.get(keys[2]) == (False, None)
+    assert cache.key("GET_SITE_VPN_STATUS", "url") is None
@@ -1,6 +1,7 @@
 from enum import Enum
 import pytest
 from dacite import from_dict, Config
+import httpx
 from httpx import AsyncClient
 from pytest_httpx import HTTPXMock
 from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
@@ -202,6 +203,46 @@ async def test_get_devices_from_organization(httpx_mock: HTTPXMock):
     assert result[0] == expected
 
 
+def sites_devices_mock_data():
+    return [
+        {"siteId": "site1", "devices": [
+            {"devId": "dev1", "name": "ap", "mac": "mac1", "sn": "sn1", "model": "NWA", "type": "AP"}]},
+        None,
+        {"siteId": "site2", "devices": [
+            {"devId": "dev2", "name": "sw", "mac": "mac2", "sn": "sn2", "model": "GS", "type": "SW"},
+            None,
+            {"devId": "dev3", "name": "gw", "mac": "mac3", "sn": "sn3", "model": "USG", "type": "GW"}]},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_devices_from_organization_covers_every_site(httpx_mock: HTTPXMock):
+    """Devices of all sites are returned, `null` entries are skipped."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    endpoint = BASE_URL + ENDPOINTS["GET_DEVICES_FROM_ORGANIZATION"].format(org_id="org_id")
+    httpx_mock.add_response(url=endpoint, json=sites_devices_mock_data(), method="GET", is_reusable=True)
+
+    devices = await client.get_devices_from_organization("org_id")
+    sites = await client.get_sites_devices_from_organization("org_id")
+
+    assert [device.devId for device in devices] == ["dev1", "dev2", "dev3"]
+    assert [(site.siteId, len(site.devices)) for site in sites] == [("site1", 1), ("site2", 3)]
+    assert isinstance(sites[1].devices[0], Device)
+
+
+@pytest.mark.asyncio
+async def test_iter_sites_devices_from_organization(httpx_mock: HTTPXMock):
+    """Sites are streamed one by one, `null` entries are skipped."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    endpoint = BASE_URL + ENDPOINTS["GET_DEVICES_FROM_ORGANIZATION"].format(org_id="org_id")
+    httpx_mock.add_response(url=endpoint, json=sites_devices_mock_data(), method="GET")
+
+    sites = [site async for site in client.iter_sites_devices_from_organization("org_id")]
+
+    assert [site.siteId for site in sites] == ["site1", "site2"]
+    assert sites[1].devices[2].devId == "dev3"
+
+
 @pytest.mark.asyncio
 async def test_get_device_firmware_status_from_organization(httpx_mock: HTTPXMock):
     """Test the `test_get_device_firmware_status_from_organization` method with specific attributes."""
@@ -801,3 +842,119 @@ async def test_get_gw_clients_v2(httpx_mock: HTTPXMock):
                          data=mock_data, config=Config(cast=[Enum]))
 
     assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_crawl_organization(httpx_mock: HTTPXMock):
+    """Test the `crawl_organization` method fans out to every site."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    org_id = "org_id"
+    site_ids = ["site_1", "site_2", "site_3"]
+
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id=org_id), method="GET",
+        json=[{"name": site_id, "siteId": site_id, "timeZone": "UTC", "deviceCount": 1} for site_id in site_ids])
+    for site_id in site_ids:
+        httpx_mock.add_response(
+            url=BASE_URL + ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id=site_id), method="POST",
+            json={"KeyFields": ["macAddress"], "data": [{"macAddress": site_id, "status": "ONLINE"}]})
+
+    results = [result async for result in client.crawl_organization(org_id, concurrency=2)]
+
+    assert sorted(result.site.siteId for result in results) == site_ids
+    for result in results:
+        assert result.orgId == org_id
+        assert result.error is None
+        assert result.result.data[0].macAddress == result.site.siteId
+
+
+@pytest.mark.asyncio
+async def test_crawl_group_return_exceptions(httpx_mock: HTTPXMock):
+    """Test the `crawl_group` method reports failed sites instead of aborting."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    group_id = "group_id"
+
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_ORGANIZATIONS_FROM_GROUP"].format(group_id=group_id), method="GET",
+        json=[{"name": "org", "orgId": "org_id", "mode": "PRO"}])
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org_id"), method="GET",
+        json=[{"name": site_id, "siteId": site_id, "timeZone": "UTC", "deviceCount": 1} for site_id in ["ok", "broken"]])
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="ok"), method="GET", json={})
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="broken"), method="GET", status_code=404)
+
+    results = {result.site.siteId: result async for result in client.crawl_group(
+        group_id, fetch=client.get_site_vpn_status, return_exceptions=True)}
+
+    assert results["ok"].result == SiteVPNStatus()
+    assert isinstance(results["broken"].error, ZyxelNebulaError)
+
+
+@pytest.mark.asyncio
+async def test_crawl_group_reports_failed_organizations(httpx_mock: HTTPXMock):
+    """Test the `crawl_group` method reports organizations whose sites cannot be retrieved."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    group_id = "group_id"
+
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_ORGANIZATIONS_FROM_GROUP"].format(group_id=group_id), method="GET",
+        json=[{"name": org_id, "orgId": org_id, "mode": "PRO"} for org_id in ["ok", "forbidden"]], is_reusable=True)
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="ok"), method="GET",
+        json=[{"name": "site", "siteId": "site", "timeZone": "UTC", "deviceCount": 1}], is_reusable=True)
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="forbidden"), method="GET", status_code=403, is_reusable=True)
+    httpx_mock.add_response(
+        url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="site"), method="GET", json={}, is_reusable=True)
+
+    results = [result async for result in client.crawl_group(
+        group_id, fetch=client.get_site_vpn_status, return_exceptions=True)]
+
+    assert [(result.orgId, result.site.siteId, result.error) for result in results if result.site] == [("ok", "site", None)]
+    assert [(result.orgId, result.site) for result in results if result.error] == [("forbidden", None)]
+
+    with pytest.raises(ZyxelNebulaError):
+        async for _ in client.crawl_group(group_id, fetch=client.get_site_vpn_status):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_existing_headers_and_hooks_are_kept(httpx_mock: HTTPXMock):
+    """A preconfigured HTTP client keeps its headers and event hooks."""
+    seen = []
+
+    async def hook(response):
+        seen.append(response.status_code)
+
+    http_client = AsyncClient(headers={"User-Agent": "dashboard"}, event_hooks={"response": [hook]})
+    client = ZyxelNebulaClient(api_key="dummy_api_key", client=http_client)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", json=[])
+
+    await client.get_groups()
+
+    request = httpx_mock.get_requests()[0]
+    assert request.headers["User-Agent"] == "dashboard"
+    assert request.headers["X-ZyxelNebula-API-Key"] == "dummy_api_key"
+    assert seen == [200]
+
+
+def test_connection_pool_settings():
+    """The default HTTP client is created with the given pool limits and timeout."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", limits=httpx.Limits(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=90), timeout=12)
+
+    pool = client.client._transport._pool
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (7, 3, 90)
+    assert client.client.timeout == httpx.Timeout(12)
+
+
+def test_http2():
+    """HTTP/2 can be enabled on the default HTTP client."""
+    pytest.importorskip("h2")
+
+    client = ZyxelNebulaClient(api_key="dummy_api_key", http2=True)
+
+    assert client.client._transport._pool._http2
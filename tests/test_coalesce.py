@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, DeviceType
+
+
+VPN_STATUS = {"remoteAps": [{"devId": "dev", "uptime": 1, "status": "UP", "lastHeartbeat": 0}]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced(httpx_mock: HTTPXMock):
+    """Concurrent identical calls share one request but get their own objects."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="site"),
+                            method="GET", json=VPN_STATUS)
+
+    results = await asyncio.gather(*[client.get_site_vpn_status("site") for _ in range(5)])
+
+    assert len(httpx_mock.get_requests()) == 1
+    assert all(result == results[0] for result in results)
+    assert len({id(result.remoteAps[0]) for result in results}) == 5
+
+
+@pytest.mark.asyncio
+async def test_different_parameters_are_not_coalesced(httpx_mock: HTTPXMock):
+    """Calls with different parameters are sent separately."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    url = BASE_URL + ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(site_id="site")
+    httpx_mock.add_response(url=url + "?type=AP", method="GET", json=[])
+    httpx_mock.add_response(url=url + "?type=SW", method="GET", json=[])
+
+    await asyncio.gather(client.get_devices_device_online_by_type("site", DeviceType.AP),
+                         client.get_devices_device_online_by_type("site", DeviceType.SW))
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_coalesced_errors_reach_every_caller(httpx_mock: HTTPXMock):
+    """A failed shared request raises for every caller."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITE_VPN_STATUS"].format(site_id="site"),
+                            method="GET", status_code=500)
+
+    results = await asyncio.gather(*[client.get_site_vpn_status("site") for _ in range(3)], return_exceptions=True)
+
+    assert all(isinstance(result, ZyxelNebulaError) for result in results)
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_coalesced(httpx_mock: HTTPXMock):
+    """`reboot` calls are always sent."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["REBOOT"].format(site_id="site", device_id="dev"),
+                            method="POST", json={"status": 200, "message": None}, is_reusable=True)
+
+    await asyncio.gather(client.reboot("site", "dev"), client.reboot("site", "dev"))
+
+    assert len(httpx_mock.get_requests()) == 2
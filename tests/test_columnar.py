@@ -0,0 +1,74 @@
+import json
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.decoders import decode_list
+from zyxel_nebula_client import ZyxelNebulaClient, ColumnTable, decode_columns, APClientV2, GenericClient, APClientAttributesReqV2
+from .test_decoders import AP_CLIENTS
+
+
+def test_decode_columns_matches_models():
+    """Every column holds the values the models would have, with nested fields flattened."""
+    table = decode_columns(APClientV2, AP_CLIENTS["data"])
+    clients = decode_list(APClientV2, AP_CLIENTS["data"])
+
+    assert len(table) == len(clients)
+    assert table["macAddress"] == [client.macAddress for client in clients]
+    assert table["upload"] == [client.upload for client in clients]
+    assert table["wifiStation.signal"] == [client.wifiStation and client.wifiStation.signal for client in clients]
+    assert table["wifiStation.band"] == [client.wifiStation and client.wifiStation.band.value for client in clients]
+    assert table["osHostname.hostname"] == [client.osHostname and client.osHostname.hostname for client in clients]
+    assert table.types["wifiStation.band"] is str
+    assert table.types["upload"] is float
+
+
+def test_decode_columns_missing_values():
+    """Missing fields and nested objects become `None` and a missing list an empty table."""
+    table = decode_columns(GenericClient, [{"macAddress": "mac", "status": "ONLINE"}])
+
+    assert table["macAddress"] == ["mac"]
+    assert table["status"] == ["ONLINE"]
+    assert table["ipv4Address"] == [None]
+    assert table["osHostname.os"] == [None]
+    assert len(decode_columns(GenericClient, None)) == 0
+    assert decode_columns(GenericClient, None).columns["macAddress"] == []
+
+
+def test_column_table_to_numpy():
+    """Numeric columns with missing values become float arrays with NaN."""
+    numpy = pytest.importorskip("numpy")
+    table = ColumnTable(columns={"mac": ["a", "b"], "vlan": [1, 2], "signal": [-40, None]},
+                        types={"mac": str, "vlan": int, "signal": int})
+
+    arrays = table.to_numpy()
+
+    assert arrays["vlan"].dtype == numpy.int64
+    assert arrays["signal"].dtype == numpy.float64
+    assert numpy.isnan(arrays["signal"][1])
+    assert list(arrays["mac"]) == ["a", "b"]
+
+
+def test_column_table_to_arrow():
+    """Columns become typed nullable Arrow columns."""
+    pyarrow = pytest.importorskip("pyarrow")
+    table = ColumnTable(columns={"mac": ["a", "b"], "signal": [-40, None]}, types={"mac": str, "signal": int})
+
+    arrow = table.to_arrow()
+
+    assert arrow.schema.field("signal").type == pyarrow.int64()
+    assert arrow.column("signal").to_pylist() == [-40, None]
+
+
+@pytest.mark.asyncio
+async def test_get_ap_clients_v2_table(httpx_mock: HTTPXMock):
+    """The table method requests all attributes by default and returns columns."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id="site_id"),
+                            method="POST", json=AP_CLIENTS)
+
+    table = await client.get_ap_clients_v2_table("site_id")
+
+    payload = json.loads(httpx_mock.get_requests()[0].content)
+    assert payload["featrues"] == [attr.value for attr in APClientAttributesReqV2]
+    assert table["macAddress"] == [item["macAddress"] for item in AP_CLIENTS["data"]]
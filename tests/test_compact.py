@@ -0,0 +1,33 @@
+from dataclasses import asdict, fields
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.compact import COMPACT_MODELS
+from zyxel_nebula_client.decoders import decode
+from zyxel_nebula_client import compact, ZyxelNebulaClient, APClients, ClientPeriod
+from tests.test_decoders import AP_CLIENTS
+
+
+@pytest.mark.parametrize("model, compact_model", COMPACT_MODELS.items())
+def test_compact_models_mirror_models(model, compact_model):
+    """Every compact model has the same fields as the model it replaces and no `__dict__`."""
+    assert [(f.name, f.type) for f in fields(compact_model)] == [
+        (f.name, f.type) for f in fields(model)]
+    assert "__dict__" not in dir(compact_model)
+
+
+@pytest.mark.asyncio
+async def test_get_ap_clients_v2_compact(httpx_mock: HTTPXMock):
+    """Test the `get_ap_clients_v2` method with compact models enabled."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", compact=True)
+    site_id = "site_id"
+
+    endpoint = BASE_URL + ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id=site_id)
+    httpx_mock.add_response(url=endpoint, json=AP_CLIENTS, method="POST")
+
+    result = await client.get_ap_clients_v2(site_id, ClientPeriod.field_2h)
+
+    assert isinstance(result, compact.APClients)
+    assert isinstance(result.data[0], compact.APClientV2)
+    assert isinstance(result.data[0].ssid, compact.APClientSSID)
+    assert asdict(result) == asdict(decode(APClients, AP_CLIENTS))
@@ -0,0 +1,205 @@
+import asyncio
+import pytest
+import httpx
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.concurrency import AdaptiveLimiter, bounded_as_completed, bounded_in_order
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_limits_concurrency():
+    """No more than `limit` calls run at the same time and every item is processed."""
+    running = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (item % 3))
+        running -= 1
+        return item * 2
+
+    results = {item: task.result() async for item, task in bounded_as_completed(work, range(20), limit=4)}
+
+    assert results == {item: item * 2 for item in range(20)}
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_yields_in_completion_order():
+    """Faster calls are yielded first."""
+    async def work(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    order = [item async for item, _ in bounded_as_completed(work, [0.03, 0.01, 0.02], limit=3)]
+
+    assert order == [0.01, 0.02, 0.03]
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_cancels_on_close():
+    """Closing the iterator cancels calls still in flight."""
+    cancelled = []
+
+    async def work(item):
+        try:
+            await asyncio.sleep(0 if item == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    iterator = bounded_as_completed(work, range(3), limit=3)
+    await iterator.__anext__()
+    await iterator.aclose()
+
+    assert sorted(cancelled) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_bounded_in_order_keeps_item_order():
+    """Results are yielded in the order of the items although later calls finish first."""
+    running = 0
+    peak = 0
+
+    async def work(delay):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return delay
+
+    delays = [0.03, 0.01, 0.02, 0.0, 0.01]
+    results = [task.result() async for _, task in bounded_in_order(work, delays, limit=2)]
+
+    assert results == delays
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_bounded_in_order_cancels_on_close():
+    """Closing the iterator cancels the calls looked ahead."""
+    cancelled = []
+
+    async def work(item):
+        try:
+            await asyncio.sleep(0 if item == 0 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+
+    iterator = bounded_in_order(work, range(5), limit=3)
+    await iterator.__anext__()
+    await iterator.aclose()
+
+    # the call for item 3 was scheduled after item 0 finished and is cancelled before it starts
+    assert sorted(cancelled) == [1, 2]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def status_error(status_code: int) -> ZyxelNebulaError:
+    request = httpx.Request("GET", BASE_URL)
+    response = httpx.Response(status_code, request=request)
+    try:
+        raise ZyxelNebulaError() from httpx.HTTPStatusError("error", request=request, response=response)
+    except ZyxelNebulaError as e:
+        return e
+
+
+def test_adaptive_limiter_increases_additively():
+    """Each full round of healthy responses raises the limit by about `increase`."""
+    clock = Clock()
+    limiter = AdaptiveLimiter(initial=4, maximum=6, clock=clock)
+
+    for _ in range(4):
+        limiter.record(clock.now - 0.1)
+    assert limiter.limit == 4
+
+    for _ in range(20):
+        limiter.record(clock.now - 0.1)
+    assert limiter.limit == 6
+
+
+def test_adaptive_limiter_ignores_slow_responses():
+    """Responses much slower than the fastest one do not raise the limit."""
+    clock = Clock()
+    limiter = AdaptiveLimiter(initial=2, latency_tolerance=2, clock=clock)
+    limiter.record(clock.now - 0.1)
+    before = limiter._limit
+
+    limiter.record(clock.now - 0.5)
+
+    assert limiter._limit == before
+
+
+def test_adaptive_limiter_decreases_once_per_round_trip():
+    """Overload errors halve the limit, but not again for requests sent before the decrease."""
+    clock = Clock()
+    limiter = AdaptiveLimiter(initial=16, clock=clock)
+
+    clock.now = 1.0
+    limiter.record(0.5, status_error(429))
+    limiter.record(0.6, status_error(503))
+    assert limiter.limit == 8
+
+    limiter.record(1.5, httpx.ConnectError("failed"))
+    assert limiter.limit == 4
+
+    limiter.record(1.5, status_error(404))
+    assert limiter.limit == 4
+
+
+def test_adaptive_limiter_validates_limits():
+    """Limits must be ordered and the decrease must shrink the limit."""
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(initial=5, maximum=4)
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(decrease=1)
+
+
+@pytest.mark.asyncio
+async def test_bounded_as_completed_follows_adaptive_limit():
+    """Lowering the limit of an `AdaptiveLimiter` reduces the calls started afterwards."""
+    limiter = AdaptiveLimiter(initial=4)
+    running = 0
+    peaks = []
+
+    async def work(item):
+        nonlocal running
+        running += 1
+        peaks.append(running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    async for item, _ in bounded_as_completed(work, range(12), limiter):
+        if item == 0:
+            limiter._limit = 1
+
+    assert max(peaks[:4]) == 4
+    assert max(peaks[6:]) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_reports_to_adaptive_limiter(httpx_mock: HTTPXMock):
+    """The client lowers its adaptive concurrency on throttling."""
+    limiter = AdaptiveLimiter(initial=8)
+    client = ZyxelNebulaClient(api_key="dummy_api_key", adaptive_concurrency=limiter)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", status_code=429)
+
+    with pytest.raises(ZyxelNebulaError):
+        await client.get_groups()
+
+    assert limiter.limit == 4
+    assert client.resolve_concurrency(None) is limiter
+    assert client.resolve_concurrency(3) == 3
@@ -0,0 +1,89 @@
+from dataclasses import is_dataclass
+from enum import Enum
+import pytest
+from dacite import from_dict, Config, MissingValueError, WrongTypeError
+from zyxel_nebula_client import models
+from zyxel_nebula_client.decoders import decode, decode_list, get_decoder
+from zyxel_nebula_client import APClients, Device, GenericClients, Org, SitesDevices, ValidationError
+
+
+AP_CLIENTS = {
+    "KeyFields": ["macAddress"],
+    "data": [
+        {
+            "macAddress": "string",
+            "ipv4Address": "string",
+            "lastSeen": 0,
+            "connectedTo": "string",
+            "firstSeen": 0,
+            "description": "string",
+            "osHostname": {"os": "string", "hostname": "string"},
+            "manufacturer": "string",
+            "ssid": {"name": "string", "security": "OPEN"},
+            "wifiStation": {"status": "ONLINE", "vlan": 0, "signal": 0, "band": "band24", "channel": 0},
+            "user": "string",
+            "upload": 1,
+            "download": 2.5
+        },
+        {
+            "macAddress": "string",
+            "ssid": None,
+            "wifiStation": None
+        }
+    ]
+}
+
+
+def dacite_decode(data_class, data):
+    return from_dict(data_class=data_class, data=data, config=Config(cast=[Enum]))
+
+
+@pytest.mark.parametrize("data_class, data", [
+    (APClients, AP_CLIENTS),
+    (APClients, {"KeyFields": ["macAddress"], "data": None}),
+    (GenericClients, {"KeyFields": ["macAddress"], "data": [{"macAddress": "m", "status": "OFFLINE", "vlan": 1}]}),
+    (Org, {"name": "n", "orgId": "o", "mode": "PRO", "licenseOverview": {"NCCTrialEndAt": None, "NCCExpiredAt": "x"}}),
+    (SitesDevices, {"siteId": "s", "devices": [None, {"devId": "d", "name": "n", "mac": "m", "sn": "s", "model": "m", "type": "AP"}]}),
+    (ValidationError, {"loc": ["body", 1], "msg": "m", "type": "t"}),
+    (models.DeviceOfflineResponse, {"body": None}),
+])
+def test_decode_matches_dacite(data_class, data):
+    """The compiled decoder must produce exactly what dacite produces."""
+    assert decode(data_class, data) == dacite_decode(data_class, data)
+
+
+@pytest.mark.parametrize("data_class, data, error", [
+    (Device, {"devId": "d", "name": "n", "mac": "m", "sn": "s", "model": "m"}, MissingValueError),
+    (Device, {"devId": 1, "name": "n", "mac": "m", "sn": "s", "model": "m", "type": "AP"}, WrongTypeError),
+    (Device, {"devId": "d", "name": "n", "mac": "m", "sn": "s", "model": "m", "type": "UNKNOWN"}, ValueError),
+    (APClients, {"KeyFields": ["macAddress"], "data": [{"macAddress": "m", "ssid": None, "wifiStation": {"band": 5}}]}, ValueError),
+])
+def test_decode_raises_dacite_errors(data_class, data, error):
+    """Invalid data raises the same exception as dacite."""
+    with pytest.raises(error) as expected:
+        dacite_decode(data_class, data)
+
+    with pytest.raises(error) as actual:
+        decode(data_class, data)
+
+    assert str(actual.value) == str(expected.value)
+
+
+def test_decoders_are_cached():
+    """Decoders are compiled once per dataclass."""
+    assert get_decoder(APClients) is get_decoder(APClients)
+
+
+def test_decode_list():
+    """`decode_list` decodes every item."""
+    items = AP_CLIENTS["data"]
+
+    assert decode_list(models.APClientV2, items) == [
+        dacite_decode(models.APClientV2, item) for item in items]
+
+
+@pytest.mark.parametrize("data_class", [
+    value for value in vars(models).values() if isinstance(value, type) and is_dataclass(value)])
+def test_every_model_compiles(data_class):
+    """Every generated model gets a decoder."""
+    assert callable(get_decoder(data_class))
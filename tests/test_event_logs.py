@@ -0,0 +1,93 @@
+import json
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, SWEventLogEntry, GWEventLogEntry
+
+
+SW_URL = BASE_URL + ENDPOINTS["GET_SW_EVENT_LOGS"].format(site_id="site", device_id="dev")
+GW_URL = BASE_URL + ENDPOINTS["GET_GW_EVENT_LOGS"].format(site_id="site")
+
+
+def sw_entry(timestamp):
+    return {"timestamp": timestamp, "category": "PORT", "devId": "dev", "mac": "mac",
+            "message": f"event {timestamp}", "priority": "INFO", "tag": "tag"}
+
+
+@pytest.mark.asyncio
+async def test_get_sw_event_logs(httpx_mock: HTTPXMock):
+    """The time range is sent as `EventLogsReq`."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=SW_URL, method="POST", json=[sw_entry(5)])
+
+    logs = await client.get_sw_event_logs("site", "dev", start=1, end=10)
+
+    assert logs == [SWEventLogEntry(**sw_entry(5))]
+    assert json.loads(httpx_mock.get_requests()[0].content) == {"startTimestamp": 1, "endTimestamp": 10}
+
+
+@pytest.mark.asyncio
+async def test_iter_sw_event_logs_windows_are_merged_in_order(httpx_mock: HTTPXMock):
+    """The range is split into windows sharing their boundaries, whose entries are yielded sorted by timestamp."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    def respond(request):
+        window = json.loads(request.content)
+        entries = [sw_entry(timestamp) for timestamp in range(window["startTimestamp"], window["endTimestamp"] + 1, 3)]
+        return httpx.Response(200, json=entries[::-1])
+
+    httpx_mock.add_callback(respond, url=SW_URL, method="POST", is_reusable=True)
+
+    entries = [entry async for entry in client.iter_sw_event_logs("site", "dev", start=0, end=24, window=10, concurrency=2)]
+
+    windows = sorted((window["startTimestamp"], window["endTimestamp"])
+                     for window in map(lambda request: json.loads(request.content), httpx_mock.get_requests()))
+    assert windows == [(0, 10), (10, 20), (20, 24)]
+    timestamps = [entry.timestamp for entry in entries]
+    assert timestamps == sorted(timestamps)
+    assert timestamps == [0, 3, 6, 9, 10, 13, 16, 19, 20, 23]
+
+
+@pytest.mark.parametrize("inclusive_end", [True, False])
+@pytest.mark.asyncio
+async def test_entries_at_window_boundaries_are_yielded_once(httpx_mock: HTTPXMock, inclusive_end):
+    """Entries exactly at a window boundary are neither lost nor duplicated, whatever the end semantics."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    stored = [0, 9, 10, 10, 11, 19, 20, 29, 30]
+
+    def respond(request):
+        window = json.loads(request.content)
+        last = window["endTimestamp"] + (1 if inclusive_end else 0)
+        return httpx.Response(200, json=[sw_entry(timestamp) for timestamp in stored
+                                         if window["startTimestamp"] <= timestamp < last])
+
+    httpx_mock.add_callback(respond, url=SW_URL, method="POST", is_reusable=True)
+
+    entries = [entry async for entry in client.iter_sw_event_logs("site", "dev", start=0, end=30, window=10)]
+
+    expected = stored if inclusive_end else stored[:-1]
+    assert [entry.timestamp for entry in entries] == expected
+
+
+@pytest.mark.asyncio
+async def test_iter_gw_event_logs(httpx_mock: HTTPXMock):
+    """Gateway logs are fetched per window as well."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    httpx_mock.add_response(url=GW_URL, method="POST", json=[{"timestamp": 2, "message": "b"}, {"timestamp": 1, "message": "a"}])
+
+    entries = [entry async for entry in client.iter_gw_event_logs("site", start=0, end=100)]
+
+    assert entries == [GWEventLogEntry(timestamp=1, message="a"), GWEventLogEntry(timestamp=2, message="b")]
+
+
+@pytest.mark.asyncio
+async def test_iter_event_logs_rejects_empty_window():
+    """Windows must be at least one millisecond long."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    with pytest.raises(ValueError):
+        async for _ in client.iter_gw_event_logs("site", start=0, end=100, window=0):
+            pass
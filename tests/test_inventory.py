@@ -0,0 +1,78 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.decoders import decode
+from zyxel_nebula_client import (ZyxelNebulaClient, InventoryIndex, normalize_mac, Device, DeviceType,
+                                 DeviceOnlineStatus, OnlineOffline, SitesDevices)
+
+
+def device(dev_id, mac, sn, type="AP"):
+    return {"devId": dev_id, "name": dev_id, "mac": mac, "sn": sn, "model": "NWA", "type": type}
+
+
+def firmware(dev_id, version="1.0"):
+    return {"devId": dev_id, "currentVersion": version, "latestVersion": "2.0",
+            "status": "NOT_UP_TO_DATE", "lastUpgradeTime": None}
+
+
+def test_normalize_mac():
+    """Common MAC notations normalize to the same key."""
+    assert normalize_mac("00:11:22:AA:bb:CC") == normalize_mac("00-11-22-aa-bb-cc") == \
+        normalize_mac("0011.22aa.bbcc") == "001122aabbcc"
+
+
+def test_lookups_by_mac_serial_id_and_site():
+    """Devices are found by MAC, serial, device ID and site."""
+    index = InventoryIndex()
+    index.add_devices([decode(Device, device("ap1", "00:11:22:33:44:55", "S1"))], site_id="site1")
+    index.add_devices([decode(SitesDevices, {"siteId": "site2", "devices": [device("sw1", "aa-bb-cc-dd-ee-ff", "S2", "SW")]})])
+
+    assert index.by_mac("00-11-22-33-44-55").devId == "ap1"
+    assert index.by_mac("AABB.CCDD.EEFF").device.type == DeviceType.SW
+    assert index.by_serial("S1").siteId == "site1"
+    assert index.by_id("sw1").siteId == "site2" and "sw1" in index and len(index) == 2
+    assert [entry.devId for entry in index.by_site("site2")] == ["sw1"]
+    assert index.by_mac("ff:ff:ff:ff:ff:ff") is None and index.by_id("missing") is None
+
+
+def test_readding_device_replaces_old_keys():
+    """A device added again is found by its new MAC and serial only."""
+    index = InventoryIndex()
+    index.add_devices([decode(Device, device("ap1", "00:00:00:00:00:01", "S1"))], site_id="site1")
+    index.add_devices([decode(Device, device("ap1", "00:00:00:00:00:02", "S2"))], site_id="site2")
+
+    assert index.by_mac("00:00:00:00:00:01") is None and index.by_serial("S1") is None
+    assert index.by_serial("S2").devId == "ap1"
+    assert index.by_site("site1") == [] and len(index.by_site("site2")) == 1
+
+
+def test_firmware_and_online_status_are_joined():
+    """Firmware and online status end up in the entries of their devices."""
+    index = InventoryIndex()
+    index.add_devices([decode(Device, device("ap1", "00:11:22:33:44:55", "S1"))])
+    index.add_online([DeviceOnlineStatus(devId="ap1", currentStatus=OnlineOffline.OFFLINE)], site_id="site1")
+
+    entry = index.by_mac("001122334455")
+    assert entry.online == OnlineOffline.OFFLINE and entry.siteId == "site1"
+    assert entry.firmware is None
+
+
+@pytest.mark.asyncio
+async def test_from_organization(httpx_mock: HTTPXMock):
+    """The index of an organization joins devices, firmware and the online status of every site."""
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_DEVICES_FROM_ORGANIZATION"].format(org_id="org"),
+                            method="GET", json=[{"siteId": "site", "devices": [device("ap1", "00:11:22:33:44:55", "S1")]}])
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_DEVICE_FIRMWARE_STATUS_FROM_ORGANIZATION"].format(org_id="org"),
+                            method="GET", json=[firmware("ap1")])
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org"), method="GET",
+                            json=[{"name": "site", "siteId": "site", "timeZone": "UTC", "deviceCount": 1}])
+    for device_type in DeviceType:
+        httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(site_id="site") + f"?type={device_type.value}",
+                                method="GET", json=[{"devId": "ap1", "currentStatus": "ONLINE"}] if device_type == DeviceType.AP else [])
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    index = await InventoryIndex.from_organization(client, "org", online=True)
+
+    entry = index.by_serial("S1")
+    assert entry.firmware.currentVersion == "1.0"
+    assert entry.online == OnlineOffline.ONLINE and entry.siteId == "site"
@@ -0,0 +1,49 @@
+import json
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.json_backend import default_json_backend
+from zyxel_nebula_client import ZyxelNebulaClient, JSONBackend, ORJSON, STDLIB_JSON, ClientPeriod
+
+
+@pytest.mark.asyncio
+async def test_json_backend_is_used_for_responses_and_payloads(httpx_mock: HTTPXMock):
+    """Payloads are serialized and responses parsed with the configured backend."""
+    calls = []
+
+    def loads(content):
+        calls.append("loads")
+        return STDLIB_JSON.loads(content)
+
+    def dumps(value):
+        calls.append("dumps")
+        return STDLIB_JSON.dumps(value)
+
+    client = ZyxelNebulaClient(api_key="dummy_api_key", json_backend=JSONBackend("custom", loads, dumps))
+
+    endpoint = BASE_URL + ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id="site_id")
+    httpx_mock.add_response(url=endpoint, method="POST", json={"KeyFields": ["macAddress"], "data": []})
+
+    result = await client.get_site_clients_v2("site_id", ClientPeriod.field_1d)
+
+    request = httpx_mock.get_requests()[0]
+    assert result.data == []
+    assert calls == ["dumps", "loads"]
+    assert request.headers["Content-Type"] == "application/json"
+    assert json.loads(request.content) == {"period": "1d", "featrues": ["mac_address"]}
+
+
+@pytest.mark.parametrize("backend", [STDLIB_JSON, ORJSON])
+def test_json_backend_round_trip(backend):
+    """Backends produce UTF-8 bytes and parse them back."""
+    if backend is None:
+        pytest.skip("orjson is not installed")
+    value = {"name": "Zürich", "values": [1, 2.5, None, True]}
+
+    assert backend.loads(backend.dumps(value)) == value
+    assert isinstance(backend.dumps(value), bytes)
+
+
+def test_default_json_backend():
+    """orjson is preferred when available."""
+    assert default_json_backend() is (ORJSON or STDLIB_JSON)
@@ -0,0 +1,131 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.metrics import Histogram
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, Metrics, Observation, OpenTelemetryExporter, ClientPeriod
+from .test_decoders import AP_CLIENTS
+
+
+SITES = [{"name": site_id, "siteId": site_id, "timeZone": "UTC", "deviceCount": 1} for site_id in ["site1", "site2"]]
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_recorded_per_endpoint(httpx_mock: HTTPXMock):
+    """Latency, size, parse and decode time and item counts are recorded per endpoint."""
+    observations = []
+    metrics = Metrics(exporters=[observations.append])
+    client = ZyxelNebulaClient(api_key="dummy_api_key", metrics=metrics)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org"),
+                            method="GET", json=SITES)
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id="site1"),
+                            method="POST", json=AP_CLIENTS)
+
+    await client.get_sites("org")
+    await client.get_ap_clients_v2("site1", ClientPeriod.field_1d)
+
+    for name in ["request_seconds", "response_bytes", "parse_seconds", "decode_seconds", "items"]:
+        assert metrics.histogram(name, "GET_SITES").count == 1
+        assert metrics.histogram(name, "GET_AP_CLIENTS_V2").count == 1
+    assert metrics.histogram("items", "GET_SITES").sum == 2
+    assert metrics.histogram("items", "GET_AP_CLIENTS_V2").sum == len(AP_CLIENTS["data"])
+    assert metrics.histogram("response_bytes", "GET_SITES").sum > 0
+    assert [observation.name for observation in observations[:5]] == \
+        ["request_seconds", "response_bytes", "parse_seconds", "decode_seconds", "items"]
+    assert all(observation.endpoint == "GET_SITES" for observation in observations[:5])
+
+
+@pytest.mark.asyncio
+async def test_metrics_count_errors(httpx_mock: HTTPXMock):
+    """Failed requests are counted by error class."""
+    metrics = Metrics()
+    client = ZyxelNebulaClient(api_key="dummy_api_key", metrics=metrics)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", status_code=500)
+
+    with pytest.raises(ZyxelNebulaError):
+        await client.get_groups()
+
+    assert metrics.errors == {("GET_GROUPS", "ZyxelNebulaError"): 1}
+    assert metrics.histogram("request_seconds", "GET_GROUPS").count == 1
+    assert metrics.histogram("decode_seconds", "GET_GROUPS").count == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_for_streamed_requests(httpx_mock: HTTPXMock):
+    """Streamed requests record the item count and body size once the stream is consumed."""
+    metrics = Metrics()
+    client = ZyxelNebulaClient(api_key="dummy_api_key", metrics=metrics)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id="site1"),
+                            method="POST", json=AP_CLIENTS)
+
+    clients = [client async for client in client.iter_ap_clients_v2("site1")]
+
+    assert metrics.histogram("items", "GET_AP_CLIENTS_V2").sum == len(clients)
+    assert metrics.histogram("response_bytes", "GET_AP_CLIENTS_V2").sum > 0
+    assert metrics.histogram("request_seconds", "GET_AP_CLIENTS_V2").count == 1
+
+
+def test_histogram_buckets():
+    """Values are counted in the first bucket whose upper bound they do not exceed."""
+    histogram = Histogram([1, 10])
+    for value in [0.5, 1, 5, 100]:
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.mean == pytest.approx(106.5 / 4)
+
+
+def test_prometheus_text_format():
+    """Histograms are cumulative per endpoint and errors are exported as counters."""
+    metrics = Metrics()
+    metrics.observe("items", "GET_SITES", 2)
+    metrics.observe("items", "GET_SITES", 50)
+    metrics.error("GET_GROUPS", ZyxelNebulaError())
+
+    lines = metrics.prometheus(prefix="nebula").splitlines()
+
+    assert "# TYPE nebula_items histogram" in lines
+    assert 'nebula_items_bucket{endpoint="GET_SITES",le="1"} 0' in lines
+    assert 'nebula_items_bucket{endpoint="GET_SITES",le="10"} 1' in lines
+    assert 'nebula_items_bucket{endpoint="GET_SITES",le="+Inf"} 2' in lines
+    assert 'nebula_items_sum{endpoint="GET_SITES"} 52.0' in lines
+    assert 'nebula_items_count{endpoint="GET_SITES"} 2' in lines
+    assert 'nebula_errors_total{endpoint="GET_GROUPS",error="ZyxelNebulaError"} 1' in lines
+    assert not any(line.startswith("# TYPE nebula_request_seconds") for line in lines)
+
+    metrics.reset()
+    assert metrics.prometheus() == ""
+
+
+def test_open_telemetry_exporter():
+    """Observations are forwarded to the instruments of the meter."""
+    recorded = []
+
+    class Instrument:
+        def __init__(self, name):
+            self.name = name
+
+        def record(self, value, attributes):
+            recorded.append((self.name, value, attributes))
+
+        def add(self, value, attributes):
+            recorded.append((self.name, value, attributes))
+
+    class Meter:
+        def create_histogram(self, name, unit, description):
+            return Instrument(name)
+
+        def create_counter(self, name, description):
+            return Instrument(name)
+
+    exporter = OpenTelemetryExporter(meter=Meter())
+    exporter(Observation("items", "GET_SITES", 3))
+    exporter(Observation("errors", "GET_SITES", 1, "ZyxelNebulaError"))
+
+    assert recorded == [
+        ("zyxel_nebula.items", 3, {"endpoint": "GET_SITES"}),
+        ("zyxel_nebula.errors", 1, {"endpoint": "GET_SITES", "error": "ZyxelNebulaError"}),
+    ]
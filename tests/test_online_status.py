@@ -0,0 +1,48 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, DeviceType, OnlineOffline
+
+
+def online_url(site_id, device_type):
+    return BASE_URL + ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(site_id=site_id) + f"?type={device_type.value}"
+
+
+@pytest.mark.asyncio
+async def test_site_online_status_merges_every_type(httpx_mock: HTTPXMock):
+    """One request per device type is merged into a single map with fetch times."""
+    for device_type in DeviceType:
+        devices = [{"devId": f"{device_type.value}1", "currentStatus": "ONLINE"}]
+        if device_type == DeviceType.AP:
+            devices.append({"devId": "AP2", "currentStatus": "OFFLINE"})
+        httpx_mock.add_response(url=online_url("site", device_type), method="GET", json=devices)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    status = await client.get_site_online_status("site")
+
+    assert len(httpx_mock.get_requests()) == len(DeviceType)
+    assert status.statuses["AP2"] == OnlineOffline.OFFLINE
+    assert status.statuses["GW1"] == OnlineOffline.ONLINE
+    assert len(status.devices) == len(DeviceType) + 1
+    assert status.devices["SW1"].type == DeviceType.SW
+    assert set(status.fetchedAt) == set(DeviceType) and not status.errors
+
+
+@pytest.mark.asyncio
+async def test_sites_online_status_streams_sites_and_records_errors(httpx_mock: HTTPXMock):
+    """Every site is yielded once all its types are fetched, failed types can be recorded."""
+    types = [DeviceType.AP, DeviceType.SW]
+    for site_id in ["site1", "site2"]:
+        httpx_mock.add_response(url=online_url(site_id, DeviceType.AP), method="GET",
+                                json=[{"devId": f"{site_id}-ap", "currentStatus": "ONLINE"}])
+    httpx_mock.add_response(url=online_url("site1", DeviceType.SW), method="GET", json=[])
+    httpx_mock.add_response(url=online_url("site2", DeviceType.SW), method="GET", status_code=400)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    statuses = {status.siteId: status async for status in client.iter_sites_online_status(
+        ["site1", "site2", "site1"], types, concurrency=3, return_exceptions=True)}
+
+    assert set(statuses) == {"site1", "site2"}
+    assert list(statuses["site1"].statuses) == ["site1-ap"]
+    assert list(statuses["site2"].errors) == [DeviceType.SW]
+    assert list(statuses["site2"].fetchedAt) == [DeviceType.AP]
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.concurrency import bounded_merge
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError
+
+
+def ping_url(device_id):
+    return BASE_URL + ENDPOINTS["PING"].format(site_id="site", device_id=device_id)
+
+
+def result(seq):
+    return {"seq": seq, "loss": False, "timestamp": seq, "elapsedTime": 1}
+
+
+class Ping:
+    """Reports one more result per poll and is done after `count` results."""
+
+    def __init__(self, count):
+        self.count = count
+        self.payloads = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.payloads.append(payload)
+        reported = len(self.payloads)
+        return httpx.Response(200, json={"token": "token", "isDone": reported >= self.count,
+                                         "results": [result(seq) for seq in range(min(reported, self.count))]})
+
+
+@pytest.mark.asyncio
+async def test_iter_ping_polls_with_token_until_done(httpx_mock: HTTPXMock):
+    """The ping is polled with its token and every result is yielded once."""
+    ping = Ping(3)
+    httpx_mock.add_callback(ping, url=ping_url("dev"), method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    results = [item async for item in client.iter_ping("site", "dev", "8.8.8.8", interval=0)]
+
+    assert [item.seq for item in results] == [0, 1, 2]
+    assert ping.payloads == [{"target": "8.8.8.8"}] + [{"target": "8.8.8.8", "token": "token"}] * 2
+
+
+@pytest.mark.asyncio
+async def test_iter_ping_times_out(httpx_mock: HTTPXMock):
+    """A ping that is not done by the deadline raises `TimeoutError` after yielding its results."""
+    httpx_mock.add_callback(Ping(100), url=ping_url("dev"), method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    results = []
+    with pytest.raises(TimeoutError):
+        async for item in client.iter_ping("site", "dev", "8.8.8.8", interval=0.01, timeout=0.05):
+            results.append(item.seq)
+
+    assert results == list(range(len(results))) and results
+
+
+@pytest.mark.asyncio
+async def test_iter_ping_without_token_is_not_restarted(httpx_mock: HTTPXMock):
+    """A ping that is not done but returns no token raises instead of starting another ping."""
+    httpx_mock.add_response(url=ping_url("dev"), method="POST", json={"isDone": False, "results": [result(0)]})
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    results = []
+    with pytest.raises(ZyxelNebulaError):
+        async for item in client.iter_ping("site", "dev", "8.8.8.8", interval=0):
+            results.append(item.seq)
+
+    assert results == [0]
+    assert len(httpx_mock.get_requests()) == 1
+
+@pytest.mark.asyncio
+async def test_ping_devices_streams_results_of_all_devices(httpx_mock: HTTPXMock):
+    """Results of concurrent pings are yielded with their device, failures can be returned."""
+    httpx_mock.add_callback(Ping(2), url=ping_url("dev1"), method="POST", is_reusable=True)
+    httpx_mock.add_callback(Ping(3), url=ping_url("dev2"), method="POST", is_reusable=True)
+    httpx_mock.add_response(url=ping_url("dev3"), method="POST", status_code=400, is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    pings = [("site", "dev1", "a"), ("site", "dev2", "b"), ("site", "dev3", "c")]
+
+    items = [item async for item in client.ping_devices(pings, interval=0, concurrency=2, return_exceptions=True)]
+
+    assert sorted((item.devId, item.result.seq) for item in items if item.result) == \
+        [("dev1", 0), ("dev1", 1), ("dev2", 0), ("dev2", 1), ("dev2", 2)]
+    assert [(item.devId, item.target) for item in items if item.error] == [("dev3", "c")]
+
+
+@pytest.mark.asyncio
+async def test_bounded_merge_interleaves_and_limits():
+    """Values of running iterators are interleaved, at most `limit` run and errors cancel the rest."""
+    running = []
+    peak = []
+
+    async def count(n):
+        running.append(n)
+        peak.append(len(running))
+        try:
+            for i in range(n):
+                await asyncio.sleep(0)
+                yield i
+        finally:
+            running.remove(n)
+
+    values = [item async for item in bounded_merge(count, [1, 2, 3, 4], limit=2)]
+    assert sorted(values) == sorted((n, i) for n in [1, 2, 3, 4] for i in range(n))
+    assert max(peak) == 2
+
+    async def fail(n):
+        if n == 1:
+            raise ValueError("boom")
+        await asyncio.sleep(10)
+        yield n
+
+    with pytest.raises(ValueError):
+        async for _ in bounded_merge(fail, [0, 1], limit=2):
+            pass
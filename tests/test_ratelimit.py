@@ -0,0 +1,48 @@
+import time
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, RateLimiter, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_waits():
+    """A bucket hands out `burst` tokens immediately and then refills at `rate`."""
+    bucket = TokenBucket(rate=50, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.02
+
+    for _ in range(2):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.035
+
+
+def test_rate_limiter_family():
+    """Paths are matched against the family patterns."""
+    livetool = TokenBucket(rate=1)
+    limiter = RateLimiter(rate=10, families={"/v1/nebula/*/livetool/*": livetool})
+
+    assert limiter.family("/v1/nebula/site/livetool/dev/reboot") is livetool
+    assert limiter.family("/v1/nebula/organizations") is None
+    assert limiter.bucket.burst == 10
+
+
+@pytest.mark.asyncio
+async def test_client_requests_are_rate_limited(httpx_mock: HTTPXMock):
+    """Every request sent by the client takes a token from the matching buckets."""
+    livetool = TokenBucket(rate=1, burst=5)
+    limiter = RateLimiter(rate=1, burst=5, families={"/v1/nebula/*/livetool/*": livetool})
+    client = ZyxelNebulaClient(api_key="dummy_api_key", rate_limiter=limiter)
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", json=[])
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["REBOOT"].format(site_id="site", device_id="dev"),
+                            method="POST", json={"status": 200, "message": None})
+
+    await client.get_groups()
+    await client.reboot("site", "dev")
+
+    assert limiter.bucket.tokens == pytest.approx(3, abs=0.1)
+    assert livetool.tokens == pytest.approx(4, abs=0.1)
@@ -0,0 +1,102 @@
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, RetryPolicy
+
+
+def policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy(backoff=0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_retry_transient_status(httpx_mock: HTTPXMock):
+    """A GET failing with a 5xx is retried until it succeeds."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=policy())
+
+    endpoint = BASE_URL + ENDPOINTS["GET_GROUPS"]
+    httpx_mock.add_response(url=endpoint, method="GET", status_code=503)
+    httpx_mock.add_response(url=endpoint, method="GET", status_code=502)
+    httpx_mock.add_response(url=endpoint, method="GET", json=[{"name": "group", "groupId": "id"}])
+
+    result = await client.get_groups()
+
+    assert result[0].groupId == "id"
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+async def test_retry_connection_error(httpx_mock: HTTPXMock):
+    """Connection errors are retried."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=policy())
+
+    endpoint = BASE_URL + ENDPOINTS["GET_GROUPS"]
+    httpx_mock.add_exception(httpx.ConnectError("reset"), url=endpoint, method="GET")
+    httpx_mock.add_response(url=endpoint, method="GET", json=[])
+
+    assert await client.get_groups() == []
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_after_max_attempts(httpx_mock: HTTPXMock):
+    """The last error is raised once every attempt failed."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=policy(max_attempts=2))
+
+    endpoint = BASE_URL + ENDPOINTS["GET_GROUPS"]
+    httpx_mock.add_response(url=endpoint, method="GET", status_code=500, is_reusable=True)
+
+    with pytest.raises(ZyxelNebulaError):
+        await client.get_groups()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+async def test_no_retry_for_client_errors(httpx_mock: HTTPXMock):
+    """Statuses outside `retry_statuses` are raised immediately."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=policy())
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", status_code=422)
+
+    with pytest.raises(ZyxelNebulaError):
+        await client.get_groups()
+
+
+@pytest.mark.asyncio
+async def test_reboot_is_never_retried(httpx_mock: HTTPXMock):
+    """`reboot` is sent once even when the policy allows retrying non-idempotent requests."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=policy(idempotent_only=False))
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["REBOOT"].format(site_id="site", device_id="dev"),
+                            method="POST", status_code=503)
+
+    with pytest.raises(ZyxelNebulaError):
+        await client.reboot("site", "dev")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_retry_policy_applies_to_idempotent_endpoints():
+    """Only GETs and read-only POSTs are retried by default."""
+    assert RetryPolicy().applies_to("GET", "GET_SITES")
+    assert RetryPolicy().applies_to("POST", "GET_AP_CLIENTS_V2")
+    assert not RetryPolicy().applies_to("POST", "CABLE_TEST")
+    assert RetryPolicy(idempotent_only=False).applies_to("POST", "CABLE_TEST")
+
+
+def test_retry_policy_delay():
+    """Delays grow exponentially, are capped and honor `Retry-After`."""
+    retry_policy = RetryPolicy(backoff=1, max_backoff=5, jitter=0)
+    request = httpx.Request("GET", BASE_URL)
+
+    def error(headers=None):
+        response = httpx.Response(503, headers=headers, request=request)
+        try:
+            raise ZyxelNebulaError() from httpx.HTTPStatusError("", request=request, response=response)
+        except ZyxelNebulaError as e:
+            return e
+
+    assert [retry_policy.delay(error(), attempt) for attempt in range(1, 5)] == [1, 2, 4, 5]
+    assert retry_policy.delay(error({"Retry-After": "3"}), 1) == 3
+    assert retry_policy.delay(error({"Retry-After": "60"}), 1) == 5
+    assert 0 <= RetryPolicy(backoff=1).delay(error(), 1) <= 1
@@ -0,0 +1,145 @@
+import asyncio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, RebootRollout, RetryPolicy
+
+
+ONLINE_URL = BASE_URL + ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(site_id="site") + "?type=AP"
+
+
+def reboot_url(device_id):
+    return BASE_URL + ENDPOINTS["REBOOT"].format(site_id="site", device_id=device_id)
+
+
+class Site:
+    """Takes rebooted devices offline for `downtime` polls and records the order of events."""
+
+    def __init__(self, downtime=1):
+        self.downtime = downtime
+        self.offline = {}
+        self.events = []
+
+    def reboot(self, request: httpx.Request) -> httpx.Response:
+        device_id = request.url.path.split("/")[-2]
+        self.events.append(("reboot", device_id))
+        self.offline[device_id] = self.downtime
+        return httpx.Response(200, json={"status": 200, "message": "OK"})
+
+    def online(self, request: httpx.Request) -> httpx.Response:
+        self.events.append(("poll",))
+        statuses = []
+        for device_id in ["ap1", "ap2", "ap3"]:
+            down = self.offline.get(device_id, 0) > 0
+            if down:
+                self.offline[device_id] -= 1
+            statuses.append({"devId": device_id, "currentStatus": "OFFLINE" if down else "ONLINE"})
+        return httpx.Response(200, json=statuses)
+
+
+def setup(httpx_mock: HTTPXMock, site: Site, devices=("ap1", "ap2", "ap3")):
+    httpx_mock.add_callback(site.online, url=ONLINE_URL, method="GET", is_reusable=True)
+    for device_id in devices:
+        httpx_mock.add_callback(site.reboot, url=reboot_url(device_id), method="POST", is_reusable=True)
+
+
+@pytest.mark.asyncio
+async def test_rollout_waits_for_each_wave(httpx_mock: HTTPXMock):
+    """The next wave is rebooted only after the previous one was seen offline and back online."""
+    site = Site()
+    setup(httpx_mock, site)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    rollout = RebootRollout(client, "site", ["ap1", "ap2", "ap3"], wave_size=2, settle=60, interval=0)
+
+    results = [result async for result in rollout.run()]
+
+    assert [(result.devId, result.wave, result.ok) for result in results] == \
+        [("ap1", 0, True), ("ap2", 0, True), ("ap3", 1, True)]
+    assert site.events.index(("reboot", "ap3")) > 2
+    assert all(result.onlineSeconds >= 0 and result.requestSeconds >= 0 and result.rebootedAt for result in results)
+
+
+@pytest.mark.asyncio
+async def test_settle_counts_online_device_as_back(httpx_mock: HTTPXMock):
+    """A device never seen offline counts as back once `settle` seconds have passed."""
+    site = Site(downtime=0)
+    setup(httpx_mock, site, ["ap1"])
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    results = [result async for result in RebootRollout(client, "site", ["ap1"], settle=0, interval=0).run()]
+
+    assert [result.ok for result in results] == [True]
+
+
+@pytest.mark.asyncio
+async def test_failed_reboot_is_not_retried_and_halts(httpx_mock: HTTPXMock):
+    """A failed reboot request is sent once, reported and halts the remaining waves."""
+    site = Site()
+    setup(httpx_mock, site, ["ap2"])
+    httpx_mock.add_response(url=reboot_url("ap1"), method="POST", status_code=503)
+    client = ZyxelNebulaClient(api_key="dummy_api_key", retry_policy=RetryPolicy(backoff=0))
+    rollout = RebootRollout(client, "site", ["ap1", "ap2", "ap3"], wave_size=2, settle=60, interval=0)
+
+    results = {result.devId: result async for result in rollout.run()}
+
+    assert results["ap1"].error is not None
+    assert results["ap2"].ok
+    assert results["ap3"].skipped and results["ap3"].rebootedAt is None
+    assert len(httpx_mock.get_requests(url=reboot_url("ap1"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_device_not_back_times_out(httpx_mock: HTTPXMock):
+    """Devices that stay offline fail after `timeout` seconds."""
+    site = Site(downtime=10 ** 6)
+    setup(httpx_mock, site, ["ap1"])
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    now = [0.0]
+
+    def clock():
+        now[0] += 1
+        return now[0]
+
+    rollout = RebootRollout(client, "site", ["ap1"], interval=0, timeout=5, clock=clock)
+    results = [result async for result in rollout.run()]
+
+    assert len(results) == 1 and isinstance(results[0].error, TimeoutError)
+    with pytest.raises(ValueError):
+        RebootRollout(client, "site", [], wave_size=0)
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_does_not_abort_the_wave(httpx_mock: HTTPXMock):
+    """A network error while polling the online status is skipped like an unanswered poll."""
+    site = Site(downtime=0)
+    httpx_mock.add_callback(site.reboot, url=reboot_url("ap1"), method="POST")
+    httpx_mock.add_exception(httpx.ReadTimeout("timed out"), url=ONLINE_URL, method="GET")
+    httpx_mock.add_callback(site.online, url=ONLINE_URL, method="GET")
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    results = [result async for result in RebootRollout(client, "site", ["ap1"], settle=0, interval=0).run()]
+
+    assert [result.ok for result in results] == [True]
+    assert len(httpx_mock.get_requests(url=ONLINE_URL)) == 2
+
+
+@pytest.mark.asyncio
+async def test_reboot_waits_for_the_device_lock(httpx_mock: HTTPXMock):
+    """A reboot waits for other operations on its device, and the wait is not counted as request time."""
+    site = Site(downtime=0)
+    setup(httpx_mock, site, ["ap1"])
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    rollout = RebootRollout(client, "site", ["ap1"], settle=0, interval=0)
+
+    async def run():
+        return [result async for result in rollout.run()]
+
+    async with client.device_lock("site", "ap1"):
+        task = asyncio.ensure_future(run())
+        await asyncio.sleep(0.2)
+        assert site.events == []
+    results = await task
+
+    assert [result.ok for result in results] == [True]
+    assert results[0].requestSeconds < 0.2
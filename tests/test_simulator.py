@@ -0,0 +1,56 @@
+import httpx
+import pytest
+from benchmarks.simulator import NebulaSimulator, SIMULATOR_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaApiKeyError, ZyxelNebulaError, RetryPolicy, DeviceType, ClientPeriod
+
+
+def simulated_client(simulator: NebulaSimulator, **kwargs) -> ZyxelNebulaClient:
+    return ZyxelNebulaClient(api_key="key", base_url=SIMULATOR_URL,
+                             client=httpx.AsyncClient(transport=simulator), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_simulator_serves_every_endpoint():
+    """Every client method decodes the simulated responses."""
+    simulator = NebulaSimulator(sizes={"GET_SITES": 3, "GET_AP_CLIENTS_V2": 5})
+    client = simulated_client(simulator)
+
+    sites = await client.get_sites("org")
+    ap_clients = await client.get_ap_clients_v2(sites[0].siteId)
+
+    assert len({site.siteId for site in sites}) == 3
+    assert len(ap_clients.data) == 5
+    assert await client.get_groups()
+    assert await client.get_organization_info("org")
+    assert await client.get_devices_from_organization("org")
+    assert await client.get_device_firmware_status_from_site("site")
+    assert await client.get_devices_device_online_by_type("site", DeviceType.AP)
+    assert await client.get_site_vpn_status("site")
+    assert await client.get_site_clients_v2("site", ClientPeriod.field_1d)
+    assert await client.get_sw_clients_v2("site")
+    assert await client.get_gw_clients_v2("site")
+    assert await client.cable_test("site", "dev", [1])
+    assert simulator.statuses == {200: 12}
+
+
+@pytest.mark.asyncio
+async def test_simulator_throttles_and_injects_errors():
+    """Requests above the rate get 429 and injected errors surface as `ZyxelNebulaError`."""
+    throttled = simulated_client(NebulaSimulator(rate=1, burst=1))
+    await throttled.get_groups()
+    with pytest.raises(ZyxelNebulaError):
+        await throttled.get_groups()
+
+    failing = NebulaSimulator(error_rate=1)
+    with pytest.raises(ZyxelNebulaError):
+        await simulated_client(failing, retry_policy=RetryPolicy(backoff=0)).get_groups()
+    assert failing.requests["GET_GROUPS"] == 3
+
+
+@pytest.mark.asyncio
+async def test_simulator_checks_api_key():
+    """A wrong API key is rejected."""
+    client = simulated_client(NebulaSimulator(api_key="other"))
+
+    with pytest.raises(ZyxelNebulaApiKeyError):
+        await client.get_groups()
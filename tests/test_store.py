@@ -0,0 +1,120 @@
+import time
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, SnapshotStore, ResponseCache
+
+
+SITES = [{"name": "site", "siteId": "site_id", "timeZone": "UTC", "deviceCount": 1}]
+SITES_URL = BASE_URL + ENDPOINTS["GET_SITES"].format(org_id="org")
+
+
+def store_sites(store: SnapshotStore, data, age: float):
+    key = store.key("GET_SITES", SITES_URL)
+    store.set(key, data, "GET_SITES", fetched_at=time.time() - age)
+
+
+def test_store_persists_across_connections(tmp_path):
+    """Entries written by one store are read back by the next one on the same file."""
+    path = str(tmp_path / "nebula.sqlite3")
+    with SnapshotStore(path) as store:
+        store.set("key", {"a": [1, 2]}, fetched_at=10)
+
+    with SnapshotStore(path) as store:
+        assert store.get("key") == (10, {"a": [1, 2]})
+        assert store.get("other") is None
+        assert len(store) == 1
+
+
+def test_store_freshness():
+    """Snapshots are fresh within the TTL, stale within `max_stale` afterwards and expired then."""
+    store = SnapshotStore(":memory:", ttls={"GET_SITES": 60}, max_stale=120)
+    now = time.time()
+
+    assert store.freshness("GET_SITES", now - 30) is True
+    assert store.freshness("GET_SITES", now - 90) is False
+    assert store.freshness("GET_SITES", now - 200) is None
+    assert store.key("GET_GROUPS", "url") is None
+
+
+def test_store_invalidate():
+    """Responses can be dropped per endpoint or all at once, entries without an endpoint are kept."""
+    store = SnapshotStore(":memory:")
+    store.set("sites", [], "GET_SITES")
+    store.set("groups", [], "GET_GROUPS")
+    store.set("checkpoint", {"timestamp": 1})
+
+    store.invalidate("GET_SITES")
+    assert store.get("sites") is None and store.get("groups") is not None
+
+    store.invalidate()
+    assert store.get("groups") is None
+    assert store.get("checkpoint")[1] == {"timestamp": 1}
+    assert len(store) == 1
+
+
+@pytest.mark.asyncio
+async def test_fresh_snapshot_is_served_without_request(httpx_mock: HTTPXMock):
+    """A fresh snapshot is returned from disk and fills the memory cache."""
+    store = SnapshotStore(":memory:")
+    store_sites(store, SITES, age=10)
+    cache = ResponseCache()
+    client = ZyxelNebulaClient(api_key="dummy_api_key", store=store, cache=cache)
+
+    sites = await client.get_sites("org")
+
+    assert sites[0].siteId == "site_id"
+    assert len(httpx_mock.get_requests()) == 0
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_and_revalidated(httpx_mock: HTTPXMock):
+    """A stale snapshot is returned immediately and refreshed in the background."""
+    store = SnapshotStore(":memory:")
+    store_sites(store, SITES, age=7200)
+    client = ZyxelNebulaClient(api_key="dummy_api_key", store=store)
+
+    httpx_mock.add_response(url=SITES_URL, method="GET", json=[{**SITES[0], "name": "renamed"}])
+
+    sites = await client.get_sites("org")
+    assert sites[0].name == "site"
+
+    await client.wait_revalidated()
+    assert len(httpx_mock.get_requests()) == 1
+    assert store.get(store.key("GET_SITES", SITES_URL))[1][0]["name"] == "renamed"
+    assert (await client.get_sites("org"))[0].name == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_failed_revalidation_keeps_snapshot(httpx_mock: HTTPXMock):
+    """A failed background refresh keeps the stale snapshot."""
+    store = SnapshotStore(":memory:")
+    store_sites(store, SITES, age=7200)
+    client = ZyxelNebulaClient(api_key="dummy_api_key", store=store)
+
+    httpx_mock.add_response(url=SITES_URL, method="GET", status_code=503)
+
+    assert (await client.get_sites("org"))[0].name == "site"
+    await client.wait_revalidated()
+    assert store.get(store.key("GET_SITES", SITES_URL))[1] == SITES
+
+
+@pytest.mark.asyncio
+async def test_missing_or_expired_snapshot_is_fetched(httpx_mock: HTTPXMock):
+    """Without a usable snapshot the response is fetched and stored."""
+    store = SnapshotStore(":memory:", max_stale=0)
+    store_sites(store, [], age=7200)
+    client = ZyxelNebulaClient(api_key="dummy_api_key", store=store)
+
+    httpx_mock.add_response(url=SITES_URL, method="GET", json=SITES)
+
+    sites = await client.get_sites("org")
+
+    assert sites[0].siteId == "site_id"
+    assert store.get(store.key("GET_SITES", SITES_URL))[1] == SITES
+
+    httpx_mock.add_response(url=BASE_URL + ENDPOINTS["GET_GROUPS"], method="GET", status_code=500)
+    with pytest.raises(ZyxelNebulaError):
+        await client.get_groups()
+    assert store.get(store.key("GET_GROUPS", BASE_URL + ENDPOINTS["GET_GROUPS"])) is None
@@ -0,0 +1,94 @@
+import json
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client.decoders import decode
+from zyxel_nebula_client import streaming
+from zyxel_nebula_client.streaming import iter_json_array
+from zyxel_nebula_client import ZyxelNebulaClient, ZyxelNebulaError, APClients
+from tests.test_decoders import AP_CLIENTS
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def parse(document, key="data", size=1):
+    data = document if isinstance(document, bytes) else json.dumps(document, indent=1).encode()
+    return [item async for item in iter_json_array(chunked(data, size), key)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 7, 4096])
+async def test_iter_json_array(size):
+    """Items are parsed correctly regardless of how the body is split into chunks."""
+    document = {"KeyFields": ["macAddress"], "data": [
+        {"macAddress": "ä€😀", "lastSeen": 12345}, {"upload": 1.5e3, "ok": True, "none": None}, [1, [2]], 678]}
+
+    assert await parse(document, size=size) == document["data"]
+
+
+@pytest.mark.asyncio
+async def test_large_item_is_decoded_once_complete(monkeypatch):
+    """An item spanning many chunks is decoded again only once it has arrived completely."""
+    item = {"names": ['x\\"]}' * 50, "[{\u00e4"] * 100, "nested": [[{"a": "}"}]] * 100}
+    calls = []
+
+    class Decoder:
+        def raw_decode(self, text, pos):
+            calls.append(pos)
+            return json.JSONDecoder().raw_decode(text, pos)
+
+    monkeypatch.setattr(streaming, "_DECODER", Decoder())
+
+    assert await parse([item, 1], key=None, size=7) == [item, 1]
+    assert len(calls) <= 4
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("document, key, expected", [
+    ({"data": [1, 2], "KeyFields": ["macAddress"]}, "data", [1, 2]),
+    ({"KeyFields": ["macAddress"], "data": None}, "data", []),
+    ({"KeyFields": ["macAddress"]}, "data", []),
+    ({}, "data", []),
+    ({"data": []}, "data", []),
+    ([{"a": 1}, {"b": 2}], None, [{"a": 1}, {"b": 2}]),
+    ([], None, []),
+])
+async def test_iter_json_array_structure(document, key, expected):
+    """The array is found wherever it is in the object."""
+    assert await parse(document, key) == expected
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("document", [b'{"data": [1, 2', b'{"data": {}}', b'[1 2]', b'{"data": [1,]}'])
+async def test_iter_json_array_invalid(document):
+    """Malformed documents raise `JSONDecodeError`."""
+    with pytest.raises(json.JSONDecodeError):
+        await parse(document, None if document.startswith(b"[") else "data")
+
+
+@pytest.mark.asyncio
+async def test_iter_ap_clients_v2(httpx_mock: HTTPXMock):
+    """Test the `iter_ap_clients_v2` method yields the same clients as `get_ap_clients_v2`."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    endpoint = BASE_URL + ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id="site_id")
+    httpx_mock.add_response(url=endpoint, json=AP_CLIENTS, method="POST")
+
+    result = [ap_client async for ap_client in client.iter_ap_clients_v2("site_id")]
+
+    assert result == decode(APClients, AP_CLIENTS).data
+    assert json.loads(httpx_mock.get_requests()[0].content) == {"period": "2h", "featrues": ["mac_address"]}
+
+
+@pytest.mark.asyncio
+async def test_iter_site_clients_v2_error(httpx_mock: HTTPXMock):
+    """Errors are raised before any client is yielded."""
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+
+    endpoint = BASE_URL + ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id="site_id")
+    httpx_mock.add_response(url=endpoint, method="POST", status_code=500)
+
+    with pytest.raises(ZyxelNebulaError):
+        [site_client async for site_client in client.iter_site_clients_v2("site_id")]
@@ -0,0 +1,106 @@
+import pytest
+from zyxel_nebula_client.decoders import decode
+from zyxel_nebula_client import ClientInventorySync, ClientDelta, GenericClients, GWClients, APClients
+
+
+def clients(*items, key_fields=("macAddress",)) -> GenericClients:
+    return decode(GenericClients, {"KeyFields": list(key_fields), "data": list(items)})
+
+
+def client(mac, status="ONLINE", **fields):
+    return {"macAddress": mac, "status": status, **fields}
+
+
+def test_first_snapshot_adds_every_client():
+    """Without a previous snapshot every client is added."""
+    sync = ClientInventorySync()
+
+    delta = sync.update("site", clients(client("a"), client("b")))
+
+    assert [item.macAddress for item in delta.added] == ["a", "b"]
+    assert delta.removed == [] and delta.changed == []
+    assert set(sync.snapshot("site")) == {"a", "b"}
+
+
+def test_delta_reports_added_removed_and_changed_clients():
+    """Only clients that joined, left or changed are reported."""
+    sync = ClientInventorySync()
+    sync.update("site", clients(client("a"), client("b"), client("c")))
+
+    delta = sync.update("site", clients(client("a"), client("c", status="OFFLINE"), client("d")))
+
+    assert [item.macAddress for item in delta.added] == ["d"]
+    assert delta.removed == ["b"]
+    assert [item.macAddress for item in delta.changed] == ["c"]
+    assert not sync.update("site", clients(client("a"), client("c", status="OFFLINE"), client("d")))
+
+
+def test_ignored_fields_do_not_count_as_change():
+    """`lastSeen` is ignored by default and other fields can be ignored as well."""
+    sync = ClientInventorySync()
+    sync.update("site", clients(client("a", lastSeen=1, ipv4Address="10.0.0.1")))
+
+    assert not sync.update("site", clients(client("a", lastSeen=2, ipv4Address="10.0.0.1")))
+    assert sync.update("site", clients(client("a", lastSeen=2, ipv4Address="10.0.0.2"))).changed
+
+    sync = ClientInventorySync(ignore_fields={"lastSeen", "ipv4Address"})
+    sync.update("site", clients(client("a", ipv4Address="10.0.0.1")))
+    assert not sync.update("site", clients(client("a", ipv4Address="10.0.0.2")))
+
+
+def test_ap_traffic_counters_do_not_count_as_change():
+    """Growing `upload` and `download` counters of AP clients are ignored by default."""
+    def ap_clients(upload, download, channel=36):
+        return decode(APClients, {"KeyFields": ["macAddress"], "data": [{
+            "macAddress": "a", "ssid": {"name": "corp", "security": None},
+            "wifiStation": {"status": "ONLINE", "vlan": 1, "signal": -50, "band": None, "channel": channel},
+            "lastSeen": int(upload), "upload": upload, "download": download}]})
+
+    sync = ClientInventorySync()
+    sync.update("site", ap_clients(1.0, 2.0))
+
+    assert not sync.update("site", ap_clients(10.0, 20.0))
+    assert sync.update("site", ap_clients(11.0, 21.0, channel=149)).changed
+
+
+def test_snapshots_are_kept_per_site():
+    """Sites are compared with their own snapshots and can be forgotten."""
+    sync = ClientInventorySync()
+    sync.update("site1", clients(client("a")))
+    sync.update("site2", clients(client("b")))
+
+    assert sync.update("site1", clients(client("a"))) == ClientDelta(siteId="site1")
+
+    sync.forget("site1")
+    assert "site1" not in sync and "site2" in sync
+    assert len(sync.update("site1", clients(client("a"))).added) == 1
+
+
+def test_multiple_key_fields():
+    """Clients are keyed by all `KeyFields` of the response."""
+    sync = ClientInventorySync()
+    gw = {"KeyFields": ["macAddress", "interface"],
+          "data": [{"macAddress": "a", "ipv4Address": "10.0.0.1", "interface": "lan1"}]}
+    sync.update("site", decode(GWClients, gw))
+
+    gw["data"][0]["interface"] = "lan2"
+    delta = sync.update("site", decode(GWClients, gw))
+
+    assert delta.removed == [("a", "lan1")]
+    assert len(delta.added) == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_fetches_the_site():
+    """`poll` calls the fetch function with the site ID."""
+    sync = ClientInventorySync()
+    calls = []
+
+    async def fetch(site_id):
+        calls.append(site_id)
+        return clients(client("a"))
+
+    delta = await sync.poll(fetch, "site")
+
+    assert calls == ["site"]
+    assert delta.siteId == "site" and len(delta.added) == 1
@@ -0,0 +1,204 @@
+import asyncio
+import json
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from zyxel_nebula_client.consts import ENDPOINTS, BASE_URL
+from zyxel_nebula_client import ZyxelNebulaClient, SnapshotStore, EventLogTailer, EventLogSource
+
+
+GW_URL = BASE_URL + ENDPOINTS["GET_GW_EVENT_LOGS"].format(site_id="site")
+SW_URL = BASE_URL + ENDPOINTS["GET_SW_EVENT_LOGS"].format(site_id="site", device_id="dev")
+
+
+class Logs:
+    """Serves the entries within the requested range, like the event log endpoints."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.ranges = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.ranges.append((body["startTimestamp"], body["endTimestamp"]))
+        return httpx.Response(200, json=[entry for entry in self.entries
+                                         if body["startTimestamp"] <= entry["timestamp"] <= body["endTimestamp"]])
+
+
+def gw(timestamp, message="event"):
+    return {"timestamp": timestamp, "message": message}
+
+
+def sw(timestamp):
+    return {"timestamp": timestamp, "category": "PORT", "devId": "dev", "mac": "mac",
+            "message": "event", "priority": "INFO", "tag": "tag"}
+
+
+@pytest.mark.asyncio
+async def test_poll_delivers_new_entries_once(httpx_mock: HTTPXMock):
+    """Entries at the window boundary and within the overlap are not delivered twice."""
+    logs = Logs([gw(1000), gw(2000)])
+    httpx_mock.add_callback(logs, url=GW_URL, method="POST", is_reusable=True)
+    now = [3.0]
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    tailer = EventLogTailer(client, overlap=1500, lookback=3000, clock=lambda: now[0])
+    source = EventLogSource("site")
+
+    first = await tailer.poll(source)
+    assert [entry.timestamp for entry in first] == [1000, 2000]
+    assert logs.ranges[-1] == (-1500, 3000)
+
+    logs.entries += [gw(2000, "same time"), gw(3500)]
+    now[0] = 4.0
+    second = await tailer.poll(source)
+
+    assert [(entry.timestamp, entry.message) for entry in second] == [(2000, "same time"), (3500, "event")]
+    assert logs.ranges[-1] == (1500, 4000)
+    assert await tailer.poll(source) == []
+    assert tailer.checkpoint(source).timestamp == 4000
+
+
+@pytest.mark.asyncio
+async def test_identical_entries_are_each_delivered_once(httpx_mock: HTTPXMock):
+    """Identical entries are counted, so a repeated one is delivered but not fetched ones again."""
+    logs = Logs([gw(1000, "port flap"), gw(1000, "port flap")])
+    httpx_mock.add_callback(logs, url=GW_URL, method="POST", is_reusable=True)
+    now = [2.0]
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    tailer = EventLogTailer(client, overlap=5000, clock=lambda: now[0])
+    source = EventLogSource("site")
+
+    assert len(await tailer.poll(source)) == 2
+
+    logs.entries.append(gw(1000, "port flap"))
+    now[0] = 3.0
+    assert len(await tailer.poll(source)) == 1
+    assert await tailer.poll(source) == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_advances_with_second_resolution_entries(httpx_mock: HTTPXMock):
+    """The checkpoint follows the polled range even if entry timestamps are in seconds."""
+    ranges = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        ranges.append((body["startTimestamp"], body["endTimestamp"]))
+        # entries stamped in seconds, one per second of the requested range
+        return httpx.Response(200, json=[gw(second) for second in range(body["startTimestamp"] // 1000 + 1,
+                                                                         body["endTimestamp"] // 1000 + 1)])
+
+    httpx_mock.add_callback(respond, url=GW_URL, method="POST", is_reusable=True)
+    now = [100.0]
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    tailer = EventLogTailer(client, overlap=2000, lookback=10000, clock=lambda: now[0])
+    source = EventLogSource("site")
+
+    delivered = [entry.timestamp for entry in await tailer.poll(source)]
+    for _ in range(3):
+        now[0] += 5
+        delivered += [entry.timestamp for entry in await tailer.poll(source)]
+
+    assert delivered == list(range(89, 116))
+    assert ranges[-1] == (108000, 115000)
+    assert tailer.checkpoint(source).timestamp == 115000
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_survive_restarts(httpx_mock: HTTPXMock):
+    """A new tailer on the same store continues from the stored checkpoint."""
+    logs = Logs([sw(1000)])
+    httpx_mock.add_callback(logs, url=SW_URL, method="POST", is_reusable=True)
+    store = SnapshotStore(":memory:")
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    source = EventLogSource("site", "dev")
+
+    assert len(await EventLogTailer(client, store=store, clock=lambda: 2.0).poll(source)) == 1
+
+    tailer = EventLogTailer(client, store=store, clock=lambda: 2.0)
+    assert tailer.checkpoint(source).timestamp == 2000
+    assert await tailer.poll(source) == []
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_poll_is_repeated(httpx_mock: HTTPXMock):
+    """Without commit the same entries are delivered by the next poll."""
+    httpx_mock.add_callback(Logs([gw(1000)]), url=GW_URL, method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    tailer = EventLogTailer(client, clock=lambda: 2.0)
+    source = EventLogSource("site")
+
+    assert len(await tailer.poll(source, commit=False)) == 1
+    assert tailer.checkpoint(source) is None
+    assert len(await tailer.poll(source, commit=False)) == 1
+
+    tailer.commit(source)
+    assert tailer.checkpoint(source).timestamp == 2000
+    assert await tailer.poll(source) == []
+
+
+@pytest.mark.asyncio
+async def test_tail_yields_entries_of_every_source(httpx_mock: HTTPXMock):
+    """`tail` polls all sources and commits each once its entries were consumed."""
+    httpx_mock.add_callback(Logs([gw(1000)]), url=GW_URL, method="POST", is_reusable=True)
+    httpx_mock.add_callback(Logs([sw(1500)]), url=SW_URL, method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    sources = [EventLogSource("site"), EventLogSource("site", "dev")]
+    tailer = EventLogTailer(client, sources, interval=0, clock=lambda: 2.0)
+
+    received = []
+    async for source, entry in tailer.tail():
+        received.append((source.device_id, entry.timestamp))
+        if len(received) == 2:
+            break
+
+    assert sorted(received, key=str) == sorted([(None, 1000), ("dev", 1500)], key=str)
+
+
+@pytest.mark.asyncio
+async def test_tail_keeps_going_when_a_source_fails(httpx_mock: HTTPXMock):
+    """A failing source is reported and retried while the other sources are still tailed."""
+    logs = Logs([gw(1000)])
+    httpx_mock.add_callback(logs, url=GW_URL, method="POST", is_reusable=True)
+    httpx_mock.add_response(url=SW_URL, method="POST", status_code=500, is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    gateway, switch = EventLogSource("site"), EventLogSource("site", "dev")
+    now = [2.0]
+    tailer = EventLogTailer(client, [gateway, switch], interval=0, clock=lambda: now[0])
+    errors = []
+
+    received = []
+    async for source, entry in tailer.tail(on_error=lambda source, error: errors.append(source)):
+        received.append((source, entry.timestamp))
+        if len(received) == 1:
+            logs.entries.append(gw(2500))
+            now[0] = 3.0
+        else:
+            break
+
+    assert received == [(gateway, 1000), (gateway, 2500)]
+    assert errors and set(errors) == {switch}
+    assert tailer.checkpoint(switch) is None
+
+
+@pytest.mark.asyncio
+async def test_tail_logs_errors_without_handler(httpx_mock: HTTPXMock, caplog):
+    """Without `on_error` a failed poll is logged as a warning."""
+    logs = Logs([sw(1500)])
+
+    async def slow_logs(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return logs(request)
+
+    httpx_mock.add_response(url=GW_URL, method="POST", status_code=500, is_reusable=True)
+    httpx_mock.add_callback(slow_logs, url=SW_URL, method="POST", is_reusable=True)
+    client = ZyxelNebulaClient(api_key="dummy_api_key")
+    sources = [EventLogSource("site"), EventLogSource("site", "dev")]
+    tailer = EventLogTailer(client, sources, interval=0, clock=lambda: 2.0)
+
+    with caplog.at_level("WARNING", logger="zyxel_nebula_client.tail"):
+        async for source, entry in tailer.tail():
+            break
+
+    assert source.device_id == "dev"
+    assert any("event-logs:site:gw" in record.getMessage() for record in caplog.records)
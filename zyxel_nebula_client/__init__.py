@@ -1,2 +1,15 @@
 from .models import *
+from .results import *
 from .client import ZyxelNebulaClient, ZyxelNebulaApiKeyError, ZyxelNebulaError
+from .ratelimit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
+from .concurrency import AdaptiveLimiter
+from .cache import ResponseCache, DEFAULT_CACHE_TTLS
+from .json_backend import JSONBackend, ORJSON, STDLIB_JSON
+from .metrics import Metrics, Observation, OpenTelemetryExporter
+from .columnar import ColumnTable, decode_columns
+from .sync import ClientInventorySync
+from .store import SnapshotStore
+from .tail import EventLogTailer, EventLogSource, Checkpoint
+from .rollout import RebootRollout
+from .inventory import InventoryIndex, InventoryEntry, normalize_mac
@@ -0,0 +1,103 @@
+import json
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+# Time to live in seconds for the inventory endpoints, which rarely change
+DEFAULT_CACHE_TTLS = {
+    "GET_GROUPS": 3600,
+    "GET_ORGANIZATIONS_FROM_GROUP": 3600,
+    "GET_ORGANIZATIONS": 3600,
+    "GET_ORGANIZATION_INFO": 3600,
+    "GET_SITES": 3600,
+    "GET_DEVICES_FROM_ORGANIZATION": 900,
+}
+
+
+def request_key(endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None, payload: Any = None) -> Tuple:
+    """Return a hashable key identifying a request by endpoint, URL, query parameters and JSON payload."""
+    return (endpoint, url,
+            tuple(sorted((params or {}).items())),
+            json.dumps(payload, sort_keys=True) if payload is not None else None)
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache for API responses with a time to live per endpoint.
+
+    Only endpoints listed in `ttls` are cached; entries are keyed by the `ENDPOINTS` key, the URL and
+    the request parameters. The cache stores the decoded JSON bodies, so every hit is decoded into
+    fresh model instances and callers never share mutable objects. Once `maxsize` entries are stored,
+    the least recently used one is evicted.
+
+    Args:
+        ttls (Mapping[str, float]): Time to live in seconds per `ENDPOINTS` key. Defaults to
+            `DEFAULT_CACHE_TTLS`.
+        maxsize (int): The maximum number of cached responses. Defaults to 1024.
+
+    Example:
+        cache = ResponseCache(ttls={**DEFAULT_CACHE_TTLS, "GET_SITES": 600})
+        client = ZyxelNebulaClient(api_key="...", cache=cache)
+        ...
+        cache.invalidate("GET_SITES")
+    """
+
+    def __init__(self, ttls: Optional[Mapping[str, float]] = None, maxsize: int = 1024):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None, payload: Any = None) -> Optional[Hashable]:
+        """Return the cache key for a request, or `None` if the endpoint is not cached."""
+        if endpoint not in self.ttls:
+            return None
+        return request_key(endpoint, url, params, payload)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return `(True, data)` for a fresh entry and `(False, None)` otherwise."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, data = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits[key[0]] += 1
+                return True, data
+            del self._entries[key]
+        self.misses[key[0]] += 1
+        return False, None
+
+    def set(self, key: Hashable, data: Any):
+        """Store the response body for `key`."""
+        self._entries[key] = (time.monotonic() + self.ttls[key[0]], data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: Optional[str] = None, url: Optional[str] = None):
+        """
+        Drop cached responses.
+
+        Without arguments the whole cache is cleared; otherwise only entries for the given
+        `ENDPOINTS` key and/or URL are removed.
+
+        Example:
+            cache.invalidate("GET_SITES", url=BASE_URL + ENDPOINTS["GET_SITES"].format(org_id=org_id))
+        """
+        if endpoint is None and url is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries
+                    if (endpoint is None or key[0] == endpoint) and (url is None or key[1] == url)]:
+            del self._entries[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Return the hit and miss counters per endpoint."""
+        return {endpoint: {"hits": self.hits[endpoint], "misses": self.misses[endpoint]}
+                for endpoint in sorted(set(self.hits) | set(self.misses))}
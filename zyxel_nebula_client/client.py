@@ -1,9 +1,26 @@
 
+import asyncio
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
 import httpx
-from dacite import from_dict, Config
 
 from .models import *
-from .consts import BASE_URL, ENDPOINTS
+from .results import DeviceCableTestResult, DeviceOnlineState, DevicePingResult, SiteOnlineStatus, SiteResult
+from .consts import BASE_URL, DEFAULT_CONCURRENCY, DEFAULT_EVENT_LOG_WINDOW, DEFAULT_LIMITS, DEFAULT_PING_INTERVAL, DEFAULT_PING_TIMEOUT, DEFAULT_TIMEOUT, ENDPOINTS
+from .concurrency import AdaptiveLimiter, bounded_as_completed, bounded_in_order, bounded_merge
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, is_idempotent
+from .cache import ResponseCache, request_key
+from .store import SnapshotStore
+from .decoders import decode, decode_list, get_decoder
+from .streaming import iter_json_array
+from .json_backend import JSONBackend, default_json_backend
+from .metrics import Metrics
+from .compact import COMPACT_MODELS
+from .columnar import ColumnTable, decode_columns
 
 
 class ZyxelNebulaError(Exception):
@@ -19,12 +36,114 @@ class ZyxelNebulaClient:
     ZyxelNebulaClient is a client for interacting with the Zyxel Nebula API, providing methods for managing organizations, devices, sites, and clients within the Nebula ecosystem.
     """
 
-    def __init__(self, api_key: str, client: httpx.AsyncClient = None):
-        self.client = client or httpx.AsyncClient()
-        self.client.headers = {
-            "X-ZyxelNebula-API-Key": api_key
-        }
-        self.client.event_hooks['response'] = [self.raise_error]
+    def __init__(self, api_key: str, client: httpx.AsyncClient = None, compact: bool = False, rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None, cache: Optional[ResponseCache] = None, coalesce: bool = True, limits: httpx.Limits = DEFAULT_LIMITS, timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT, http2: bool = False, json_backend: Optional[JSONBackend] = None, base_url: str = BASE_URL, metrics: Optional[Metrics] = None, store: Optional[SnapshotStore] = None, adaptive_concurrency: Optional[AdaptiveLimiter] = None):
+        """
+        Initialize the client.
+
+        Args:
+            api_key (str): The Zyxel Nebula API key.
+            client (httpx.AsyncClient): An optional preconfigured HTTP client. Its headers and event 
+                hooks are kept; `limits`, `timeout` and `http2` are ignored when it is given.
+            compact (bool): Decode client lists into the slotted models from `compact`, which need
+                considerably less memory for large inventories. Defaults to `False`.
+            rate_limiter (Optional[RateLimiter]): Throttles every request sent through `client`. 
+                Defaults to no limit.
+            retry_policy (Optional[RetryPolicy]): Retries transient failures of idempotent requests. 
+                Defaults to no retries.
+            cache (Optional[ResponseCache]): Caches responses of slow-changing endpoints. 
+                Defaults to no caching.
+            coalesce (bool): Share one in-flight request between concurrent identical calls to 
+                idempotent endpoints. Defaults to `True`.
+            limits (httpx.Limits): Connection pool size and keep-alive expiry of the default HTTP client. 
+                Defaults to `DEFAULT_LIMITS`.
+            timeout (Union[float, httpx.Timeout]): Timeouts of the default HTTP client in seconds. 
+                Defaults to `DEFAULT_TIMEOUT`.
+            http2 (bool): Multiplex requests over HTTP/2 connections. Requires `httpx[http2]`. 
+                Defaults to `False`.
+            json_backend (Optional[JSONBackend]): Parses responses and serializes payloads. Defaults to 
+                `orjson` when installed and the stdlib `json` module otherwise.
+            base_url (str): The API root, e.g. a simulator for load testing. Defaults to `BASE_URL`.
+            metrics (Optional[Metrics]): Records latency, response size, decode time, item count and 
+                errors per endpoint. Defaults to no metrics.
+            store (Optional[SnapshotStore]): Persists inventory responses across restarts and serves 
+                them stale-while-revalidate. Defaults to no persistence.
+            adaptive_concurrency (Optional[AdaptiveLimiter]): Learns the concurrency of fan-out operations 
+                from the latency and errors of every request. Defaults to the fixed `DEFAULT_CONCURRENCY`.
+        """
+        self.client = client or httpx.AsyncClient(
+            limits=limits, timeout=timeout, http2=http2)
+        self.client.headers["X-ZyxelNebula-API-Key"] = api_key
+
+        event_hooks = self.client.event_hooks
+        event_hooks['request'] = [*event_hooks['request'], self.limit_rate]
+        event_hooks['response'] = [*event_hooks['response'], self.raise_error]
+        self.client.event_hooks = event_hooks
+
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.coalesce = coalesce
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        self.models = COMPACT_MODELS if compact else {}
+        self.json_backend = json_backend or default_json_backend()
+        self.base_url = base_url.rstrip("/")
+        self.metrics = metrics
+        self.store = store
+        self.adaptive_concurrency = adaptive_concurrency
+        self._revalidating: Dict[str, asyncio.Task] = {}
+        self._device_locks: Dict[Tuple[str, str], Tuple[asyncio.Lock, int]] = {}
+
+    def _model(self, data_class: type) -> type:
+        return self.models.get(data_class, data_class)
+
+    def resolve_concurrency(self, concurrency: Optional[Union[int, AdaptiveLimiter]]) -> Union[int, AdaptiveLimiter]:
+        """
+        Return the concurrency a fan-out operation should use.
+
+        Args:
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The concurrency passed to the operation.
+
+        Returns:
+            Union[int, AdaptiveLimiter]: `concurrency` if given, otherwise `adaptive_concurrency` if set
+            and `DEFAULT_CONCURRENCY` otherwise.
+        """
+        if concurrency is not None:
+            return concurrency
+        return self.adaptive_concurrency or DEFAULT_CONCURRENCY
+
+    @asynccontextmanager
+    async def device_lock(self, site_id: str, device_id: str) -> AsyncIterator[None]:
+        """
+        Hold the lock of a device, so that operations on it run one at a time.
+
+        Live tools and reboots of this client take the lock of their device, and concurrent batches on
+        the same device queue up here. The lock only exists while it is held or waited for.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            device_id (str): The unique identifier for the device.
+
+        Example:
+            async with client.device_lock("site123", "device456"):
+                await client.reboot("site123", "device456")
+        """
+        key = (site_id, device_id)
+        lock, users = self._device_locks.get(key, (None, 0))
+        lock = lock or asyncio.Lock()
+        self._device_locks[key] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._device_locks[key]
+            if users == 1:
+                del self._device_locks[key]
+            else:
+                self._device_locks[key] = (lock, users - 1)
+
+    async def limit_rate(self, request: httpx.Request):
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(request.url.path)
 
     async def raise_error(self, response: httpx.Response):
         try:
@@ -40,6 +159,211 @@ class ZyxelNebulaClient:
         except Exception as e:
             raise ConnectionError("An unexpected error occurred") from e
 
+    async def _request(self, method: str, endpoint: str, url: str, retry: Optional[bool] = None, **kwargs) -> Any:
+        """
+        Send a request to an `ENDPOINTS` entry and return the decoded JSON body.
+
+        Responses of cached endpoints are served from `cache` while fresh, then from `store`, which 
+        refreshes stale snapshots in the background. Concurrent identical requests to idempotent 
+        endpoints share one response. Failed attempts are retried according to `retry_policy`. 
+        `retry` overrides whether the policy applies to this request; pass `False` for requests that 
+        must be sent at most once.
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(endpoint, url, kwargs.get("params"), kwargs.get("json"))
+        if key is not None:
+            hit, data = self.cache.get(key)
+            if hit:
+                return data
+
+        store_key = None
+        if self.store is not None:
+            store_key = self.store.key(endpoint, url, kwargs.get("params"), kwargs.get("json"))
+        if store_key is not None:
+            snapshot = self.store.get(store_key)
+            fresh = None if snapshot is None else self.store.freshness(endpoint, snapshot[0])
+            if fresh:
+                if key is not None:
+                    self.cache.set(key, snapshot[1])
+                return snapshot[1]
+            if fresh is False:
+                self._revalidate(store_key, key, method, endpoint, url, retry, **kwargs)
+                return snapshot[1]
+
+        data = await self._fetch(method, endpoint, url, retry, **kwargs)
+        if key is not None:
+            self.cache.set(key, data)
+        if store_key is not None:
+            self.store.set(store_key, data, endpoint)
+        return data
+
+    async def _fetch(self, method: str, endpoint: str, url: str, retry: Optional[bool], **kwargs) -> Any:
+        if self.coalesce and is_idempotent(method, endpoint):
+            return await self._send_shared(method, endpoint, url, retry, **kwargs)
+        return await self._send(method, endpoint, url, retry, **kwargs)
+
+    def _revalidate(self, store_key: str, key: Optional[Tuple], method: str, endpoint: str, url: str, retry: Optional[bool], **kwargs):
+        """Refresh a stale snapshot in the background, at most once at a time per request."""
+        if store_key in self._revalidating:
+            return
+
+        async def refresh():
+            data = await self._fetch(method, endpoint, url, retry, **kwargs)
+            if key is not None:
+                self.cache.set(key, data)
+            self.store.set(store_key, data, endpoint)
+
+        task = asyncio.ensure_future(refresh())
+        self._revalidating[store_key] = task
+
+        def done(_):
+            self._revalidating.pop(store_key, None)
+            # a failed refresh keeps serving the stale snapshot until the next attempt
+            if not task.cancelled():
+                task.exception()
+        task.add_done_callback(done)
+
+    async def wait_revalidated(self):
+        """Wait until every background refresh of stale snapshots has finished, e.g. before shutting down."""
+        while self._revalidating:
+            await asyncio.wait(list(self._revalidating.values()))
+
+    async def _send_shared(self, method: str, endpoint: str, url: str, retry: Optional[bool], **kwargs) -> Any:
+        key = request_key(endpoint, url, kwargs.get("params"), kwargs.get("json"))
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._send(method, endpoint, url, retry, **kwargs))
+            self._inflight[key] = future
+
+            def done(_):
+                self._inflight.pop(key, None)
+                # mark the outcome as retrieved in case every caller was cancelled
+                if not future.cancelled():
+                    future.exception()
+            future.add_done_callback(done)
+
+        # shielded so a cancelled caller does not cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def _send(self, method: str, endpoint: str, url: str, retry: Optional[bool], **kwargs) -> Any:
+        policy = self.retry_policy
+        if retry is None:
+            retry = policy is not None and policy.applies_to(method, endpoint)
+
+        kwargs = self._encode_payload(kwargs)
+
+        metrics = self.metrics
+        limiter = self.adaptive_concurrency
+        attempt = 1
+        while True:
+            start = time.perf_counter()
+            if limiter is not None:
+                started = limiter.clock()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except (ZyxelNebulaError, httpx.TransportError) as e:
+                if limiter is not None:
+                    limiter.record(started, e)
+                if metrics is not None:
+                    metrics.observe("request_seconds", endpoint, time.perf_counter() - start)
+                    metrics.error(endpoint, e)
+                if not retry or policy is None or not policy.should_retry(e, attempt):
+                    raise
+                await asyncio.sleep(policy.delay(e, attempt))
+                attempt += 1
+                continue
+
+            if limiter is not None:
+                limiter.record(started)
+            if metrics is None:
+                return self.json_backend.loads(response.content)
+
+            metrics.observe("request_seconds", endpoint, time.perf_counter() - start)
+            metrics.observe("response_bytes", endpoint, len(response.content))
+            start = time.perf_counter()
+            data = self.json_backend.loads(response.content)
+            metrics.observe("parse_seconds", endpoint, time.perf_counter() - start)
+            return data
+
+    def _decode(self, endpoint: str, data_class: type, data: Any) -> Any:
+        """Decode a response body into `data_class`, recording the decode time with `metrics`."""
+        if self.metrics is None:
+            return decode(data_class, data)
+        start = time.perf_counter()
+        result = decode(data_class, data)
+        items = data.get("data") if isinstance(data, dict) else None
+        self._observe_decode(endpoint, start, len(items) if isinstance(items, list) else 1)
+        return result
+
+    def _decode_list(self, endpoint: str, data_class: type, items: List[Any]) -> List[Any]:
+        """Decode a list of items into `data_class`, recording the decode time with `metrics`."""
+        if self.metrics is None:
+            return decode_list(data_class, items)
+        start = time.perf_counter()
+        result = decode_list(data_class, items)
+        self._observe_decode(endpoint, start, len(result))
+        return result
+
+    def _decode_columns(self, endpoint: str, data_class: type, data: Dict[str, Any]) -> ColumnTable:
+        """Decode the `data` member of a client list response column by column."""
+        if self.metrics is None:
+            return decode_columns(data_class, data.get("data"))
+        start = time.perf_counter()
+        table = decode_columns(data_class, data.get("data"))
+        self._observe_decode(endpoint, start, len(table))
+        return table
+
+    def _observe_decode(self, endpoint: str, start: float, items: int):
+        self.metrics.observe("decode_seconds", endpoint, time.perf_counter() - start)
+        self.metrics.observe("items", endpoint, items)
+
+    def _encode_payload(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Serialize a `json` request argument with `json_backend`."""
+        if "json" not in kwargs:
+            return kwargs
+        kwargs = dict(kwargs)
+        kwargs["content"] = self.json_backend.dumps(kwargs.pop("json"))
+        kwargs["headers"] = {**kwargs.get("headers", {}), "Content-Type": "application/json"}
+        return kwargs
+
+    async def _stream(self, method: str, endpoint: str, url: str, data_class: type, key: Optional[str] = "data", **kwargs) -> AsyncIterator[Any]:
+        """
+        Send a request and decode the items of a JSON array in the response body while it streams in.
+        `null` items are skipped.
+
+        Streamed requests bypass the cache, request coalescing and retries. With `metrics`, the request 
+        latency is the time until the response headers arrived.
+        """
+        decoder = get_decoder(self._model(data_class))
+        metrics = self.metrics
+        if metrics is None:
+            async with self.client.stream(method, url, **self._encode_payload(kwargs)) as response:
+                async for item in iter_json_array(response.aiter_bytes(), key):
+                    if item is not None:
+                        yield decoder(item)
+            return
+
+        start = time.perf_counter()
+        try:
+            async with self.client.stream(method, url, **self._encode_payload(kwargs)) as response:
+                metrics.observe("request_seconds", endpoint, time.perf_counter() - start)
+                items, decoding = 0, 0.0
+                async for item in iter_json_array(response.aiter_bytes(), key):
+                    if item is None:
+                        continue
+                    start = time.perf_counter()
+                    item = decoder(item)
+                    decoding += time.perf_counter() - start
+                    items += 1
+                    yield item
+        except (ZyxelNebulaError, httpx.TransportError) as e:
+            metrics.error(endpoint, e)
+            raise
+        metrics.observe("response_bytes", endpoint, response.num_bytes_downloaded)
+        metrics.observe("decode_seconds", endpoint, decoding)
+        metrics.observe("items", endpoint, items)
+
     async def get_groups(self) -> List[Group]:
         """
         Retrieve a list of groups available in the Zyxel Nebula platform.
@@ -56,12 +380,10 @@ class ZyxelNebulaClient:
         Example:
             groups = await get_groups()
         """
-        url = BASE_URL + ENDPOINTS["GET_GROUPS"]
+        url = self.base_url + ENDPOINTS["GET_GROUPS"]
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=Group, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_GROUPS", url)
+        return self._decode_list("GET_GROUPS", Group, data)
 
     async def get_organizations_from_group(self, group_id: str) -> List[OrgBaseInfo]:
         """
@@ -83,13 +405,11 @@ class ZyxelNebulaClient:
         Example:
             organizations = await get_organizations_from_group(group_id="group123")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_ORGANIZATIONS_FROM_GROUP"].format(group_id=group_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=OrgBaseInfo, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_ORGANIZATIONS_FROM_GROUP", url)
+        return self._decode_list("GET_ORGANIZATIONS_FROM_GROUP", OrgBaseInfo, data)
 
     async def get_organizations(self) -> List[OrgBaseInfo]:
         """
@@ -107,12 +427,10 @@ class ZyxelNebulaClient:
         Example:
             organizations = await get_organizations()
         """
-        url = BASE_URL + ENDPOINTS["GET_ORGANIZATIONS"]
+        url = self.base_url + ENDPOINTS["GET_ORGANIZATIONS"]
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=OrgBaseInfo, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_ORGANIZATIONS", url)
+        return self._decode_list("GET_ORGANIZATIONS", OrgBaseInfo, data)
 
     async def get_organization_info(self, org_id: str) -> Org:
         """
@@ -134,13 +452,11 @@ class ZyxelNebulaClient:
         Example:
             organization_info = await get_organization_info(org_id="org123")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_ORGANIZATION_INFO"].format(org_id=org_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=Org, data=data, config=Config(cast=[Enum]))
+        data = await self._request("GET", "GET_ORGANIZATION_INFO", url)
+        return self._decode("GET_ORGANIZATION_INFO", Org, data)
 
     async def get_sites(self, org_id: str) -> List[Site]:
         """
@@ -162,19 +478,18 @@ class ZyxelNebulaClient:
         Example:
             sites = await get_sites(org_id="org123")
         """
-        url = BASE_URL + ENDPOINTS["GET_SITES"].format(org_id=org_id)
+        url = self.base_url + ENDPOINTS["GET_SITES"].format(org_id=org_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=Site, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_SITES", url)
+        return self._decode_list("GET_SITES", Site, data)
 
     async def get_devices_from_organization(self, org_id: str) -> List[Device]:
         """
         Retrieve a list of devices associated with a specified organization.
 
         This asynchronous method constructs a URL using the provided organization ID, sends a GET request 
-        to retrieve the devices, and returns a list of `Device` objects representing the devices.
+        to retrieve the devices, and returns a list of `Device` objects representing the devices of all 
+        sites. Use `get_sites_devices_from_organization` to keep the site of each device.
 
         Args:
             org_id (str): The unique identifier for the organization.
@@ -189,13 +504,61 @@ class ZyxelNebulaClient:
         Example:
             devices = await get_devices_from_organization(org_id="org123")
         """
-        url = BASE_URL + \
+        sites = await self.get_sites_devices_from_organization(org_id)
+        return [device for site in sites for device in site.devices if device is not None]
+
+    async def get_sites_devices_from_organization(self, org_id: str) -> List[SitesDevices]:
+        """
+        Retrieve the devices associated with a specified organization, grouped by site.
+
+        Sends the same request as `get_devices_from_organization` and returns one `SitesDevices` object 
+        per site, which keeps the site ID of the devices.
+
+        Args:
+            org_id (str): The unique identifier for the organization.
+
+        Returns:
+            List[SitesDevices]: The devices of each site of the organization.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status code indicates an error.
+
+        Example:
+            for site in await get_sites_devices_from_organization(org_id="org123"):
+                print(site.siteId, len(site.devices))
+        """
+        url = self.base_url + \
             ENDPOINTS["GET_DEVICES_FROM_ORGANIZATION"].format(org_id=org_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=Device, data=item, config=Config(cast=[Enum])) for item in data[0]["devices"]]
+        data = await self._request("GET", "GET_DEVICES_FROM_ORGANIZATION", url)
+        return self._decode_list("GET_DEVICES_FROM_ORGANIZATION", SitesDevices, [site for site in data if site is not None])
+
+    async def iter_sites_devices_from_organization(self, org_id: str) -> AsyncIterator[SitesDevices]:
+        """
+        Retrieve the devices associated with a specified organization site by site while the response streams in.
+
+        For organizations with hundreds of sites, each site is decoded and yielded as soon as it has 
+        been received, so processing overlaps the download and only one site is held in memory at a time. 
+        Streamed requests bypass the cache, request coalescing and retries.
+
+        Args:
+            org_id (str): The unique identifier for the organization.
+
+        Yields:
+            SitesDevices: The devices of each site of the organization, in response order.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status code indicates an error.
+
+        Example:
+            async for site in client.iter_sites_devices_from_organization(org_id="org123"):
+                index.add_devices(site.devices, site.siteId)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_DEVICES_FROM_ORGANIZATION"].format(org_id=org_id)
+
+        async for site in self._stream("GET", "GET_DEVICES_FROM_ORGANIZATION", url, SitesDevices, key=None):
+            yield site
 
     async def get_device_firmware_status_from_organization(self, org_id: str) -> List[DeviceFirmwareStatus]:
         """
@@ -218,14 +581,12 @@ class ZyxelNebulaClient:
         Example:
             firmware_status_list = await get_device_firmware_status_from_organization(org_id="org123")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_DEVICE_FIRMWARE_STATUS_FROM_ORGANIZATION"].format(
                 org_id=org_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=DeviceFirmwareStatus, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_DEVICE_FIRMWARE_STATUS_FROM_ORGANIZATION", url)
+        return self._decode_list("GET_DEVICE_FIRMWARE_STATUS_FROM_ORGANIZATION", DeviceFirmwareStatus, data)
 
     async def get_device_firmware_status_from_site(self, site_id: str) -> List[DeviceFirmwareStatus]:
         """
@@ -248,14 +609,12 @@ sensor
         Example:
             firmware_status_list = await get_device_firmware_status_from_site(site_id="site123")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_DEVICE_FIRMWARE_STATUS_FROM_SITE"].format(
                 site_id=site_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=DeviceFirmwareStatus, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_DEVICE_FIRMWARE_STATUS_FROM_SITE", url)
+        return self._decode_list("GET_DEVICE_FIRMWARE_STATUS_FROM_SITE", DeviceFirmwareStatus, data)
 
     async def get_devices_device_online_by_type(self, site_id: str, device_type: DeviceType) -> List[DeviceOnlineStatus]:
         """
@@ -279,16 +638,14 @@ sensor
         Example:
             online_status = await get_devices_device_online_by_type(site_id="site123", device_type=DeviceType.switch)
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_DEVICES_ONLINE_BY_TYPE"].format(
                 site_id=site_id)
 
         params = {'type': device_type.value}
 
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=DeviceOnlineStatus, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("GET", "GET_DEVICES_ONLINE_BY_TYPE", url, params=params)
+        return self._decode_list("GET_DEVICES_ONLINE_BY_TYPE", DeviceOnlineStatus, data)
 
     async def get_site_vpn_status(self, site_id: str) -> SiteVPNStatus:
         """
@@ -311,14 +668,12 @@ sensor
         Example:
             vpn_status = await get_site_vpn_status(site_id="site123")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_SITE_VPN_STATUS"].format(
                 site_id=site_id)
 
-        response = await self.client.get(url)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=SiteVPNStatus, data=data, config=Config(cast=[Enum]))
+        data = await self._request("GET", "GET_SITE_VPN_STATUS", url)
+        return self._decode("GET_SITE_VPN_STATUS", SiteVPNStatus, data)
 
     async def get_site_clients(self, site_id: str, attributes: List[ClientAttributesReq] = [ClientAttributesReq.mac_address]) -> List[GenericClient]:
         """
@@ -343,14 +698,12 @@ sensor
         Example:
             site_clients_data = await get_site_clients(site_id="site123", attributes=[ClientAttributesReq.ip_address, ClientAttributesReq.device_name])
         """
-        url = BASE_URL + ENDPOINTS["GET_SITE_CLIENTS"].format(site_id=site_id)
+        url = self.base_url + ENDPOINTS["GET_SITE_CLIENTS"].format(site_id=site_id)
 
         payload = [attr.value for attr in attributes] if attributes else []
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=GenericClient, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("POST", "GET_SITE_CLIENTS", url, json=payload)
+        return self._decode_list("GET_SITE_CLIENTS", self._model(GenericClient), data)
 
     async def get_ap_clients(self, site_id: str, attributes: List[APClientAttributesReq] = [APClientAttributesReq.mac_address]) -> List[APClient]:
         """
@@ -375,16 +728,14 @@ sensor
         Example:
             ap_clients_data = await get_ap_clients(site_id="site123", attributes=[APClientAttributesReq.ip_address, APClientAttributesReq.device_name])
         """
-        url = BASE_URL + ENDPOINTS["GET_AP_CLIENTS"].format(site_id=site_id)
+        url = self.base_url + ENDPOINTS["GET_AP_CLIENTS"].format(site_id=site_id)
 
         payload = [attr.value for attr in attributes] if attributes else []
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=APClient, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("POST", "GET_AP_CLIENTS", url, json=payload)
+        return self._decode_list("GET_AP_CLIENTS", self._model(APClient), data)
 
-    async def ping(self, site_id: str, device_id: str, target: str) -> PingResp:
+    async def ping(self, site_id: str, device_id: str, target: str, token: Optional[str] = None) -> PingResp:
         """
         Sends a ping request to a specified target from a device within a site.
 
@@ -396,6 +747,8 @@ sensor
             site_id (str): The unique identifier for the site.
             device_id (str): The unique identifier for the device.
             target (str): The target address (e.g., IP or hostname) to ping.
+            token (Optional[str]): The token of a running ping returned by the previous call, to poll
+                its progress instead of starting a new ping.
 
         Returns:
             PingResp: An instance of `PingResp` containing the response data from the ping request.
@@ -406,16 +759,106 @@ sensor
         Example:
             response = await ping(site_id="site123", device_id="device456", target="192.168.1.1")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["PING"].format(
                 site_id=site_id, device_id=device_id)
 
         payload = {'target': target}
+        if token is not None:
+            payload['token'] = token
+
+        data = await self._request("POST", "PING", url, json=payload)
+        return self._decode("PING", PingResp, data)
+
+    async def iter_ping(self, site_id: str, device_id: str, target: str, interval: float = DEFAULT_PING_INTERVAL,
+                        timeout: Optional[float] = DEFAULT_PING_TIMEOUT) -> AsyncIterator[PingResult]:
+        """
+        Pings a target from a device and yields the results as the device reports them.
+
+        Starts the ping, then polls it with the returned token every `interval` seconds until it
+        reports `isDone`. Every poll returns the results collected so far, so only results with a
+        sequence number not yielded before are passed on.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            device_id (str): The unique identifier for the device.
+            target (str): The target address (e.g., IP or hostname) to ping.
+            interval (float): Seconds between polls. Defaults to `DEFAULT_PING_INTERVAL`.
+            timeout (Optional[float]): Seconds until the ping must be done, `None` to wait indefinitely.
+                Defaults to `DEFAULT_PING_TIMEOUT`.
+
+        Yields:
+            PingResult: Each result of the ping, in the order reported by the device.
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=PingResp, data=data, config=Config(cast=[Enum]))
+        Raises:
+            TimeoutError: If the ping is not done within `timeout` seconds.
+            ZyxelNebulaError: If a request fails, or the ping is not done but no token was returned to poll it.
+
+        Example:
+            async for result in client.iter_ping("site123", "device456", "192.168.1.1", interval=0.5):
+                print(result.seq, result.elapsedTime)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        seen = set()
+        token = None
+
+        while True:
+            response = await self.ping(site_id, device_id, target, token=token)
+            for result in response.results or ():
+                if result.seq not in seen:
+                    seen.add(result.seq)
+                    yield result
+            if response.isDone:
+                return
+
+            token = response.token or token
+            if token is None:
+                # polling without a token would start another ping on every poll
+                raise ZyxelNebulaError(f"Ping of {target} from {device_id} not done but no token returned")
+            if deadline is not None and loop.time() + interval > deadline:
+                raise TimeoutError(f"Ping of {target} from {device_id} not done within {timeout} seconds")
+            await asyncio.sleep(interval)
+
+    async def ping_devices(self, pings: Iterable[Tuple[str, str, str]], interval: float = DEFAULT_PING_INTERVAL,
+                           timeout: Optional[float] = DEFAULT_PING_TIMEOUT, concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                           return_exceptions: bool = False) -> AsyncIterator[DevicePingResult]:
+        """
+        Pings from many devices concurrently and yields the results of all of them as they arrive.
+
+        Each ping is run like `iter_ping`, with at most `concurrency` pings running at the same time. The
+        results of the running pings are interleaved in arrival order.
+
+        Args:
+            pings (Iterable[Tuple[str, str, str]]): The site ID, device ID and target of each ping.
+            interval (float): Seconds between polls of a ping. Defaults to `DEFAULT_PING_INTERVAL`.
+            timeout (Optional[float]): Seconds until each ping must be done. Defaults to `DEFAULT_PING_TIMEOUT`.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of pings running at the
+                same time. Defaults to the client's `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY`
+                otherwise.
+            return_exceptions (bool): Yield a failed or timed out ping as a `DevicePingResult` with `error`
+                set instead of raising the error and cancelling the other pings.
+
+        Yields:
+            DevicePingResult: Each result with the site, device and target it belongs to.
+
+        Example:
+            pings = [(site_id, device_id, "8.8.8.8") for device_id in device_ids]
+            async for item in client.ping_devices(pings, timeout=30, return_exceptions=True):
+                print(item.devId, item.error or item.result.elapsedTime)
+        """
+        async def run(ping: Tuple[str, str, str]) -> AsyncIterator[DevicePingResult]:
+            site_id, device_id, target = ping
+            try:
+                async for result in self.iter_ping(site_id, device_id, target, interval, timeout):
+                    yield DevicePingResult(siteId=site_id, devId=device_id, target=target, result=result)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                yield DevicePingResult(siteId=site_id, devId=device_id, target=target, error=e)
+
+        async for _, item in bounded_merge(run, pings, self.resolve_concurrency(concurrency)):
+            yield item
 
     async def reboot(self, site_id: str, device_id: str) -> GenericResp:
         """
@@ -438,14 +881,12 @@ sensor
         Example:
             response = await reboot(site_id="site123", device_id="device456")
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["REBOOT"].format(
                 site_id=site_id, device_id=device_id)
 
-        response = await self.client.post(url)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=GenericResp, data=data, config=Config(cast=[Enum]))
+        data = await self._request("POST", "REBOOT", url, retry=False)
+        return self._decode("REBOOT", GenericResp, data)
 
     async def cable_test(self, site_id: str, device_id: str, ports: List[int]) -> CableTestResp:
         """
@@ -469,16 +910,92 @@ sensor
         Example:
             response = await cable_test(site_id="site123", device_id="device456", ports=[1, 2, 3])
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["CABLE_TEST"].format(
                 site_id=site_id, device_id=device_id)
 
         payload = {'ports': ports}
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=CableTestResp, data=data, config=Config(cast=[Enum]))
+        data = await self._request("POST", "CABLE_TEST", url, json=payload)
+        return self._decode("CABLE_TEST", CableTestResp, data)
+
+    async def cable_test_site(self, site_id: str, ports: Union[List[int], Mapping[str, List[int]]], device_ids: Optional[Iterable[str]] = None,
+                              ports_per_test: Optional[int] = None, concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                              return_exceptions: bool = False) -> AsyncIterator[DeviceCableTestResult]:
+        """
+        Runs cable tests on many switches of a site concurrently and yields the port results as they arrive.
+
+        Without `device_ids` the online switches of the site are tested, and every other switch of the
+        site is yielded once as `skipped`. Up to `concurrency` switches
+        are tested at the same time, while the tests of one switch always run one after another, also
+        across concurrent calls of this client, since a switch runs a single cable test at a time.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            ports (Union[List[int], Mapping[str, List[int]]]): The ports to test on every switch, or the
+                ports per device ID. Devices missing from a mapping are skipped.
+            device_ids (Optional[Iterable[str]]): The switches to test. Defaults to the online switches
+                of the site, the switches not reported online being skipped.
+            ports_per_test (Optional[int]): Split the ports of a switch into tests of this many ports, so
+                results arrive while the switch is still testing. Defaults to one test per switch.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of switches tested at
+                the same time. Defaults to the client's `adaptive_concurrency` if set and 
+                `DEFAULT_CONCURRENCY` otherwise.
+            return_exceptions (bool): Yield a failed test as a `DeviceCableTestResult` with `error` set
+                instead of raising the error and cancelling the other tests.
+
+        Yields:
+            DeviceCableTestResult: Each port result with its switch and the duration of its test, and each
+            skipped switch.
+
+        Raises:
+            ValueError: If `ports_per_test` is less than 1.
+
+        Example:
+            async for item in client.cable_test_site("site123", ports=list(range(1, 25)), ports_per_test=8):
+                print(item.devId, item.result.port, item.elapsed)
+        """
+        if ports_per_test is not None and ports_per_test < 1:
+            raise ValueError("ports_per_test must be at least 1")
+
+        def planned(device_ids: Iterable[str]) -> List[Tuple[str, List[int]]]:
+            if isinstance(ports, Mapping):
+                return [(device_id, list(ports[device_id])) for device_id in device_ids if device_id in ports]
+            return [(device_id, list(ports)) for device_id in device_ids]
+
+        if device_ids is None:
+            statuses = await self.get_devices_device_online_by_type(site_id, DeviceType.SW)
+            device_ids = [status.devId for status in statuses if status.currentStatus == OnlineOffline.ONLINE]
+            offline = [status.devId for status in statuses if status.currentStatus != OnlineOffline.ONLINE]
+            for device_id, device_ports in planned(offline):
+                yield DeviceCableTestResult(siteId=site_id, devId=device_id, ports=device_ports, started=time.time(),
+                                            elapsed=0.0, skipped=True)
+
+        tests = planned(device_ids)
+
+        async def run(test: Tuple[str, List[int]]) -> AsyncIterator[DeviceCableTestResult]:
+            device_id, device_ports = test
+            size = ports_per_test or len(device_ports) or 1
+            async with self.device_lock(site_id, device_id):
+                for i in range(0, len(device_ports), size):
+                    chunk = device_ports[i:i + size]
+                    started = time.time()
+                    start = time.perf_counter()
+                    try:
+                        response = await self.cable_test(site_id, device_id, chunk)
+                    except Exception as e:
+                        if not return_exceptions:
+                            raise
+                        yield DeviceCableTestResult(siteId=site_id, devId=device_id, ports=chunk, started=started,
+                                                    elapsed=time.perf_counter() - start, error=e)
+                        continue
+                    elapsed = time.perf_counter() - start
+                    for result in response.ports:
+                        yield DeviceCableTestResult(siteId=site_id, devId=device_id, ports=chunk, started=started,
+                                                    elapsed=elapsed, result=result)
+
+        async for _, item in bounded_merge(run, tests, self.resolve_concurrency(concurrency)):
+            yield item
 
     async def connectivity(self, site_id: str, device_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h) -> List[Connectivity]:
         """
@@ -503,16 +1020,76 @@ sensor
         Example:
             connectivity_data = await connectivity(site_id="site123", device_id="device456", period=ClientPeriod.field_1h)
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["CONNECTIVITY"].format(
                 site_id=site_id, device_id=device_id)
 
         payload = {'period': period.value}
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return [from_dict(data_class=Connectivity, data=item, config=Config(cast=[Enum])) for item in data]
+        data = await self._request("POST", "CONNECTIVITY", url, json=payload)
+        return self._decode_list("CONNECTIVITY", Connectivity, data)
+
+    async def get_sw_event_logs(self, site_id: str, device_id: str, start: int, end: int) -> List[SWEventLogEntry]:
+        """
+        Retrieves the event logs of a switch within a time range.
+
+        This asynchronous method constructs a URL using the provided site ID and device ID, 
+        sends a POST request with the time range in the payload, and returns a list of 
+        `SWEventLogEntry` objects. Use `iter_sw_event_logs` for ranges of hours or days.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            device_id (str): The unique identifier for the switch.
+            start (int): The start of the time range as Unix timestamp in milliseconds.
+            end (int): The end of the time range as Unix timestamp in milliseconds.
+
+        Returns:
+            List[SWEventLogEntry]: A list of `SWEventLogEntry` instances in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            logs = await get_sw_event_logs(site_id="site123", device_id="device456", start=1700000000000, end=1700003600000)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_SW_EVENT_LOGS"].format(
+                site_id=site_id, device_id=device_id)
+
+        payload = {"startTimestamp": start, "endTimestamp": end}
+
+        data = await self._request("POST", "GET_SW_EVENT_LOGS", url, json=payload)
+        return self._decode_list("GET_SW_EVENT_LOGS", SWEventLogEntry, data)
+
+    async def get_gw_event_logs(self, site_id: str, start: int, end: int) -> List[GWEventLogEntry]:
+        """
+        Retrieves the event logs of the gateway of a site within a time range.
+
+        This asynchronous method constructs a URL using the provided site ID, sends a POST request 
+        with the time range in the payload, and returns a list of `GWEventLogEntry` objects. 
+        Use `iter_gw_event_logs` for ranges of hours or days.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            start (int): The start of the time range as Unix timestamp in milliseconds.
+            end (int): The end of the time range as Unix timestamp in milliseconds.
+
+        Returns:
+            List[GWEventLogEntry]: A list of `GWEventLogEntry` instances in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            logs = await get_gw_event_logs(site_id="site123", start=1700000000000, end=1700003600000)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_GW_EVENT_LOGS"].format(site_id=site_id)
+
+        payload = {"startTimestamp": start, "endTimestamp": end}
+
+        data = await self._request("POST", "GET_GW_EVENT_LOGS", url, json=payload)
+        return self._decode_list("GET_GW_EVENT_LOGS", GWEventLogEntry, data)
 
     async def get_site_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[ClientAttributesReq]] = [ClientAttributesReq.mac_address], ) -> GenericClients:
         """
@@ -538,7 +1115,7 @@ sensor
         Example:
             clients_data = await get_site_clients_v2(site_id="site123", period=ClientPeriod.field_1h, features=[ClientAttributesReq.ip_address, ClientAttributesReq.device_name])
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id=site_id)
 
         payload = {
@@ -546,10 +1123,8 @@ sensor
             "featrues": [attr.value for attr in features] if features else []
         }
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=GenericClients, data=data, config=Config(cast=[Enum]))
+        data = await self._request("POST", "GET_SITE_CLIENTS_V2", url, json=payload)
+        return self._decode("GET_SITE_CLIENTS_V2", self._model(GenericClients), data)
 
     async def get_ap_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[APClientAttributesReqV2]] = [APClientAttributesReqV2.mac_address], ) -> APClients:
         """
@@ -575,7 +1150,7 @@ sensor
         Example:
             ap_clients_data = await get_ap_clients_v2(site_id="site123", period=ClientPeriod.field_1h, features=[APClientAttributesReqV2.ip_address, APClientAttributesReqV2.device_name])
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id=site_id)
 
         payload = {
@@ -583,10 +1158,8 @@ sensor
             "featrues": [attr.value for attr in features] if features else []
         }
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=APClients, data=data, config=Config(cast=[Enum]))
+        data = await self._request("POST", "GET_AP_CLIENTS_V2", url, json=payload)
+        return self._decode("GET_AP_CLIENTS_V2", self._model(APClients), data)
 
     async def get_sw_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[SWClientAttributesReq]] = [SWClientAttributesReq.mac_address], ) -> SWClients:
         """
@@ -612,7 +1185,7 @@ sensor
         Example:
             sw_clients_data = await get_sw_clients_v2(site_id="site123", period=ClientPeriod.field_1h, features=[SWClientAttributesReq.ip_address, SWClientAttributesReq.device_name])
         """
-        url = BASE_URL + \
+        url = self.base_url + \
             ENDPOINTS["GET_SW_CLIENTS_V2"].format(site_id=site_id)
 
         payload = {
@@ -620,10 +1193,8 @@ sensor
             "featrues": [attr.value for attr in features] if features else []
         }
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=SWClients, data=data, config=Config(cast=[Enum]))
+        data = await self._request("POST", "GET_SW_CLIENTS_V2", url, json=payload)
+        return self._decode("GET_SW_CLIENTS_V2", self._model(SWClients), data)
 
     async def get_gw_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[GWClientAttributesReq]] = [GWClientAttributesReq.mac_address], ) -> GWClients:
         """
@@ -649,7 +1220,321 @@ sensor
         Example:
             gw_clients_data = await get_gw_clients_v2(site_id="site123", period=ClientPeriod.field_1h, features=[GWClientAttributesReq.ip_address, GWClientAttributesReq.device_name])
         """
-        url = BASE_URL + \
+        url = self.base_url + \
+            ENDPOINTS["GET_GW_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        data = await self._request("POST", "GET_GW_CLIENTS_V2", url, json=payload)
+        return self._decode("GET_GW_CLIENTS_V2", self._model(GWClients), data)
+
+    async def crawl_organization(self, org_id: str, fetch: Callable[[str], Awaitable[Any]] = None, concurrency: Optional[Union[int, AdaptiveLimiter]] = None, return_exceptions: bool = False) -> AsyncIterator[SiteResult]:
+        """
+        Fetch data for every site of an organization concurrently, yielding results as they finish.
+
+        This asynchronous generator retrieves the sites of the organization and calls `fetch` with 
+        each site ID, keeping at most `concurrency` requests in flight.
+
+        Args:
+            org_id (str): The unique identifier for the organization.
+            fetch (Callable[[str], Awaitable[Any]]): A coroutine function called with each site ID. 
+                Defaults to `get_site_clients_v2`.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of concurrent site requests. 
+                Defaults to `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+            return_exceptions (bool): Yield failed sites with `SiteResult.error` set instead of raising. 
+                Defaults to `False`.
+
+        Yields:
+            SiteResult: The site together with the value returned by `fetch`, in completion order.
+
+        Raises:
+            ZyxelNebulaError: If a request fails and `return_exceptions` is `False`.
+
+        Example:
+            async for site_result in crawl_organization(org_id="org123", fetch=get_ap_clients_v2):
+                print(site_result.site.name, site_result.result)
+        """
+        concurrency = self.resolve_concurrency(concurrency)
+        sites = [(org_id, site) for site in await self.get_sites(org_id)]
+        async for result in self._crawl_sites(sites, fetch, concurrency, return_exceptions):
+            yield result
+
+    async def crawl_group(self, group_id: str, fetch: Callable[[str], Awaitable[Any]] = None, concurrency: Optional[Union[int, AdaptiveLimiter]] = None, return_exceptions: bool = False) -> AsyncIterator[SiteResult]:
+        """
+        Fetch data for every site of every organization within a group concurrently.
+
+        This asynchronous generator retrieves the organizations of the group and their sites, then 
+        calls `fetch` with each site ID, keeping at most `concurrency` requests in flight.
+
+        Args:
+            group_id (str): The unique identifier for the group.
+            fetch (Callable[[str], Awaitable[Any]]): A coroutine function called with each site ID. 
+                Defaults to `get_site_clients_v2`.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of concurrent requests. 
+                Defaults to `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+            return_exceptions (bool): Yield failed sites with `SiteResult.error` set instead of raising. 
+                An organization whose sites cannot be retrieved is yielded once with `site` set to `None`. 
+                Defaults to `False`.
+
+        Yields:
+            SiteResult: The site together with the value returned by `fetch`, in completion order.
+
+        Raises:
+            ZyxelNebulaError: If a request fails and `return_exceptions` is `False`.
+
+        Example:
+            async for site_result in crawl_group(group_id="group123", concurrency=20):
+                print(site_result.orgId, site_result.site.name, site_result.result)
+        """
+        concurrency = self.resolve_concurrency(concurrency)
+        organizations = await self.get_organizations_from_group(group_id)
+
+        sites = []
+        async for org, task in bounded_as_completed(self.get_sites, [org.orgId for org in organizations], concurrency):
+            error = task.exception()
+            if error is None:
+                sites.extend((org, site) for site in task.result())
+            elif return_exceptions:
+                yield SiteResult(orgId=org, site=None, error=error)
+            else:
+                raise error
+
+        async for result in self._crawl_sites(sites, fetch, concurrency, return_exceptions):
+            yield result
+
+    async def _crawl_sites(self, sites: Iterable[Tuple[str, Site]], fetch: Callable[[str], Awaitable[Any]], concurrency: Union[int, AdaptiveLimiter], return_exceptions: bool) -> AsyncIterator[SiteResult]:
+        fetch = fetch or self.get_site_clients_v2
+
+        async for (org_id, site), task in bounded_as_completed(lambda pair: fetch(pair[1].siteId), sites, concurrency):
+            error = task.exception()
+            if error is not None and not return_exceptions:
+                raise error
+            yield SiteResult(orgId=org_id, site=site, result=None if error else task.result(), error=error)
+
+    async def get_site_online_status(self, site_id: str, device_types: Iterable[DeviceType] = tuple(DeviceType),
+                                     concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                                     return_exceptions: bool = False) -> SiteOnlineStatus:
+        """
+        Retrieve the online status of the devices of every type within a site.
+
+        Requests the online status of each device type concurrently and merges the responses.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            device_types (Iterable[DeviceType]): The device types to request. Defaults to all of them.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of requests in flight.
+                Defaults to the client's `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+            return_exceptions (bool): Record a failed request in `errors` instead of raising it.
+
+        Returns:
+            SiteOnlineStatus: The merged online status of the site.
+
+        Example:
+            status = await client.get_site_online_status("site123")
+            offline = [dev_id for dev_id, state in status.statuses.items() if state == OnlineOffline.OFFLINE]
+        """
+        async for status in self.iter_sites_online_status([site_id], device_types, concurrency, return_exceptions):
+            return status
+
+    async def iter_sites_online_status(self, site_ids: Iterable[str], device_types: Iterable[DeviceType] = tuple(DeviceType),
+                                       concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                                       return_exceptions: bool = False) -> AsyncIterator[SiteOnlineStatus]:
+        """
+        Retrieve the online status of the devices of every type within many sites.
+
+        The requests for every site and device type share one pool of at most `concurrency` requests,
+        and each site is yielded as soon as all of its device types have been fetched.
+
+        Args:
+            site_ids (Iterable[str]): The unique identifiers of the sites.
+            device_types (Iterable[DeviceType]): The device types to request. Defaults to all of them.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of requests in flight.
+                Defaults to the client's `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+            return_exceptions (bool): Record a failed request in `errors` of its site instead of raising
+                it and cancelling the other requests.
+
+        Yields:
+            SiteOnlineStatus: The merged online status of each site, in completion order.
+
+        Example:
+            async for status in client.iter_sites_online_status(site_ids, concurrency=20):
+                dashboard.update(status.siteId, status.statuses)
+        """
+        device_types = list(dict.fromkeys(device_types))
+        site_ids = dict.fromkeys(site_ids)
+        if not device_types:
+            for site_id in site_ids:
+                yield SiteOnlineStatus(siteId=site_id)
+            return
+
+        sites: Dict[str, SiteOnlineStatus] = {}
+        remaining: Dict[str, int] = {}
+
+        def requests() -> Iterable[Tuple[str, DeviceType]]:
+            for site_id in site_ids:
+                sites[site_id] = SiteOnlineStatus(siteId=site_id)
+                remaining[site_id] = len(device_types)
+                for device_type in device_types:
+                    yield site_id, device_type
+
+        async def fetch(request: Tuple[str, DeviceType]) -> List[DeviceOnlineStatus]:
+            return await self.get_devices_device_online_by_type(*request)
+
+        async for (site_id, device_type), task in bounded_as_completed(fetch, requests(), self.resolve_concurrency(concurrency)):
+            status = sites[site_id]
+            error = task.exception()
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                status.errors[device_type] = error
+            else:
+                fetched_at = status.fetchedAt[device_type] = time.time()
+                for device in task.result():
+                    status.devices[device.devId] = DeviceOnlineState(
+                        devId=device.devId, type=device_type, currentStatus=device.currentStatus, fetchedAt=fetched_at)
+
+            remaining[site_id] -= 1
+            if not remaining[site_id]:
+                del remaining[site_id]
+                yield sites.pop(site_id)
+
+    async def iter_site_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[ClientAttributesReq]] = [ClientAttributesReq.mac_address], ) -> AsyncIterator[GenericClient]:
+        """
+        Streams client information for a specified site, yielding each client as soon as it has been received.
+
+        This asynchronous generator sends the same request as `get_site_clients_v2`, but parses the response 
+        incrementally instead of loading the whole body, so the peak memory stays bounded regardless 
+        of the number of clients.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[ClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to `[ClientAttributesReq.mac_address]`.
+
+        Yields:
+            GenericClient: Each client in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            async for client in iter_site_clients_v2(site_id="site123", period=ClientPeriod.field_1d):
+                print(client.macAddress)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        async for client in self._stream("POST", "GET_SITE_CLIENTS_V2", url, GenericClient, json=payload):
+            yield client
+
+    async def iter_ap_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[APClientAttributesReqV2]] = [APClientAttributesReqV2.mac_address], ) -> AsyncIterator[APClientV2]:
+        """
+        Streams access point (AP) client information for a specified site, yielding each client as soon as it has been received.
+
+        This asynchronous generator sends the same request as `get_ap_clients_v2`, but parses the response 
+        incrementally instead of loading the whole body, so the peak memory stays bounded regardless 
+        of the number of clients.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[APClientAttributesReqV2]]): A list of client attributes to include in the response. 
+                Defaults to `[APClientAttributesReqV2.mac_address]`.
+
+        Yields:
+            APClientV2: Each AP client in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            async for client in iter_ap_clients_v2(site_id="site123", period=ClientPeriod.field_1d):
+                print(client.macAddress)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        async for client in self._stream("POST", "GET_AP_CLIENTS_V2", url, APClientV2, json=payload):
+            yield client
+
+    async def iter_sw_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[SWClientAttributesReq]] = [SWClientAttributesReq.mac_address], ) -> AsyncIterator[SWClient]:
+        """
+        Streams switch client information for a specified site, yielding each client as soon as it has been received.
+
+        This asynchronous generator sends the same request as `get_sw_clients_v2`, but parses the response 
+        incrementally instead of loading the whole body, so the peak memory stays bounded regardless 
+        of the number of clients.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[SWClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to `[SWClientAttributesReq.mac_address]`.
+
+        Yields:
+            SWClient: Each switch client in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            async for client in iter_sw_clients_v2(site_id="site123", period=ClientPeriod.field_1d):
+                print(client.macAddress)
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_SW_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        async for client in self._stream("POST", "GET_SW_CLIENTS_V2", url, SWClient, json=payload):
+            yield client
+
+    async def iter_gw_clients_v2(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[GWClientAttributesReq]] = [GWClientAttributesReq.mac_address], ) -> AsyncIterator[GWClient]:
+        """
+        Streams gateway client information for a specified site, yielding each client as soon as it has been received.
+
+        This asynchronous generator sends the same request as `get_gw_clients_v2`, but parses the response 
+        incrementally instead of loading the whole body, so the peak memory stays bounded regardless 
+        of the number of clients.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[GWClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to `[GWClientAttributesReq.mac_address]`.
+
+        Yields:
+            GWClient: Each gateway client in the order returned by the API.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            async for client in iter_gw_clients_v2(site_id="site123", period=ClientPeriod.field_1d):
+                print(client.macAddress)
+        """
+        url = self.base_url + \
             ENDPOINTS["GET_GW_CLIENTS_V2"].format(site_id=site_id)
 
         payload = {
@@ -657,7 +1542,241 @@ sensor
             "featrues": [attr.value for attr in features] if features else []
         }
 
-        response = await self.client.post(url, json=payload)
-        response.raise_for_status()
-        data = response.json()
-        return from_dict(data_class=GWClients, data=data, config=Config(cast=[Enum]))
+        async for client in self._stream("POST", "GET_GW_CLIENTS_V2", url, GWClient, json=payload):
+            yield client
+
+    async def get_site_clients_v2_table(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[ClientAttributesReq]] = list(ClientAttributesReq), ) -> ColumnTable:
+        """
+        Retrieves client information for a specified site as columns instead of model instances.
+
+        This asynchronous method sends the same request as `get_site_clients_v2`, but decodes the clients 
+        straight into one list per field of `GenericClient`, which is considerably faster and lighter for 
+        analytics over large sites. Nested fields are flattened into dotted column names.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[ClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to all attributes.
+
+        Returns:
+            ColumnTable: The client fields column by column, convertible with `to_numpy` and `to_arrow`.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            table = await get_site_clients_v2_table(site_id="site123", period=ClientPeriod.field_1d)
+            frame = pandas.DataFrame(table.to_numpy())
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_SITE_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        data = await self._request("POST", "GET_SITE_CLIENTS_V2", url, json=payload)
+        return self._decode_columns("GET_SITE_CLIENTS_V2", GenericClient, data)
+
+    async def get_ap_clients_v2_table(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[APClientAttributesReqV2]] = list(APClientAttributesReqV2), ) -> ColumnTable:
+        """
+        Retrieves access point (AP) client information for a specified site as columns instead of model instances.
+
+        This asynchronous method sends the same request as `get_ap_clients_v2`, but decodes the clients 
+        straight into one list per field of `APClientV2`, which is considerably faster and lighter for 
+        analytics over large sites. Nested fields are flattened into dotted column names.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[APClientAttributesReqV2]]): A list of client attributes to include in the response. 
+                Defaults to all attributes.
+
+        Returns:
+            ColumnTable: The client fields column by column, convertible with `to_numpy` and `to_arrow`.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            table = await get_ap_clients_v2_table(site_id="site123", period=ClientPeriod.field_1d)
+            frame = pandas.DataFrame(table.to_numpy())
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_AP_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        data = await self._request("POST", "GET_AP_CLIENTS_V2", url, json=payload)
+        return self._decode_columns("GET_AP_CLIENTS_V2", APClientV2, data)
+
+    async def get_sw_clients_v2_table(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[SWClientAttributesReq]] = list(SWClientAttributesReq), ) -> ColumnTable:
+        """
+        Retrieves switch client information for a specified site as columns instead of model instances.
+
+        This asynchronous method sends the same request as `get_sw_clients_v2`, but decodes the clients 
+        straight into one list per field of `SWClient`, which is considerably faster and lighter for 
+        analytics over large sites. Nested fields are flattened into dotted column names.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[SWClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to all attributes.
+
+        Returns:
+            ColumnTable: The client fields column by column, convertible with `to_numpy` and `to_arrow`.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            table = await get_sw_clients_v2_table(site_id="site123", period=ClientPeriod.field_1d)
+            frame = pandas.DataFrame(table.to_numpy())
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_SW_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        data = await self._request("POST", "GET_SW_CLIENTS_V2", url, json=payload)
+        return self._decode_columns("GET_SW_CLIENTS_V2", SWClient, data)
+
+    async def get_gw_clients_v2_table(self, site_id: str, period: Optional[ClientPeriod] = ClientPeriod.field_2h, features: Optional[List[GWClientAttributesReq]] = list(GWClientAttributesReq), ) -> ColumnTable:
+        """
+        Retrieves gateway client information for a specified site as columns instead of model instances.
+
+        This asynchronous method sends the same request as `get_gw_clients_v2`, but decodes the clients 
+        straight into one list per field of `GWClient`, which is considerably faster and lighter for 
+        analytics over large sites. Nested fields are flattened into dotted column names.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            period (Optional[ClientPeriod]): The time period for which to retrieve client data. 
+                Defaults to `ClientPeriod.field_2h`.
+            features (Optional[List[GWClientAttributesReq]]): A list of client attributes to include in the response. 
+                Defaults to all attributes.
+
+        Returns:
+            ColumnTable: The client fields column by column, convertible with `to_numpy` and `to_arrow`.
+
+        Raises:
+            ZyxelNebulaError: If the response status code indicates an error.
+
+        Example:
+            table = await get_gw_clients_v2_table(site_id="site123", period=ClientPeriod.field_1d)
+            frame = pandas.DataFrame(table.to_numpy())
+        """
+        url = self.base_url + \
+            ENDPOINTS["GET_GW_CLIENTS_V2"].format(site_id=site_id)
+
+        payload = {
+            "period": period.value if period else None,
+            "featrues": [attr.value for attr in features] if features else []
+        }
+
+        data = await self._request("POST", "GET_GW_CLIENTS_V2", url, json=payload)
+        return self._decode_columns("GET_GW_CLIENTS_V2", GWClient, data)
+
+    async def iter_sw_event_logs(self, site_id: str, device_id: str, start: int, end: int, window: int = DEFAULT_EVENT_LOG_WINDOW, concurrency: Optional[Union[int, AdaptiveLimiter]] = None) -> AsyncIterator[SWEventLogEntry]:
+        """
+        Streams the event logs of a switch over a long time range, oldest first.
+
+        This asynchronous generator splits the range into consecutive windows of `window` milliseconds, 
+        fetches up to `concurrency` windows at the same time and yields the entries of each window 
+        sorted by `timestamp` as soon as all earlier windows have been yielded. At most `concurrency` 
+        windows are held in memory, however long the range is. Each window ends at the millisecond the 
+        next one starts, and entries returned by both are yielded once.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            device_id (str): The unique identifier for the switch.
+            start (int): The start of the time range as Unix timestamp in milliseconds.
+            end (int): The end of the time range as Unix timestamp in milliseconds.
+            window (int): The length of the windows in milliseconds. Defaults to `DEFAULT_EVENT_LOG_WINDOW`.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of windows fetched at 
+                the same time. Defaults to `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+
+        Yields:
+            SWEventLogEntry: Each entry in the order of `timestamp`.
+
+        Raises:
+            ZyxelNebulaError: If the request for a window fails.
+
+        Example:
+            async for entry in iter_sw_event_logs(site_id="site123", device_id="device456", start=start, end=end):
+                print(entry.timestamp, entry.message)
+        """
+        def fetch(time_range: Tuple[int, int]) -> Awaitable[List[SWEventLogEntry]]:
+            return self.get_sw_event_logs(site_id, device_id, *time_range)
+
+        async for entry in self._iter_event_logs(fetch, start, end, window, concurrency):
+            yield entry
+
+    async def iter_gw_event_logs(self, site_id: str, start: int, end: int, window: int = DEFAULT_EVENT_LOG_WINDOW, concurrency: Optional[Union[int, AdaptiveLimiter]] = None) -> AsyncIterator[GWEventLogEntry]:
+        """
+        Streams the event logs of the gateway of a site over a long time range, oldest first.
+
+        This asynchronous generator splits the range into consecutive windows of `window` milliseconds, 
+        fetches up to `concurrency` windows at the same time and yields the entries of each window 
+        sorted by `timestamp` as soon as all earlier windows have been yielded. At most `concurrency` 
+        windows are held in memory, however long the range is. Each window ends at the millisecond the 
+        next one starts, and entries returned by both are yielded once.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            start (int): The start of the time range as Unix timestamp in milliseconds.
+            end (int): The end of the time range as Unix timestamp in milliseconds.
+            window (int): The length of the windows in milliseconds. Defaults to `DEFAULT_EVENT_LOG_WINDOW`.
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of windows fetched at 
+                the same time. Defaults to `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY` otherwise.
+
+        Yields:
+            GWEventLogEntry: Each entry in the order of `timestamp`.
+
+        Raises:
+            ZyxelNebulaError: If the request for a window fails.
+
+        Example:
+            async for entry in iter_gw_event_logs(site_id="site123", start=start, end=end, window=15 * 60 * 1000):
+                print(entry.timestamp, entry.message)
+        """
+        def fetch(time_range: Tuple[int, int]) -> Awaitable[List[GWEventLogEntry]]:
+            return self.get_gw_event_logs(site_id, *time_range)
+
+        async for entry in self._iter_event_logs(fetch, start, end, window, concurrency):
+            yield entry
+
+    async def _iter_event_logs(self, fetch: Callable[[Tuple[int, int]], Awaitable[List[Any]]], start: int, end: int, window: int, concurrency: Union[int, AdaptiveLimiter]) -> AsyncIterator[Any]:
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        # whether `endTimestamp` is inclusive is not documented, so each window ends where the next one
+        # starts and entries of the shared millisecond returned by both windows are yielded once
+        windows = ((window_start, min(window_start + window, end))
+                   for window_start in range(start, max(end, start + 1), window))
+
+        previous: Counter = Counter()
+        async for _, task in bounded_in_order(fetch, windows, self.resolve_concurrency(concurrency)):
+            entries = task.result()
+            # windows follow each other in time, so sorting each of them sorts the whole stream
+            entries.sort(key=lambda entry: entry.timestamp or 0)
+            current = Counter(map(repr, entries))
+            for entry in entries:
+                key = repr(entry)
+                if previous[key]:
+                    previous[key] -= 1
+                    continue
+                yield entry
+            previous = current
@@ -0,0 +1,152 @@
+from dataclasses import dataclass, fields, is_dataclass
+from enum import Enum
+from types import NoneType
+from typing import Any, Callable, Dict, List, Tuple, Union, get_args, get_origin, get_type_hints
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+_EXTRACTORS: Dict[type, Tuple[Dict[str, type], Callable[[List[Any]], List[list]]]] = {}
+_SCALARS = (str, int, float, bool)
+
+
+@dataclass
+class ColumnTable:
+    """
+    Client list decoded column by column, without creating a model instance per row.
+
+    Every scalar field of the item model becomes a column; fields of nested models are flattened into
+    dotted names such as `wifiStation.signal` or `osHostname.hostname`. Values are kept as parsed from
+    JSON: enums hold their string value and missing values are `None`.
+
+    Attributes:
+        columns (Dict[str, list]): The values per column, all of the same length.
+        types (Dict[str, type]): The Python type of each column's values (`str`, `int`, `float` or `bool`).
+
+    Example:
+        table = await client.get_ap_clients_v2_table(site_id="site123")
+        busy = [mac for mac, upload in zip(table["macAddress"], table["upload"]) if upload and upload > 1e6]
+        frame = pandas.DataFrame(table.to_numpy())
+    """
+    columns: Dict[str, list]
+    types: Dict[str, type]
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __getitem__(self, name: str) -> list:
+        return self.columns[name]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Return the columns as NumPy arrays. Requires `numpy`.
+
+        Numeric columns become `int64`, or `float64` with `NaN` for missing values; other columns
+        become object arrays.
+        """
+        if numpy is None:
+            raise ImportError("ColumnTable.to_numpy requires the numpy package")
+        arrays = {}
+        for name, values in self.columns.items():
+            type_ = self.types[name]
+            if type_ in (int, float) and None in values:
+                arrays[name] = numpy.array([numpy.nan if value is None else value for value in values],
+                                           dtype=numpy.float64)
+            elif type_ in (int, float):
+                arrays[name] = numpy.array(values, dtype=numpy.int64 if type_ is int else numpy.float64)
+            else:
+                arrays[name] = numpy.array(values, dtype=object)
+        return arrays
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a `pyarrow.Table` with nullable typed columns. Requires `pyarrow`."""
+        if pyarrow is None:
+            raise ImportError("ColumnTable.to_arrow requires the pyarrow package")
+        arrow_types = {str: pyarrow.string(), int: pyarrow.int64(), float: pyarrow.float64(), bool: pyarrow.bool_()}
+        return pyarrow.table({name: pyarrow.array(values, type=arrow_types[self.types[name]])
+                              for name, values in self.columns.items()})
+
+
+def decode_columns(data_class: type, items: List[Any]) -> ColumnTable:
+    """
+    Decode a list of JSON objects into a `ColumnTable` with one column per scalar field of `data_class`.
+
+    Args:
+        data_class (type): The item model, e.g. `APClientV2`. Nested dataclass fields are flattened.
+        items (List[Any]): The JSON objects, e.g. the `data` member of a client list response.
+
+    Returns:
+        ColumnTable: The values of every item, column by column.
+
+    Example:
+        table = decode_columns(GenericClient, response.json()["data"])
+        table["ipv4Address"]
+    """
+    types, extract = _EXTRACTORS.get(data_class) or _compile(data_class)
+    return ColumnTable(columns=dict(zip(types, extract(items or []))), types=dict(types))
+
+
+def _column_type(type_: Any) -> Any:
+    """Return the column type of a field type hint, a dataclass to flatten, or `None` to skip it."""
+    if get_origin(type_) is Union:
+        args = [arg for arg in get_args(type_) if arg is not NoneType]
+        return _column_type(args[0]) if len(args) == 1 else None
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return str
+    if type_ in _SCALARS or (isinstance(type_, type) and is_dataclass(type_)):
+        return type_
+    return None
+
+
+def _columns(data_class: type, prefix: Tuple[str, ...] = ()) -> List[Tuple[Tuple[str, ...], type]]:
+    """Return the path and type of every scalar field, flattening nested dataclasses."""
+    columns = []
+    hints = get_type_hints(data_class)
+    for field in fields(data_class):
+        type_ = _column_type(hints[field.name])
+        if type_ is not None and is_dataclass(type_):
+            columns.extend(_columns(type_, (*prefix, field.name)))
+        elif type_ is not None:
+            columns.append(((*prefix, field.name), type_))
+    return columns
+
+
+def _compile(data_class: type) -> Tuple[Dict[str, type], Callable[[List[Any]], List[list]]]:
+    columns = _columns(data_class)
+    lines = ["def extract(items):"]
+    for index in range(len(columns)):
+        lines.append(f"    c{index} = []")
+        lines.append(f"    a{index} = c{index}.append")
+    lines.append("    for d in items:")
+
+    def emit(indices: List[int], depth: int, var: str, indent: str):
+        nested: Dict[str, List[int]] = {}
+        for index in indices:
+            path = columns[index][0]
+            if len(path) == depth + 1:
+                lines.append(f"{indent}a{index}({var}.get({path[depth]!r}))")
+            else:
+                nested.setdefault(path[depth], []).append(index)
+        for name, members in nested.items():
+            child = f"v{depth}"
+            lines.append(f"{indent}{child} = {var}.get({name!r})")
+            lines.append(f"{indent}if {child} is None:")
+            lines.extend(f"{indent}    a{index}(None)" for index in members)
+            lines.append(f"{indent}else:")
+            emit(members, depth + 1, child, indent + "    ")
+
+    emit(list(range(len(columns))), 0, "d", "        ")
+    lines.append(f"    return [{', '.join(f'c{index}' for index in range(len(columns)))}]")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    types = {".".join(path): type_ for path, type_ in columns}
+    _EXTRACTORS[data_class] = (types, namespace["extract"])
+    return _EXTRACTORS[data_class]
@@ -0,0 +1,157 @@
+"""
+Slotted variants of the high-cardinality client models.
+
+The classes in this module mirror their counterparts in `models` field by field, but are declared with
+`__slots__` so instances carry no per-instance `__dict__`. Enable them with
+`ZyxelNebulaClient(api_key, compact=True)` when holding large client inventories in memory.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from . import models
+from .models import KeyField, OnlineOffline, WiFiBand, WiFiSecurityType
+
+
+@dataclass(slots=True)
+class OSHostname:
+    os: Optional[str]
+    hostname: Optional[str]
+
+
+@dataclass(slots=True)
+class APClientInfo:
+    status: Optional[OnlineOffline]
+    vlan: Optional[int]
+    signal: Optional[int]
+    band: Optional[WiFiBand]
+    channel: Optional[int]
+
+
+@dataclass(slots=True)
+class APClientSSID:
+    name: Optional[str]
+    security: Optional[WiFiSecurityType]
+
+
+@dataclass(slots=True)
+class APClient:
+    macAddress: str
+    ssid: Optional[APClientSSID]
+    wifiStation: Optional[APClientInfo]
+    ipv4Address: Optional[str] = None
+    lastSeen: Optional[int] = None
+    connectedTo: Optional[str] = None
+    firstSeen: Optional[int] = None
+    description: Optional[str] = None
+    osHostname: Optional[OSHostname] = None
+    manufacturer: Optional[str] = None
+
+
+@dataclass(slots=True)
+class APClientV2:
+    macAddress: str
+    ssid: Optional[APClientSSID]
+    wifiStation: Optional[APClientInfo]
+    ipv4Address: Optional[str] = None
+    lastSeen: Optional[int] = None
+    connectedTo: Optional[str] = None
+    firstSeen: Optional[int] = None
+    description: Optional[str] = None
+    osHostname: Optional[OSHostname] = None
+    manufacturer: Optional[str] = None
+    user: Optional[str] = None
+    upload: Optional[float] = None
+    download: Optional[float] = None
+
+
+@dataclass(slots=True)
+class APClients:
+    KeyFields: List[KeyField]
+    data: Optional[List[APClientV2]]
+
+
+@dataclass(slots=True)
+class GenericClient:
+    macAddress: str
+    status: OnlineOffline
+    ipv4Address: Optional[str] = None
+    vlan: Optional[int] = None
+    lastSeen: Optional[int] = None
+    connectedTo: Optional[str] = None
+    firstSeen: Optional[int] = None
+    description: Optional[str] = None
+    osHostname: Optional[OSHostname] = None
+    manufacturer: Optional[str] = None
+
+
+@dataclass(slots=True)
+class GenericClients:
+    KeyFields: List[KeyField]
+    data: Optional[List[GenericClient]]
+
+
+@dataclass(slots=True)
+class SWClient:
+    macAddress: str
+    vlan: int
+    lldp: Optional[str]
+    ipv4Address: Optional[str] = None
+    lastSeen: Optional[int] = None
+    connectedTo: Optional[str] = None
+    connectedPort: Optional[str] = None
+    firstSeen: Optional[int] = None
+    description: Optional[str] = None
+    manufacturer: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SWClients:
+    KeyFields: List[KeyField]
+    data: Optional[List[SWClient]]
+
+
+@dataclass(slots=True)
+class GWClient:
+    macAddress: str
+    ipv4Address: str
+    interface: str
+    lastSeen: Optional[int] = None
+    connectedTo: Optional[str] = None
+    firstSeen: Optional[int] = None
+    description: Optional[str] = None
+    osHostname: Optional[OSHostname] = None
+    manufacturer: Optional[str] = None
+
+
+@dataclass(slots=True)
+class GWClients:
+    KeyFields: List[KeyField]
+    data: Optional[List[GWClient]]
+
+
+@dataclass(slots=True)
+class SWL2MACEntry:
+    macAddress: str
+    vlan: int
+    portNum: int
+
+
+# Maps each model from `models` to its slotted variant.
+COMPACT_MODELS = {
+    models.OSHostname: OSHostname,
+    models.APClientInfo: APClientInfo,
+    models.APClientSSID: APClientSSID,
+    models.APClient: APClient,
+    models.APClientV2: APClientV2,
+    models.APClients: APClients,
+    models.GenericClient: GenericClient,
+    models.GenericClients: GenericClients,
+    models.SWClient: SWClient,
+    models.SWClients: SWClients,
+    models.GWClient: GWClient,
+    models.GWClients: GWClients,
+    models.SWL2MACEntry: SWL2MACEntry,
+}
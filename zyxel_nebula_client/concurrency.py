@@ -0,0 +1,274 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Optional, Set, Tuple, TypeVar, Union
+
+import httpx
+
+from .consts import DEFAULT_CONCURRENCY
+from .retry import error_response
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_as_completed(func: Callable[[T], Awaitable[R]], items: Iterable[T], limit: Union[int, "AdaptiveLimiter"]) -> AsyncIterator[Tuple[T, "asyncio.Task[R]"]]:
+    """
+    Run `func` for every item with at most `limit` calls in flight, yielding them as they finish.
+
+    Items are consumed lazily, so only `limit` calls exist at any time regardless of how many items
+    there are. Each finished call is yielded together with its item as a completed `asyncio.Task`;
+    use `task.result()` to get the value or re-raise the error. Closing the iterator early cancels the
+    calls still in flight.
+
+    Args:
+        func (Callable[[T], Awaitable[R]]): The coroutine function to call for each item.
+        items (Iterable[T]): The items to process.
+        limit (Union[int, AdaptiveLimiter]): The maximum number of concurrent calls, or an
+            `AdaptiveLimiter` whose current limit is consulted before each new call.
+
+    Yields:
+        Tuple[T, asyncio.Task[R]]: The item and its completed task, in completion order.
+
+    Example:
+        async for site, task in bounded_as_completed(fetch_site, sites, limit=10):
+            print(site, task.result())
+    """
+    current = _limit_function(limit)
+
+    iterator = iter(items)
+    exhausted = False
+    pending: Dict["asyncio.Task[R]", T] = {}
+    try:
+        while True:
+            while not exhausted and len(pending) < current():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(func(item))] = item
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield pending.pop(task), task
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def bounded_in_order(func: Callable[[T], Awaitable[R]], items: Iterable[T], limit: Union[int, "AdaptiveLimiter"]) -> AsyncIterator[Tuple[T, "asyncio.Task[R]"]]:
+    """
+    Run `func` for every item with at most `limit` calls in flight, yielding them in the order of `items`.
+
+    Like `bounded_as_completed`, but a call that finishes early is held back until every call before it
+    has been yielded. At most `limit` results are held at a time, so the lookahead and with it the
+    memory stay bounded.
+
+    Args:
+        func (Callable[[T], Awaitable[R]]): The coroutine function to call for each item.
+        items (Iterable[T]): The items to process.
+        limit (Union[int, AdaptiveLimiter]): The maximum number of concurrent calls, or an
+            `AdaptiveLimiter` whose current limit is consulted before each new call.
+
+    Yields:
+        Tuple[T, asyncio.Task[R]]: The item and its completed task, in the order of `items`.
+
+    Example:
+        async for window, task in bounded_in_order(fetch_window, windows, limit=4):
+            process(task.result())
+    """
+    current = _limit_function(limit)
+
+    iterator = iter(items)
+    exhausted = False
+    pending: Deque[Tuple[T, "asyncio.Task[R]"]] = deque()
+    try:
+        while True:
+            while not exhausted and len(pending) < current():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.append((item, asyncio.ensure_future(func(item))))
+
+            if not pending:
+                return
+
+            item, task = pending[0]
+            await asyncio.wait([task])
+            pending.popleft()
+            yield item, task
+    finally:
+        tasks = [task for _, task in pending]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def bounded_merge(func: Callable[[T], AsyncIterator[R]], items: Iterable[T], limit: Union[int, "AdaptiveLimiter"]) -> AsyncIterator[Tuple[T, R]]:
+    """
+    Iterate `func(item)` for every item with at most `limit` iterators running, yielding values as they arrive.
+
+    The values of all running iterators are interleaved in the order they are produced. When an
+    iterator raises, the others are cancelled and the error is raised. Closing the iterator early
+    cancels the iterators still running.
+
+    Args:
+        func (Callable[[T], AsyncIterator[R]]): Returns the asynchronous iterator for an item.
+        items (Iterable[T]): The items to process.
+        limit (Union[int, AdaptiveLimiter]): The maximum number of iterators running at the same time,
+            or an `AdaptiveLimiter` whose current limit is consulted before each new iterator.
+
+    Yields:
+        Tuple[T, R]: The item and each value of its iterator, in arrival order.
+
+    Example:
+        async for device, result in bounded_merge(ping_device, devices, limit=20):
+            print(device, result)
+    """
+    current = _limit_function(limit)
+    done = object()
+    queue: "asyncio.Queue[Tuple[T, Any, Optional[BaseException]]]" = asyncio.Queue()
+
+    async def drain(item: T):
+        try:
+            async for value in func(item):
+                await queue.put((item, value, None))
+        except Exception as e:
+            await queue.put((item, done, e))
+        else:
+            await queue.put((item, done, None))
+
+    iterator = iter(items)
+    exhausted = False
+    # iterators count as running until their end was taken from the queue, their task may finish earlier
+    active = 0
+    running: Set["asyncio.Task[None]"] = set()
+    try:
+        while True:
+            while not exhausted and active < current():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(drain(item))
+                running.add(task)
+                task.add_done_callback(running.discard)
+                active += 1
+
+            if not active:
+                return
+
+            item, value, error = await queue.get()
+            if error is not None:
+                raise error
+            if value is done:
+                active -= 1
+            else:
+                yield item, value
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+def _limit_function(limit: Union[int, "AdaptiveLimiter"]) -> Callable[[], int]:
+    if isinstance(limit, AdaptiveLimiter):
+        return lambda: limit.limit
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return lambda: limit
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit for fan-out operations that adapts to the API with additive increase and
+    multiplicative decrease (AIMD).
+
+    `ZyxelNebulaClient(adaptive_concurrency=...)` reports the outcome of every request. Each healthy
+    response raises the limit by `increase / limit`, i.e. by about `increase` once a full limit of
+    requests succeeded. A response counts as healthy when its latency stays within `latency_tolerance`
+    times the lowest latency seen so far. A `429`, a `5xx` or a connection error multiplies the limit
+    by `decrease`, at most once per round trip: failures of requests sent before the last decrease
+    are ignored, as they were sent under the old limit. Other errors leave the limit alone.
+
+    The fan-out helpers `bounded_as_completed`, `bounded_in_order` and `bounded_merge` consult
+    `limit` before starting each call, so sweeps speed up and slow down while they run.
+
+    Args:
+        initial (int): The starting limit. Defaults to `DEFAULT_CONCURRENCY`.
+        minimum (int): The lowest limit. Defaults to 1.
+        maximum (int): The highest limit. Defaults to 100.
+        increase (float): The additive increase per round of successful requests. Defaults to 1.
+        decrease (float): The factor applied on throttling or server errors. Defaults to 0.5.
+        latency_tolerance (Optional[float]): Responses slower than this multiple of the lowest
+            latency do not raise the limit. `None` ignores latency. Defaults to 3.
+        clock (Callable[[], float]): Returns the current time in seconds. Defaults to `time.perf_counter`.
+
+    Example:
+        client = ZyxelNebulaClient(api_key="...", adaptive_concurrency=AdaptiveLimiter(maximum=50))
+        async for site_result in client.crawl_organization(org_id):
+            ...
+        print(client.adaptive_concurrency.limit)
+    """
+
+    def __init__(self, initial: int = DEFAULT_CONCURRENCY, minimum: int = 1, maximum: int = 100,
+                 increase: float = 1.0, decrease: float = 0.5, latency_tolerance: Optional[float] = 3.0,
+                 clock: Callable[[], float] = time.perf_counter):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.clock = clock
+        self.min_latency: Optional[float] = None
+        self._limit = float(initial)
+        self._decreased = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent calls allowed."""
+        return int(self._limit)
+
+    def record(self, started: float, error: Optional[BaseException] = None):
+        """
+        Adjust the limit to the outcome of a request.
+
+        Args:
+            started (float): When the request was sent, according to `clock`.
+            error (Optional[BaseException]): The error the request failed with, if any.
+        """
+        if error is not None:
+            if _is_overload(error) and started >= self._decreased:
+                self._limit = max(self.minimum, self._limit * self.decrease)
+                self._decreased = self.clock()
+            return
+
+        latency = self.clock() - started
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if self.latency_tolerance is not None and latency > self.min_latency * self.latency_tolerance:
+            return
+        self._limit = min(self.maximum, self._limit + self.increase / self._limit)
+
+
+def _is_overload(error: BaseException) -> bool:
+    """Return whether an error signals that the API is overloaded."""
+    if isinstance(error, httpx.TransportError):
+        return True
+    response = error_response(error)
+    return response is not None and (response.status_code == 429 or response.status_code >= 500)
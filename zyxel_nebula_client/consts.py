@@ -1,5 +1,14 @@
+import httpx
+
 BASE_URL = "https://api.nebula.zyxel.com"
 
+# Connection pool of the default HTTP client: room for fan-out and connections kept open between polls
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=50, keepalive_expiry=60)
+
+# Timeout in seconds of the default HTTP client, large client lists take a while to generate
+DEFAULT_TIMEOUT = 30.0
+
 # Endpoints
 ENDPOINTS = {
     # groups
@@ -23,8 +32,33 @@ ENDPOINTS = {
     "REBOOT": "/v1/nebula/{site_id}/livetool/{device_id}/reboot",
     "CABLE_TEST": "/v1/nebula/{site_id}/livetool/{device_id}/cable-test",
     "CONNECTIVITY": "/v1/nebula/{site_id}/{device_id}/connectivity",
+    "GET_SW_EVENT_LOGS": "/v1/nebula/{site_id}/sw/{device_id}/event-logs",
+    "GET_GW_EVENT_LOGS": "/v1/nebula/{site_id}/gw/event-logs",
     "GET_SITE_CLIENTS_V2": "/v2/nebula/{site_id}/clients",
     "GET_AP_CLIENTS_V2": "/v2/nebula/{site_id}/ap-clients",
     "GET_SW_CLIENTS_V2": "/v2/nebula/{site_id}/sw-clients",
     "GET_GW_CLIENTS_V2": "/v2/nebula/{site_id}/gw-clients",
 }
+
+# Number of concurrent requests used by fan-out helpers unless configured otherwise
+DEFAULT_CONCURRENCY = 10
+
+# Length in milliseconds of the time windows event logs are fetched in
+DEFAULT_EVENT_LOG_WINDOW = 3600 * 1000
+
+# Seconds between polls of a running ping and until it must have finished
+DEFAULT_PING_INTERVAL = 1.0
+DEFAULT_PING_TIMEOUT = 60.0
+
+# Endpoints that may be sent again without side effects, in addition to every GET
+IDEMPOTENT_ENDPOINTS = frozenset({
+    "GET_SITE_CLIENTS",
+    "GET_AP_CLIENTS",
+    "CONNECTIVITY",
+    "GET_SW_EVENT_LOGS",
+    "GET_GW_EVENT_LOGS",
+    "GET_SITE_CLIENTS_V2",
+    "GET_AP_CLIENTS_V2",
+    "GET_SW_CLIENTS_V2",
+    "GET_GW_CLIENTS_V2",
+})
@@ -0,0 +1,172 @@
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from types import NoneType
+from typing import Any, Callable, Dict, List, Type, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from dacite import from_dict, Config
+
+T = TypeVar("T")
+
+DACITE_CONFIG = Config(cast=[Enum])
+
+_DECODERS: Dict[type, Callable[[Any], Any]] = {}
+_MISSING = object()
+_SCALARS = {str: "str", int: "int", bool: "bool", float: "(int, float)"}
+
+
+class _Unsupported(Exception):
+    """Raised while compiling when a type hint has no specialized conversion."""
+
+
+class _Mismatch(Exception):
+    """Raised by a compiled decoder when the data does not fit the fast path."""
+
+
+def _mismatch():
+    raise _Mismatch()
+
+
+def get_decoder(data_class: Type[T]) -> Callable[[Any], T]:
+    """
+    Return the cached decoder for a dataclass, compiling it on first use.
+
+    The compiled decoder produces the same instance as
+    `from_dict(data_class=data_class, data=data, config=Config(cast=[Enum]))`. Type hints are resolved once
+    and turned into a specialized function instead of being inspected for every item. Whenever the data
+    does not fit the fast path (missing keys, wrong types, unknown enum values), the decoder defers to
+    dacite so that the raised exception is exactly the one dacite would raise.
+
+    Args:
+        data_class (Type[T]): The dataclass to decode into.
+
+    Returns:
+        Callable[[Any], T]: A function converting a JSON object into a `data_class` instance.
+
+    Example:
+        decoder = get_decoder(APClientV2)
+        clients = [decoder(item) for item in data]
+    """
+    decoder = _DECODERS.get(data_class)
+    if decoder is None:
+        # register a forwarding stub first so self-referencing dataclasses compile
+        _DECODERS[data_class] = lambda data: _DECODERS[data_class](data)
+        try:
+            decoder = _compile(data_class)
+        except _Unsupported:
+            decoder = _fallback(data_class)
+        _DECODERS[data_class] = decoder
+    return decoder
+
+
+def decode(data_class: Type[T], data: Any) -> T:
+    """
+    Decode a single JSON object into an instance of `data_class`.
+
+    Example:
+        org = decode(Org, response.json())
+    """
+    return get_decoder(data_class)(data)
+
+
+def decode_list(data_class: Type[T], items: List[Any]) -> List[T]:
+    """
+    Decode a list of JSON objects into instances of `data_class`.
+
+    Example:
+        groups = decode_list(Group, response.json())
+    """
+    decoder = get_decoder(data_class)
+    return [decoder(item) for item in items]
+
+
+def _fallback(data_class: type) -> Callable[[Any], Any]:
+    def decode_with_dacite(data):
+        return from_dict(data_class=data_class, data=data, config=DACITE_CONFIG)
+    return decode_with_dacite
+
+
+def _compile(data_class: type) -> Callable[[Any], Any]:
+    hints = get_type_hints(data_class)
+    namespace = {"_MISSING": _MISSING, "_mismatch": _mismatch,
+                 "_Mismatch": _Mismatch, "_cls": data_class,
+                 "_fallback": _fallback(data_class)}
+
+    lines = ["def decode(d):", "    try:"]
+    arguments = []
+    for index, field in enumerate(fields(data_class)):
+        if not field.init:
+            raise _Unsupported(field.name)
+
+        type_ = hints[field.name]
+        target = f"f{index}"
+        expression = _convert(type_, "v", namespace, 0)
+
+        lines.append(f"        v = d.get({field.name!r}, _MISSING)")
+        lines.append("        if v is _MISSING:")
+        if field.default is not MISSING:
+            namespace[f"_default{index}"] = field.default
+            lines.append(f"            {target} = _default{index}")
+        elif field.default_factory is not MISSING:
+            namespace[f"_factory{index}"] = field.default_factory
+            lines.append(f"            {target} = _factory{index}()")
+        elif _is_optional(type_):
+            lines.append(f"            {target} = None")
+        else:
+            lines.append("            raise _Mismatch()")
+        lines.append("        else:")
+        lines.append(f"            {target} = {expression}")
+        arguments.append(f"{field.name}={target}")
+
+    lines.append(f"        return _cls({', '.join(arguments)})")
+    lines.append("    except Exception:")
+    lines.append("        return _fallback(d)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["decode"]
+
+
+def _is_optional(type_: Any) -> bool:
+    return get_origin(type_) is Union and NoneType in get_args(type_)
+
+
+def _reference(namespace: Dict[str, Any], value: Any) -> str:
+    name = f"_ref{len(namespace)}"
+    namespace[name] = value
+    return name
+
+
+def _convert(type_: Any, var: str, namespace: Dict[str, Any], depth: int) -> str:
+    """Build a Python expression converting `var` the way dacite converts a value of `type_`."""
+    origin = get_origin(type_)
+
+    if origin is Union:
+        args = [arg for arg in get_args(type_) if arg is not NoneType]
+        if len(args) != len(get_args(type_)):
+            inner = args[0] if len(args) == 1 else Union[tuple(args)]
+            return f"(None if {var} is None else {_convert(inner, var, namespace, depth)})"
+        if all(arg in _SCALARS for arg in args):
+            # dacite keeps the value untouched when one of the scalar members accepts it
+            accepted = ", ".join(_SCALARS[arg].strip("()") for arg in args)
+            return f"({var} if isinstance({var}, ({accepted})) else _mismatch())"
+        raise _Unsupported(type_)
+
+    if origin is list:
+        (item_type,) = get_args(type_) or (Any,)
+        item = f"i{depth}"
+        return (f"([{_convert(item_type, item, namespace, depth + 1)} for {item} in {var}] "
+                f"if {var}.__class__ is list else _mismatch())")
+
+    if type_ is Any:
+        return var
+
+    if type_ in _SCALARS:
+        return f"({var} if isinstance({var}, {_SCALARS[type_]}) else _mismatch())"
+
+    if isinstance(type_, type) and issubclass(type_, Enum):
+        return f"{_reference(namespace, type_)}({var})"
+
+    if isinstance(type_, type) and is_dataclass(type_):
+        nested = get_decoder(type_)
+        return f"({_reference(namespace, nested)}({var}) if {var}.__class__ is dict else _mismatch())"
+
+    raise _Unsupported(type_)
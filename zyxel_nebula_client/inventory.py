@@ -0,0 +1,167 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from .models import Device, DeviceFirmwareStatus, DeviceOnlineStatus, OnlineOffline, SitesDevices
+from .results import SiteOnlineStatus
+
+if TYPE_CHECKING:
+    from .client import ZyxelNebulaClient
+
+# Separators of the common MAC address notations, e.g. 00:11:22:33:44:55, 00-11-22-33-44-55, 0011.2233.4455
+_MAC_SEPARATORS = str.maketrans("", "", ":-. ")
+
+
+def normalize_mac(mac: str) -> str:
+    """Return a MAC address as 12 lowercase hex digits without separators."""
+    return mac.translate(_MAC_SEPARATORS).lower()
+
+
+@dataclass(slots=True)
+class InventoryEntry:
+    """
+    A device of the inventory joined with its site, firmware status and online status.
+
+    Every part is optional, since they come from different responses: an entry may be known from
+    its firmware or online status before the device itself was added.
+    """
+    devId: str
+    device: Optional[Device] = None
+    siteId: Optional[str] = None
+    firmware: Optional[DeviceFirmwareStatus] = None
+    online: Optional[OnlineOffline] = None
+
+
+class InventoryIndex:
+    """
+    In-memory index of the devices of organizations and sites for constant-time lookups.
+
+    Devices are indexed by device ID, normalized MAC address, serial number and site. Firmware and
+    online status responses are joined into the same entries, so correlating a MAC address seen in a
+    log line with its device, site, firmware and online status is a few dictionary lookups instead of
+    scanning lists. Adding the same device again replaces the previous data.
+
+    Example:
+        index = await InventoryIndex.from_organization(client, "org123", online=True)
+        entry = index.by_mac("00-11-22-33-44-55")
+        if entry is not None:
+            print(entry.device.name, entry.siteId, entry.firmware.currentVersion, entry.online)
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, InventoryEntry] = {}
+        self._by_mac: Dict[str, InventoryEntry] = {}
+        self._by_serial: Dict[str, InventoryEntry] = {}
+        self._by_site: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[InventoryEntry]:
+        return iter(self._entries.values())
+
+    def __contains__(self, dev_id: str) -> bool:
+        return dev_id in self._entries
+
+    def __getitem__(self, dev_id: str) -> InventoryEntry:
+        return self._entries[dev_id]
+
+    def _entry(self, dev_id: str) -> InventoryEntry:
+        entry = self._entries.get(dev_id)
+        if entry is None:
+            entry = self._entries[dev_id] = InventoryEntry(devId=dev_id)
+        return entry
+
+    def _set_site(self, entry: InventoryEntry, site_id: Optional[str]):
+        if site_id is None or site_id == entry.siteId:
+            return
+        if entry.siteId is not None:
+            self._by_site[entry.siteId].discard(entry.devId)
+        entry.siteId = site_id
+        self._by_site.setdefault(site_id, set()).add(entry.devId)
+
+    def add_devices(self, devices: Iterable[Union[Device, SitesDevices]], site_id: Optional[str] = None):
+        """
+        Add devices, optionally of a known site.
+
+        Args:
+            devices (Iterable[Union[Device, SitesDevices]]): The devices, or the devices grouped by site
+                as returned per site by the organization device list.
+            site_id (Optional[str]): The site of the devices, unless given by `SitesDevices`.
+        """
+        for device in devices:
+            if isinstance(device, SitesDevices):
+                self.add_devices([item for item in device.devices if item is not None], device.siteId)
+                continue
+
+            entry = self._entry(device.devId)
+            previous = entry.device
+            if previous is not None:
+                if self._by_mac.get(normalize_mac(previous.mac)) is entry:
+                    del self._by_mac[normalize_mac(previous.mac)]
+                if self._by_serial.get(previous.sn) is entry:
+                    del self._by_serial[previous.sn]
+            entry.device = device
+            self._by_mac[normalize_mac(device.mac)] = entry
+            self._by_serial[device.sn] = entry
+            self._set_site(entry, site_id)
+
+    def add_firmware(self, statuses: Iterable[DeviceFirmwareStatus]):
+        """Join firmware statuses into the entries of their devices."""
+        for status in statuses:
+            self._entry(status.devId).firmware = status
+
+    def add_online(self, statuses: Union[SiteOnlineStatus, Iterable[DeviceOnlineStatus]], site_id: Optional[str] = None):
+        """
+        Join online statuses into the entries of their devices.
+
+        Args:
+            statuses (Union[SiteOnlineStatus, Iterable[DeviceOnlineStatus]]): The merged status of a site
+                or the statuses of one device type.
+            site_id (Optional[str]): The site of the devices, unless given by `SiteOnlineStatus`.
+        """
+        if isinstance(statuses, SiteOnlineStatus):
+            site_id = statuses.siteId
+            statuses = statuses.devices.values()
+        for status in statuses:
+            entry = self._entry(status.devId)
+            entry.online = status.currentStatus
+            self._set_site(entry, site_id)
+
+    def by_id(self, dev_id: str) -> Optional[InventoryEntry]:
+        """Return the entry of a device ID, or `None` if it is unknown."""
+        return self._entries.get(dev_id)
+
+    def by_mac(self, mac: str) -> Optional[InventoryEntry]:
+        """Return the entry of a MAC address in any common notation, or `None` if it is unknown."""
+        return self._by_mac.get(normalize_mac(mac))
+
+    def by_serial(self, sn: str) -> Optional[InventoryEntry]:
+        """Return the entry of a serial number, or `None` if it is unknown."""
+        return self._by_serial.get(sn)
+
+    def by_site(self, site_id: str) -> List[InventoryEntry]:
+        """Return the entries of the devices known to belong to a site."""
+        return [self._entries[dev_id] for dev_id in self._by_site.get(site_id, ())]
+
+    @classmethod
+    async def from_organization(cls, client: "ZyxelNebulaClient", org_id: str, online: bool = False) -> "InventoryIndex":
+        """
+        Build the index of an organization from the devices of its sites and their firmware status.
+
+        Args:
+            client (ZyxelNebulaClient): The client fetching the responses.
+            org_id (str): The unique identifier for the organization.
+            online (bool): Also fetch the online status of every site, at the cost of one request per site
+                and device type.
+
+        Returns:
+            InventoryIndex: The index of the organization.
+        """
+        index = cls()
+        index.add_devices(await client.get_sites_devices_from_organization(org_id))
+        index.add_firmware(await client.get_device_firmware_status_from_organization(org_id))
+        if online:
+            sites = await client.get_sites(org_id)
+            async for status in client.iter_sites_online_status([site.siteId for site in sites], return_exceptions=True):
+                index.add_online(status)
+        return index
@@ -0,0 +1,38 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """
+    A pair of functions used by `ZyxelNebulaClient` to parse response bodies and serialize payloads.
+
+    `loads` receives the raw response body as bytes; `dumps` must return UTF-8 encoded bytes.
+
+    Example:
+        client = ZyxelNebulaClient(api_key="...", json_backend=STDLIB_JSON)
+    """
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+STDLIB_JSON = JSONBackend(
+    name="json",
+    loads=json.loads,
+    dumps=lambda value: json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8"),
+)
+
+ORJSON = JSONBackend(name="orjson", loads=orjson.loads,
+                     dumps=orjson.dumps) if orjson is not None else None
+
+
+def default_json_backend() -> JSONBackend:
+    """Return the fastest available backend: `orjson` when installed, the stdlib `json` module otherwise."""
+    return ORJSON or STDLIB_JSON
@@ -0,0 +1,188 @@
+import bisect
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:  # pragma: no cover - optional dependency
+    otel_metrics = None
+
+# Upper bounds of the histogram buckets per metric, the last bucket is unbounded
+SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+ITEMS_BUCKETS = (0, 1, 10, 100, 1000, 10000, 100000)
+
+HISTOGRAMS = {
+    "request_seconds": SECONDS_BUCKETS,
+    "response_bytes": BYTES_BUCKETS,
+    "parse_seconds": SECONDS_BUCKETS,
+    "decode_seconds": SECONDS_BUCKETS,
+    "items": ITEMS_BUCKETS,
+}
+
+_DESCRIPTIONS = {
+    "request_seconds": "Time from sending a request until the response body has been received.",
+    "response_bytes": "Size of the response bodies.",
+    "parse_seconds": "Time spent parsing response bodies as JSON.",
+    "decode_seconds": "Time spent decoding JSON into models.",
+    "items": "Number of items per decoded response.",
+    "errors": "Failed requests by error class.",
+}
+
+
+@dataclass(frozen=True)
+class Observation:
+    """
+    A single measurement recorded by `ZyxelNebulaClient`, passed to every exporter of `Metrics`.
+
+    `name` is one of the keys of `HISTOGRAMS` or `"errors"`, for which `value` is 1 and `error` holds
+    the class name of the exception.
+    """
+    name: str
+    endpoint: str
+    value: float
+    error: Optional[str] = None
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram with fixed bucket upper bounds."""
+    buckets: Sequence[float]
+    counts: List[int] = field(init=False)
+    count: int = 0
+    sum: float = 0.0
+
+    def __post_init__(self):
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+
+class Metrics:
+    """
+    Per-endpoint request metrics of `ZyxelNebulaClient`.
+
+    For every `ENDPOINTS` key the client records the request latency, the response size, the time
+    spent parsing JSON and decoding models, the number of decoded items and failed requests by error
+    class. Together they tell whether a slow call is spent on the network, the server or decoding.
+
+    Measurements are aggregated into histograms and counters, which can be rendered in the Prometheus
+    text format, and passed on to `exporters`: callables receiving each `Observation`, e.g. a
+    logging callback or `OpenTelemetryExporter`.
+
+    Args:
+        exporters (Iterable[Callable[[Observation], None]]): Called with every observation.
+
+    Example:
+        metrics = Metrics()
+        client = ZyxelNebulaClient(api_key="...", metrics=metrics)
+        ...
+        print(metrics.histogram("request_seconds", "GET_SITES").mean)
+        print(metrics.prometheus())
+    """
+
+    def __init__(self, exporters: Iterable[Callable[[Observation], None]] = ()):
+        self.exporters = list(exporters)
+        self.histograms: Dict[Tuple[str, str], Histogram] = {}
+        self.errors: Counter = Counter()
+
+    def observe(self, name: str, endpoint: str, value: float, error: Optional[str] = None):
+        """Record a measurement of metric `name` for an `ENDPOINTS` key."""
+        if name == "errors":
+            self.errors[endpoint, error] += 1
+        else:
+            key = (name, endpoint)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(HISTOGRAMS[name])
+            histogram.observe(value)
+
+        if self.exporters:
+            observation = Observation(name, endpoint, value, error)
+            for exporter in self.exporters:
+                exporter(observation)
+
+    def error(self, endpoint: str, error: BaseException):
+        """Record a failed request."""
+        self.observe("errors", endpoint, 1, type(error).__name__)
+
+    def histogram(self, name: str, endpoint: str) -> Histogram:
+        """Return the histogram of metric `name` for an `ENDPOINTS` key, empty if nothing was recorded."""
+        return self.histograms.get((name, endpoint)) or Histogram(HISTOGRAMS[name])
+
+    def reset(self):
+        """Drop all recorded measurements."""
+        self.histograms.clear()
+        self.errors.clear()
+
+    def prometheus(self, prefix: str = "zyxel_nebula") -> str:
+        """Return the recorded metrics in the Prometheus text exposition format."""
+        lines = []
+        for name, buckets in HISTOGRAMS.items():
+            series = sorted((endpoint, histogram) for (metric, endpoint), histogram
+                            in self.histograms.items() if metric == name)
+            if not series:
+                continue
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {_DESCRIPTIONS[name]}")
+            lines.append(f"# TYPE {metric} histogram")
+            for endpoint, histogram in series:
+                cumulative = 0
+                for bound, count in zip([*buckets, "+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{endpoint="{endpoint}",le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_sum{{endpoint="{endpoint}"}} {histogram.sum}')
+                lines.append(f'{metric}_count{{endpoint="{endpoint}"}} {histogram.count}')
+
+        if self.errors:
+            metric = f"{prefix}_errors_total"
+            lines.append(f"# HELP {metric} {_DESCRIPTIONS['errors']}")
+            lines.append(f"# TYPE {metric} counter")
+            for (endpoint, error), count in sorted(self.errors.items()):
+                lines.append(f'{metric}{{endpoint="{endpoint}",error="{error}"}} {count}')
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+class OpenTelemetryExporter:
+    """
+    Forwards observations to OpenTelemetry histograms and counters, with the endpoint and error class
+    as attributes. Requires the `opentelemetry-api` package.
+
+    Args:
+        meter: The meter creating the instruments. Defaults to the global meter of this package.
+        prefix (str): Prefix of the instrument names.
+
+    Example:
+        metrics = Metrics(exporters=[OpenTelemetryExporter()])
+    """
+
+    def __init__(self, meter=None, prefix: str = "zyxel_nebula"):
+        if meter is None:
+            if otel_metrics is None:
+                raise ImportError("OpenTelemetryExporter requires the opentelemetry-api package")
+            meter = otel_metrics.get_meter("zyxel_nebula_client")
+
+        units = {"request_seconds": "s", "response_bytes": "By", "parse_seconds": "s",
+                 "decode_seconds": "s", "items": "1"}
+        self.instruments = {
+            name: meter.create_histogram(f"{prefix}.{name}", unit=unit, description=_DESCRIPTIONS[name])
+            for name, unit in units.items()}
+        self.instruments["errors"] = meter.create_counter(
+            f"{prefix}.errors", description=_DESCRIPTIONS["errors"])
+
+    def __call__(self, observation: Observation):
+        attributes = {"endpoint": observation.endpoint}
+        if observation.name == "errors":
+            attributes["error"] = observation.error
+            self.instruments["errors"].add(1, attributes)
+        else:
+            self.instruments[observation.name].record(observation.value, attributes)
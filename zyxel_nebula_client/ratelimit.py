@@ -0,0 +1,88 @@
+import asyncio
+import math
+import time
+from fnmatch import fnmatchcase
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    An asynchronous token bucket allowing `rate` acquisitions per second with bursts of up to `burst`.
+
+    Waiters are served in FIFO order, so a bucket can be shared by any number of coroutines.
+
+    Example:
+        bucket = TokenBucket(rate=5, burst=10)
+        await bucket.acquire()
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """The number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens +
+                           (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Take one token, waiting until one becomes available."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter applied to every request sent by `ZyxelNebulaClient`.
+
+    Every request takes a token from the shared bucket. Requests whose URL path matches one of the
+    `families` patterns (shell-style, see `fnmatch`) additionally take a token from that family's
+    bucket, which allows tighter budgets for expensive endpoints. The first matching pattern wins.
+
+    Args:
+        rate (float): The overall number of requests per second.
+        burst (int): The number of requests that may be sent at once. Defaults to `rate`, rounded up.
+        families (Dict[str, TokenBucket]): Optional buckets keyed by URL path pattern.
+
+    Example:
+        limiter = RateLimiter(rate=10, burst=20, families={
+            "/v1/nebula/*/livetool/*": TokenBucket(rate=1, burst=2),
+        })
+        client = ZyxelNebulaClient(api_key="...", rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None, families: Optional[Dict[str, TokenBucket]] = None):
+        self.bucket = TokenBucket(rate, burst or math.ceil(rate))
+        self.families = dict(families or {})
+
+    def family(self, path: str) -> Optional[TokenBucket]:
+        """Return the family bucket for a URL path, if any."""
+        for pattern, bucket in self.families.items():
+            if fnmatchcase(path, pattern):
+                return bucket
+        return None
+
+    async def acquire(self, path: str):
+        """Wait until a request to `path` may be sent."""
+        bucket = self.family(path)
+        if bucket is not None:
+            await bucket.acquire()
+        await self.bucket.acquire()
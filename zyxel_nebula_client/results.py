@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional
+
+from .models import CableTestPortResult, DeviceType, OnlineOffline, PingResult, Site
+
+
+@dataclass
+class SiteResult:
+    """
+    The outcome of a per-site request issued by a crawl over organizations or groups.
+
+    `site` is `None` for an organization whose sites could not be retrieved, with `error` set.
+    """
+    orgId: str
+    site: Optional[Site]
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class ClientDelta:
+    """The clients of a site that joined, left or changed since the previous snapshot."""
+    siteId: str
+    added: List[Any] = field(default_factory=list)
+    removed: List[Hashable] = field(default_factory=list)
+    changed: List[Any] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass
+class DevicePingResult:
+    """A ping result of one device, yielded by `ZyxelNebulaClient.ping_devices` as soon as it arrives."""
+    siteId: str
+    devId: str
+    target: str
+    result: Optional[PingResult] = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class DeviceCableTestResult:
+    """
+    A port result of one switch, yielded by `ZyxelNebulaClient.cable_test_site` as soon as it arrives.
+
+    `ports` are the ports tested together in the same request, `started` is its start time in seconds
+    since the epoch and `elapsed` its duration in seconds. A failed request is reported once with
+    `error` set and no `result`, a switch not tested because it is not online once as `skipped`.
+    """
+    siteId: str
+    devId: str
+    ports: List[int]
+    started: float
+    elapsed: float
+    result: Optional[CableTestPortResult] = None
+    error: Optional[BaseException] = None
+    skipped: bool = False
+
+
+@dataclass
+class DeviceRebootResult:
+    """
+    The outcome of rebooting one device in a `RebootRollout`.
+
+    `rebootedAt` is the time the reboot was requested in seconds since the epoch, `requestSeconds` the
+    duration of the request and `onlineSeconds` the time from the request until the device was back
+    online. A device is `skipped` when the rollout halted before its wave.
+    """
+    siteId: str
+    devId: str
+    wave: int
+    rebootedAt: Optional[float] = None
+    requestSeconds: Optional[float] = None
+    onlineSeconds: Optional[float] = None
+    error: Optional[BaseException] = None
+    skipped: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.onlineSeconds is not None and self.error is None
+
+
+@dataclass
+class DeviceOnlineState:
+    """The online status of one device and when it was fetched, in seconds since the epoch."""
+    devId: str
+    type: DeviceType
+    currentStatus: OnlineOffline
+    fetchedAt: float
+
+
+@dataclass
+class SiteOnlineStatus:
+    """
+    The online status of the devices of every type in a site, merged from one request per type.
+
+    `fetchedAt` holds the fetch time of each device type that was requested successfully and `errors`
+    the error of each one that failed.
+    """
+    siteId: str
+    devices: Dict[str, DeviceOnlineState] = field(default_factory=dict)
+    fetchedAt: Dict[DeviceType, float] = field(default_factory=dict)
+    errors: Dict[DeviceType, BaseException] = field(default_factory=dict)
+
+    @property
+    def statuses(self) -> Dict[str, OnlineOffline]:
+        """The online status per device ID."""
+        return {devId: state.currentStatus for devId, state in self.devices.items()}
@@ -0,0 +1,87 @@
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+import httpx
+
+from .consts import IDEMPOTENT_ENDPOINTS
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for transient failures, used by `ZyxelNebulaClient(retry_policy=...)`.
+
+    Requests failing with a connection error or one of `retry_statuses` are retried up to
+    `max_attempts` times in total. The delay grows exponentially from `backoff` up to `max_backoff`,
+    a random share of up to `jitter` of it is removed to spread out clients retrying in lockstep, and a
+    `Retry-After` header sent by the server takes precedence (still capped at `max_backoff`).
+
+    Only idempotent requests are retried unless `idempotent_only` is `False`: every GET and the
+    read-only POST endpoints listed in `IDEMPOTENT_ENDPOINTS`. Live tool actions such as `reboot`
+    are never retried by default.
+
+    Example:
+        client = ZyxelNebulaClient(api_key="...", retry_policy=RetryPolicy(max_attempts=5))
+    """
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 1.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    idempotent_only: bool = True
+
+    def applies_to(self, method: str, endpoint: str) -> bool:
+        """Return whether requests to an `ENDPOINTS` key may be retried under this policy."""
+        return not self.idempotent_only or is_idempotent(method, endpoint)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Return whether a request that failed with `error` on attempt number `attempt` is retried."""
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(error, httpx.TransportError):
+            return True
+        response = error_response(error)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def delay(self, error: Exception, attempt: int) -> float:
+        """Return the number of seconds to wait before the retry following attempt number `attempt`."""
+        if self.respect_retry_after:
+            retry_after = parse_retry_after(error_response(error))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay - delay * self.jitter * random.random()
+
+
+def is_idempotent(method: str, endpoint: str) -> bool:
+    """Return whether a request to an `ENDPOINTS` key can be repeated without side effects."""
+    return method == "GET" or endpoint in IDEMPOTENT_ENDPOINTS
+
+
+def error_response(error: BaseException) -> Optional[httpx.Response]:
+    """Return the HTTP response behind an error raised by the client, if there is one."""
+    while error is not None:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response
+        error = error.__cause__
+    return None
+
+
+def parse_retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    """Return the delay requested by a `Retry-After` header in seconds, if present and valid."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,156 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from .client import ZyxelNebulaError
+from .concurrency import AdaptiveLimiter, bounded_as_completed
+from .models import DeviceType, OnlineOffline
+from .results import DeviceRebootResult
+
+if TYPE_CHECKING:
+    from .client import ZyxelNebulaClient
+
+# Number of devices rebooted per wave
+DEFAULT_REBOOT_WAVE_SIZE = 10
+
+# Seconds after a reboot request before a device reported online counts as back, unless it was seen offline
+DEFAULT_REBOOT_SETTLE = 30.0
+
+# Seconds between polls of the online status while a wave comes back
+DEFAULT_REBOOT_INTERVAL = 10.0
+
+# Seconds a rebooted device may take to come back online
+DEFAULT_REBOOT_TIMEOUT = 600.0
+
+
+class RebootRollout:
+    """
+    Reboots many devices of a site in waves, advancing only once a wave is back online.
+
+    Each wave of `wave_size` devices is rebooted with at most `concurrency` requests in flight. The
+    online status of the device type is then polled every `interval` seconds: a device is back once it
+    is reported online after having been seen offline, or after `settle` seconds in case its downtime
+    fell between two polls. Devices not back within `timeout` seconds fail. When a wave has failures
+    and `halt_on_failure` is set, the remaining devices are not rebooted.
+
+    Reboot requests are sent at most once, even if the client has a `RetryPolicy`: a reboot whose
+    response was lost may well have been carried out, so a failed request is reported, never repeated.
+    Each request holds the `device_lock` of its device, so it waits for other operations on the device.
+
+    Args:
+        client (ZyxelNebulaClient): The client sending the requests.
+        site_id (str): The unique identifier for the site.
+        device_ids (Iterable[str]): The devices to reboot, in rollout order.
+        device_type (DeviceType): The type of the devices, whose online status is polled. Defaults to
+            `DeviceType.AP`.
+        wave_size (int): The number of devices per wave. Defaults to `DEFAULT_REBOOT_WAVE_SIZE`.
+        concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of reboot requests in
+            flight. Defaults to the client's `adaptive_concurrency` if set and `DEFAULT_CONCURRENCY`
+            otherwise.
+        settle (float): Seconds before a device reported online counts as back without having been seen
+            offline. Defaults to `DEFAULT_REBOOT_SETTLE`.
+        interval (float): Seconds between polls of the online status. Defaults to `DEFAULT_REBOOT_INTERVAL`.
+        timeout (float): Seconds a device may take to come back. Defaults to `DEFAULT_REBOOT_TIMEOUT`.
+        halt_on_failure (bool): Skip the remaining waves once a device failed. Defaults to `True`.
+        clock (Callable[[], float]): Returns a monotonic time in seconds. Defaults to `time.monotonic`.
+
+    Example:
+        rollout = RebootRollout(client, "site123", ap_ids, wave_size=20, concurrency=5)
+        async for result in rollout.run():
+            print(result.devId, result.wave, result.error or f"back after {result.onlineSeconds:.0f}s")
+    """
+
+    def __init__(self, client: "ZyxelNebulaClient", site_id: str, device_ids: Iterable[str], device_type: DeviceType = DeviceType.AP,
+                 wave_size: int = DEFAULT_REBOOT_WAVE_SIZE, concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                 settle: float = DEFAULT_REBOOT_SETTLE, interval: float = DEFAULT_REBOOT_INTERVAL,
+                 timeout: float = DEFAULT_REBOOT_TIMEOUT, halt_on_failure: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        if wave_size < 1:
+            raise ValueError("wave_size must be at least 1")
+        self.client = client
+        self.site_id = site_id
+        self.device_ids = list(device_ids)
+        self.device_type = device_type
+        self.wave_size = wave_size
+        self.concurrency = concurrency
+        self.settle = settle
+        self.interval = interval
+        self.timeout = timeout
+        self.halt_on_failure = halt_on_failure
+        self.clock = clock
+
+    @property
+    def waves(self) -> List[List[str]]:
+        """The device IDs of each wave, in rollout order."""
+        return [self.device_ids[i:i + self.wave_size] for i in range(0, len(self.device_ids), self.wave_size)]
+
+    async def run(self) -> AsyncIterator[DeviceRebootResult]:
+        """
+        Carry out the rollout and yield the result of every device as soon as it is known.
+
+        Yields:
+            DeviceRebootResult: The outcome of each device: back online, failed with `error` set, or
+            `skipped` after an earlier wave failed.
+        """
+        waves = self.waves
+        for number, wave in enumerate(waves):
+            failed = False
+            async for result in self._run_wave(number, wave):
+                failed = failed or result.error is not None
+                yield result
+
+            if failed and self.halt_on_failure:
+                for skipped_number, skipped in enumerate(waves[number + 1:], number + 1):
+                    for device_id in skipped:
+                        yield DeviceRebootResult(siteId=self.site_id, devId=device_id, wave=skipped_number, skipped=True)
+                return
+
+    async def _run_wave(self, number: int, wave: List[str]) -> AsyncIterator[DeviceRebootResult]:
+        results = {device_id: DeviceRebootResult(siteId=self.site_id, devId=device_id, wave=number) for device_id in wave}
+        rebooted: Dict[str, float] = {}
+
+        async def reboot(device_id: str):
+            result = results[device_id]
+            async with self.client.device_lock(self.site_id, device_id):
+                result.rebootedAt = time.time()
+                start = self.clock()
+                try:
+                    await self.client.reboot(self.site_id, device_id)
+                finally:
+                    result.requestSeconds = self.clock() - start
+            rebooted[device_id] = start
+
+        async for device_id, task in bounded_as_completed(reboot, wave, self.client.resolve_concurrency(self.concurrency)):
+            if task.exception() is not None:
+                results[device_id].error = task.exception()
+                yield results[device_id]
+
+        seen_offline = set()
+        while rebooted:
+            await asyncio.sleep(self.interval)
+            try:
+                statuses = await self.client.get_devices_device_online_by_type(self.site_id, self.device_type)
+            except (ZyxelNebulaError, httpx.TransportError):
+                # a failed poll is no evidence either way, the timeout still applies
+                statuses = []
+
+            now = self.clock()
+            for status in statuses:
+                start = rebooted.get(status.devId)
+                if start is None:
+                    continue
+                if status.currentStatus != OnlineOffline.ONLINE:
+                    seen_offline.add(status.devId)
+                elif status.devId in seen_offline or now - start >= self.settle:
+                    del rebooted[status.devId]
+                    results[status.devId].onlineSeconds = now - start
+                    yield results[status.devId]
+
+            for device_id, start in list(rebooted.items()):
+                if now - start >= self.timeout:
+                    del rebooted[device_id]
+                    results[device_id].error = TimeoutError(
+                        f"Device {device_id} not back online within {self.timeout} seconds")
+                    yield results[device_id]
@@ -0,0 +1,108 @@
+import json
+import sqlite3
+import time
+from typing import Any, Mapping, Optional, Tuple
+
+from .cache import DEFAULT_CACHE_TTLS
+
+# Seconds a snapshot may be served after its time to live while it is refreshed in the background
+DEFAULT_MAX_STALE = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT,
+    fetched_at REAL NOT NULL,
+    data TEXT NOT NULL
+)
+"""
+
+
+class SnapshotStore:
+    """
+    Persistent SQLite store for API responses that survive process restarts.
+
+    Used by `ZyxelNebulaClient(store=...)` as a stale-while-revalidate tier behind `ResponseCache`:
+    responses of the endpoints in `ttls` are written with their fetch time, and after a restart they
+    are served straight from disk. While a snapshot is younger than its time to live it is served as
+    is; for up to `max_stale` seconds longer it is still served immediately, but the client refreshes it
+    in the background. Older snapshots are fetched again before returning.
+
+    Entries are JSON documents under string keys, so the store can also hold other small state such as
+    checkpoints. Access is synchronous; the store is meant for inventory data, not large client lists.
+
+    Args:
+        path (str): The SQLite database file. `":memory:"` keeps the store in memory.
+        ttls (Mapping[str, float]): Time to live in seconds per `ENDPOINTS` key. Defaults to
+            `DEFAULT_CACHE_TTLS`.
+        max_stale (float): Seconds a snapshot may be served past its time to live. Defaults to
+            `DEFAULT_MAX_STALE`.
+
+    Example:
+        client = ZyxelNebulaClient(api_key="...", store=SnapshotStore("nebula.sqlite3"))
+        sites = await client.get_sites(org_id)  # instant after a restart, refreshed in the background
+    """
+
+    def __init__(self, path: str, ttls: Optional[Mapping[str, float]] = None, max_stale: float = DEFAULT_MAX_STALE):
+        self.path = path
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.max_stale = max_stale
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def key(self, endpoint: str, url: str, params: Optional[Mapping[str, Any]] = None, payload: Any = None) -> Optional[str]:
+        """Return the store key for a request, or `None` if the endpoint is not stored."""
+        if endpoint not in self.ttls:
+            return None
+        return json.dumps([endpoint, url, sorted((params or {}).items()), payload], sort_keys=True)
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Return `(fetched_at, data)` for a key, or `None` if nothing is stored."""
+        row = self._connection.execute(
+            "SELECT fetched_at, data FROM snapshots WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def set(self, key: str, data: Any, endpoint: Optional[str] = None, fetched_at: Optional[float] = None):
+        """Store `data` under `key`, fetched at `fetched_at` (seconds since the epoch, defaults to now)."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO snapshots (key, endpoint, fetched_at, data) VALUES (?, ?, ?, ?)",
+            (key, endpoint, time.time() if fetched_at is None else fetched_at, json.dumps(data)))
+        self._connection.commit()
+
+    def freshness(self, endpoint: str, fetched_at: float) -> Optional[bool]:
+        """Return `True` for a fresh snapshot, `False` for a stale one that may still be served and `None` otherwise."""
+        age = time.time() - fetched_at
+        ttl = self.ttls.get(endpoint, 0)
+        if age < ttl:
+            return True
+        if age < ttl + self.max_stale:
+            return False
+        return None
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """
+        Drop stored responses of an `ENDPOINTS` key, or of every endpoint when `endpoint` is `None`.
+
+        Entries stored without an endpoint, such as the checkpoints of `EventLogTailer`, are state rather
+        than responses and are kept.
+        """
+        if endpoint is None:
+            self._connection.execute("DELETE FROM snapshots WHERE endpoint IS NOT NULL")
+        else:
+            self._connection.execute("DELETE FROM snapshots WHERE endpoint = ?", (endpoint,))
+        self._connection.commit()
@@ -0,0 +1,188 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Optional
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+_DECODER = json.JSONDecoder()
+
+# Consumed text is only dropped from the buffer once it exceeds this many characters
+_COMPACT_THRESHOLD = 1 << 16
+
+
+class _Scan:
+    """
+    Finds the end of a string, array or object spanning several chunks, looking at each character once.
+
+    Decoding such a value again after every chunk would take time quadratic in its size, so it is only
+    decoded again once its closing character has arrived.
+    """
+
+    def __init__(self):
+        # relative to the start of the value, which stays valid when the buffer is compacted
+        self.offset = 0
+        self.depth = 0
+        self.in_string = False
+        self.complete = False
+
+    def advance(self, text: str, start: int) -> bool:
+        """Scan the text appended since the last call and return whether the value may be complete."""
+        if self.complete or text[start] not in '"[{':
+            # numbers and literals are short, they are simply decoded again
+            return True
+
+        i = start + self.offset
+        while True:
+            match = (_STRING_END if self.in_string else _STRUCTURE).search(text, i)
+            if match is None:
+                self.offset = len(text) - start
+                return False
+            i = match.end()
+            character = match.group()
+            if character == "\\":
+                if i == len(text):
+                    # the escaped character is still to come
+                    self.offset = i - 1 - start
+                    return False
+                i += 1
+                continue
+            if character == '"':
+                self.in_string = not self.in_string
+            elif character in "[{":
+                self.depth += 1
+            else:
+                self.depth -= 1
+            if not self.in_string and self.depth == 0:
+                self.complete = True
+                return True
+
+
+class _Buffer:
+    """Text decoded so far from a stream of UTF-8 chunks and the current parse position."""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self.chunks = chunks.__aiter__()
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    async def fill(self) -> bool:
+        """Append the next chunk, returning `False` once the stream is exhausted."""
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_THRESHOLD:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        try:
+            chunk = await self.chunks.__anext__()
+        except StopAsyncIteration:
+            self.eof = True
+            self.text += self.decoder.decode(b"", final=True)
+            return False
+        self.text += self.decoder.decode(chunk)
+        return True
+
+    async def peek(self) -> str:
+        """Skip whitespace and return the next character, or an empty string at the end."""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text) or not await self.fill():
+                return self.text[self.pos:self.pos + 1]
+
+    async def expect(self, characters: str) -> str:
+        character = await self.peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self.text, self.pos)
+        self.pos += 1
+        return character
+
+    async def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        await self.peek()
+        scan = None
+        while True:
+            if scan is None or self.eof or scan.advance(self.text, self.pos):
+                try:
+                    value, end = _DECODER.raw_decode(self.text, self.pos)
+                    # a value at the very end of the buffer may be a truncated number or literal
+                    if end < len(self.text) or self.eof:
+                        self.pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if self.eof:
+                        raise
+            scan = scan or _Scan()
+            await self.fill()
+
+    async def drain(self):
+        async for _ in self.chunks:
+            pass
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], key: Optional[str] = None) -> AsyncIterator[Any]:
+    """
+    Incrementally parse a streamed JSON document and yield the items of one array as they arrive.
+
+    Only the item being parsed and the current chunk are held in memory, so the peak memory does not
+    depend on the size of the document.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The raw UTF-8 body, e.g. `response.aiter_bytes()`.
+        key (Optional[str]): The member of the top-level object holding the array. When `None`, the
+            document itself must be an array. A missing or `null` member yields no items.
+
+    Yields:
+        Any: Each decoded array item.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON or has an unexpected structure.
+
+    Example:
+        async with client.stream("POST", url, json=payload) as response:
+            async for item in iter_json_array(response.aiter_bytes(), key="data"):
+                print(item["macAddress"])
+    """
+    buffer = _Buffer(chunks)
+
+    if key is not None and not await _seek_member(buffer, key):
+        await buffer.drain()
+        return
+
+    if await buffer.peek() == "n":
+        if await buffer.value() is not None:
+            raise json.JSONDecodeError("Expecting array", buffer.text, buffer.pos)
+        await buffer.drain()
+        return
+
+    await buffer.expect("[")
+    if await buffer.peek() == "]":
+        buffer.pos += 1
+    else:
+        while True:
+            yield await buffer.value()
+            if await buffer.expect(",]") == "]":
+                break
+
+    await buffer.drain()
+
+
+async def _seek_member(buffer: _Buffer, key: str) -> bool:
+    """Advance to the value of member `key` of the top-level object, skipping the others."""
+    await buffer.expect("{")
+    if await buffer.peek() == "}":
+        return False
+
+    while True:
+        if await buffer.peek() != '"':
+            raise json.JSONDecodeError("Expecting property name", buffer.text, buffer.pos)
+        name = await buffer.value()
+        await buffer.expect(":")
+        if name == key:
+            return True
+        await buffer.value()
+        if await buffer.expect(",}") == "}":
+            return False
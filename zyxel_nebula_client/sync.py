@@ -0,0 +1,114 @@
+import hashlib
+from dataclasses import fields
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+from .results import ClientDelta
+
+# Fields that change on every poll without the client itself changing: the last seen time and the
+# traffic counters of `APClientV2`
+DEFAULT_IGNORE_FIELDS = frozenset({"lastSeen", "upload", "download"})
+
+
+class ClientInventorySync:
+    """
+    Keeps the last snapshot of the clients of every site and reports only what changed.
+
+    Clients are keyed by the `KeyFields` of the v2 client list responses (the MAC address for most
+    of them). Instead of the client objects, only a 64-bit hash of each client is kept per key, so a
+    snapshot of thousands of clients takes little memory and comparing two polls is one dictionary
+    lookup per client. Fields in `ignore_fields` are left out of the hash, so a client whose
+    `lastSeen` merely moved forward or whose traffic counters grew is not reported as changed.
+
+    The first snapshot of a site reports every client as added.
+
+    Args:
+        ignore_fields (Iterable[str]): Client fields that do not count as a change. Defaults to
+            `DEFAULT_IGNORE_FIELDS`.
+
+    Example:
+        sync = ClientInventorySync()
+        while True:
+            delta = await sync.poll(client.get_site_clients_v2, "site123")
+            for mac in delta.removed:
+                print("left", mac)
+            await asyncio.sleep(60)
+    """
+
+    def __init__(self, ignore_fields: Iterable[str] = DEFAULT_IGNORE_FIELDS):
+        self.ignore_fields = frozenset(ignore_fields)
+        self._snapshots: Dict[str, Dict[Hashable, int]] = {}
+        self._fields: Dict[type, Tuple[str, ...]] = {}
+
+    def __contains__(self, site_id: str) -> bool:
+        return site_id in self._snapshots
+
+    def snapshot(self, site_id: str) -> Dict[Hashable, int]:
+        """Return the client hashes of the last snapshot of a site by key."""
+        return dict(self._snapshots.get(site_id, {}))
+
+    def forget(self, site_id: Optional[str] = None):
+        """Drop the snapshot of a site, or of every site when `site_id` is `None`."""
+        if site_id is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(site_id, None)
+
+    def update(self, site_id: str, clients: Any) -> ClientDelta:
+        """
+        Compare a client list response with the last snapshot of the site and replace the snapshot.
+
+        Args:
+            site_id (str): The unique identifier for the site.
+            clients (Any): A v2 client list response such as `GenericClients` or `APClients`.
+
+        Returns:
+            ClientDelta: The added and changed clients and the keys of the removed ones.
+        """
+        key = _key_function([field.value for field in clients.KeyFields] or ["macAddress"])
+        previous = self._snapshots.get(site_id, {})
+        current: Dict[Hashable, int] = {}
+        delta = ClientDelta(siteId=site_id)
+
+        for item in clients.data or []:
+            item_key = key(item)
+            digest = self.hash(item)
+            current[item_key] = digest
+            before = previous.get(item_key)
+            if before is None:
+                delta.added.append(item)
+            elif before != digest:
+                delta.changed.append(item)
+
+        delta.removed = [item_key for item_key in previous if item_key not in current]
+        self._snapshots[site_id] = current
+        return delta
+
+    async def poll(self, fetch: Callable[[str], Awaitable[Any]], site_id: str) -> ClientDelta:
+        """
+        Fetch the clients of a site and return the changes since the last poll.
+
+        Args:
+            fetch (Callable[[str], Awaitable[Any]]): A coroutine function called with the site ID, e.g.
+                `client.get_site_clients_v2` or a `functools.partial` of it with other features.
+            site_id (str): The unique identifier for the site.
+
+        Returns:
+            ClientDelta: The changes since the previous poll of the site.
+        """
+        return self.update(site_id, await fetch(site_id))
+
+    def hash(self, item: Any) -> int:
+        """Return the 64-bit hash of a client over all fields except `ignore_fields`."""
+        names = self._fields.get(type(item))
+        if names is None:
+            names = self._fields[type(item)] = tuple(
+                field.name for field in fields(item) if field.name not in self.ignore_fields)
+        values = tuple(getattr(item, name) for name in names)
+        return int.from_bytes(hashlib.blake2b(repr(values).encode(), digest_size=8).digest(), "big")
+
+
+def _key_function(key_fields: Sequence[str]) -> Callable[[Any], Hashable]:
+    if len(key_fields) == 1:
+        (name,) = key_fields
+        return lambda item: getattr(item, name)
+    return lambda item: tuple(getattr(item, name) for name in key_fields)
@@ -0,0 +1,191 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .concurrency import AdaptiveLimiter, bounded_as_completed
+from .store import SnapshotStore
+
+if TYPE_CHECKING:
+    from .client import ZyxelNebulaClient
+
+logger = logging.getLogger(__name__)
+
+# Milliseconds before the checkpoint that are fetched again to pick up late entries
+DEFAULT_TAIL_OVERLAP = 60 * 1000
+
+# Milliseconds of history fetched for a source without checkpoint
+DEFAULT_TAIL_LOOKBACK = 3600 * 1000
+
+
+@dataclass(frozen=True)
+class EventLogSource:
+    """A switch (`device_id` set) or the gateway of a site whose event logs are tailed."""
+    site_id: str
+    device_id: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        kind = "gw" if self.device_id is None else f"sw:{self.device_id}"
+        return f"event-logs:{self.site_id}:{kind}"
+
+
+@dataclass
+class Checkpoint:
+    """
+    The progress of tailing a source.
+
+    `timestamp` is the end of the last polled range in milliseconds. `delivered` holds how many
+    identical entries of each fingerprint fetched by the last poll were delivered. The next poll
+    fetches the end of that range again and must not deliver them twice.
+    """
+    timestamp: int
+    delivered: Dict[str, int] = field(default_factory=dict)
+
+
+class EventLogTailer:
+    """
+    Continuously polls the newest event logs of switches and gateways and delivers every entry once.
+
+    Each poll fetches the logs of a source from shortly before its checkpoint up to now, skips the
+    entries delivered before by their fingerprint and advances the checkpoint to the end of the polled
+    range. Identical entries, e.g. two port flaps logged in the same millisecond, are counted so
+    each of them is delivered once. The range fetched again,
+    `overlap`, picks up entries that arrive late, while a normal cycle only downloads the last moments
+    instead of whole windows. Checkpoints are kept in a `SnapshotStore` when one is given, so tailing
+    resumes where it stopped after a restart.
+
+    Args:
+        client (ZyxelNebulaClient): The client fetching the logs.
+        sources (Iterable[EventLogSource]): The switches and gateways to tail.
+        store (Optional[SnapshotStore]): Persists the checkpoints. Defaults to keeping them in memory.
+        interval (float): Seconds between polling cycles. Defaults to 60.
+        overlap (int): Milliseconds before the checkpoint fetched again. Defaults to `DEFAULT_TAIL_OVERLAP`.
+        lookback (int): Milliseconds of history fetched for a source without checkpoint. Defaults to
+            `DEFAULT_TAIL_LOOKBACK`.
+        clock (Callable[[], float]): Returns the current time in seconds. Defaults to `time.time`.
+
+    Example:
+        tailer = EventLogTailer(client, [EventLogSource("site123"), EventLogSource("site123", "switch456")],
+                                store=SnapshotStore("nebula.sqlite3"), interval=30)
+        async for source, entry in tailer.tail():
+            await siem.send(source.site_id, entry)
+    """
+
+    def __init__(self, client: "ZyxelNebulaClient", sources: Iterable[EventLogSource] = (), store: Optional[SnapshotStore] = None,
+                 interval: float = 60.0, overlap: int = DEFAULT_TAIL_OVERLAP, lookback: int = DEFAULT_TAIL_LOOKBACK,
+                 clock: Callable[[], float] = time.time):
+        self.client = client
+        self.sources = list(sources)
+        self.store = store
+        self.interval = interval
+        self.overlap = overlap
+        self.lookback = lookback
+        self.clock = clock
+        self._checkpoints: Dict[EventLogSource, Checkpoint] = {}
+        self._pending: Dict[EventLogSource, Checkpoint] = {}
+
+    def checkpoint(self, source: EventLogSource) -> Optional[Checkpoint]:
+        """Return the committed checkpoint of a source, loading it from `store` on first use."""
+        checkpoint = self._checkpoints.get(source)
+        if checkpoint is None and self.store is not None:
+            stored = self.store.get(source.key)
+            if stored is not None:
+                checkpoint = self._checkpoints[source] = Checkpoint(
+                    timestamp=stored[1]["timestamp"], delivered=stored[1].get("delivered", {}))
+        return checkpoint
+
+    def commit(self, source: EventLogSource):
+        """Make the checkpoint of the last poll of a source permanent, once its entries were processed."""
+        checkpoint = self._pending.pop(source, None)
+        if checkpoint is None:
+            return
+        self._checkpoints[source] = checkpoint
+        if self.store is not None:
+            self.store.set(source.key, {"timestamp": checkpoint.timestamp, "delivered": checkpoint.delivered})
+
+    async def poll(self, source: EventLogSource, commit: bool = True) -> List[Any]:
+        """
+        Fetch the entries of a source that were not delivered before, oldest first.
+
+        Args:
+            source (EventLogSource): The switch or gateway to poll.
+            commit (bool): Advance the checkpoint right away. Pass `False` to call `commit` only once the
+                entries have been processed, so they are fetched again if processing fails.
+
+        Returns:
+            List[Any]: The new `SWEventLogEntry` or `GWEventLogEntry` instances.
+        """
+        now = int(self.clock() * 1000)
+        checkpoint = self.checkpoint(source) or Checkpoint(timestamp=now - self.lookback)
+        start = min(checkpoint.timestamp - self.overlap, now)
+
+        if source.device_id is None:
+            entries = self.client.iter_gw_event_logs(source.site_id, start, now)
+        else:
+            entries = self.client.iter_sw_event_logs(source.site_id, source.device_id, start, now)
+
+        counts: Dict[str, int] = {}
+        new = []
+        async for entry in entries:
+            fingerprint = _fingerprint(entry)
+            count = counts[fingerprint] = counts.get(fingerprint, 0) + 1
+            if count > checkpoint.delivered.get(fingerprint, 0):
+                new.append(entry)
+
+        # only entries fetched by this poll can be fetched again by the next one, which starts within
+        # this range, so this does not depend on the unit of the entry timestamps
+        delivered = {fingerprint: max(count, checkpoint.delivered.get(fingerprint, 0))
+                     for fingerprint, count in counts.items()}
+        self._pending[source] = Checkpoint(timestamp=now, delivered=delivered)
+        if commit:
+            self.commit(source)
+        return new
+
+    async def tail(self, concurrency: Optional[Union[int, AdaptiveLimiter]] = None,
+                   on_error: Optional[Callable[[EventLogSource, BaseException], None]] = None) -> AsyncIterator[Tuple[EventLogSource, Any]]:
+        """
+        Poll every source each `interval` seconds and yield new entries as they are found.
+
+        Sources are polled concurrently, up to `concurrency` at a time. The checkpoint of a source is
+        committed after its last entry of a cycle has been consumed, so entries are delivered at least
+        once even if the consumer stops in between.
+
+        A source whose poll fails keeps its checkpoint and is polled again in the next cycle, while the
+        other sources are tailed as usual. The error is passed to `on_error`, or logged as a warning
+        of the `zyxel_nebula_client.tail` logger without one.
+
+        Args:
+            concurrency (Optional[Union[int, AdaptiveLimiter]]): The maximum number of sources polled at 
+                the same time. Defaults to the client's `adaptive_concurrency` if set and 
+                `DEFAULT_CONCURRENCY` otherwise.
+            on_error (Optional[Callable[[EventLogSource, BaseException], None]]): Called with the source
+                and the error of each failed poll.
+
+        Yields:
+            Tuple[EventLogSource, Any]: The source and each of its new entries, oldest first per source.
+        """
+        async def poll(source: EventLogSource) -> List[Any]:
+            return await self.poll(source, commit=False)
+
+        concurrency = self.client.resolve_concurrency(concurrency)
+        while True:
+            async for source, task in bounded_as_completed(poll, self.sources, concurrency):
+                error = task.exception()
+                if error is not None:
+                    self._pending.pop(source, None)
+                    if on_error is not None:
+                        on_error(source, error)
+                    else:
+                        logger.warning("Polling event logs of %s failed, retrying next cycle", source.key, exc_info=error)
+                    continue
+                for entry in task.result():
+                    yield source, entry
+                self.commit(source)
+            await asyncio.sleep(self.interval)
+
+
+def _fingerprint(entry: Any) -> str:
+    return hashlib.blake2b(repr(entry).encode(), digest_size=8).hexdigest()